@@ -0,0 +1,78 @@
+"""
+Compare compressing and hashing a bulk body for SigV4 the way connections
+used to (GzipFile at level 9, then sha256 of the result) with gzip_compress
+at different levels and thread counts, which hashes while compressing.
+Parallel blocks only help with as many free cores as threads.
+
+    PYTHONPATH=opensearch-layer/python python benchmarks/bench_compress.py --mb 100
+"""
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import os
+import time
+
+from opensearchpy.connection.compression import gzip_compress
+
+
+def _body(size: int) -> bytes:
+    lines = []
+    total, i = 0, 0
+    while total < size:
+        action = json.dumps({"index": {"_index": "photos", "_id": f"photo-{i}.jpg"}})
+        doc = json.dumps(
+            {
+                "objectKey": f"photo-{i}.jpg",
+                "bucket": "photos",
+                "labels": ["Dog", "Park", "Tree"][: i % 3 + 1],
+                "etag": os.urandom(8).hex(),
+            }
+        )
+        lines.append(f"{action}\n{doc}\n".encode())
+        total += len(lines[-1])
+        i += 1
+    return b"".join(lines)
+
+
+def legacy(body: bytes) -> bytes:
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode="wb") as f:
+        f.write(body)
+    compressed = buf.getvalue()
+    hashlib.sha256(compressed).hexdigest()
+    return compressed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--mb", type=int, default=20)
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    body = _body(args.mb * 1024 * 1024)
+    cases = [("GzipFile + sha256", legacy)]
+    for level in (1, 6, 9):
+        cases.append((f"level {level}", lambda b, level=level: gzip_compress(b, level)))
+        if args.threads > 1:
+            cases.append(
+                (
+                    f"level {level}, {args.threads} threads",
+                    lambda b, level=level: gzip_compress(b, level, args.threads),
+                )
+            )
+
+    print(f"body: {len(body) / 1e6:.1f}MB")
+    for name, compress in cases:
+        start = time.perf_counter()
+        compressed = compress(body)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:<28} {elapsed * 1000:>8.0f}ms {len(compressed) / 1e6:>7.1f}MB"
+            f" {len(body) / elapsed / 1e6:>7.0f}MB/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
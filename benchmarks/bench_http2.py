@@ -0,0 +1,79 @@
+"""
+Compare Http2Connection with the default urllib3 connection pool under
+parallel_bulk against a live cluster. Needs the h2 package and a node that
+negotiates HTTP/2 over TLS; documents go to a scratch index that is deleted
+afterwards.
+
+    PYTHONPATH=opensearch-layer/python python benchmarks/bench_http2.py \
+        --host search-photos.example.com --port 443 --threads 16
+"""
+import argparse
+import time
+
+from opensearchpy import Http2Connection, OpenSearch, Urllib3HttpConnection
+from opensearchpy.helpers import parallel_bulk
+
+INDEX = "bench-http2"
+
+
+def _actions(n: int):
+    for i in range(n):
+        yield {
+            "_index": INDEX,
+            "_id": f"photo-{i}.jpg",
+            "_source": {
+                "objectKey": f"photo-{i}.jpg",
+                "bucket": "photosbucket",
+                "labels": ["Dog", "Park", "Tree", f"custom-{i % 50}"],
+            },
+        }
+
+
+def run(client: OpenSearch, docs: int, threads: int, chunk_size: int) -> float:
+    start = time.perf_counter()
+    for ok, item in parallel_bulk(
+        client,
+        _actions(docs),
+        thread_count=threads,
+        chunk_size=chunk_size,
+        raise_on_error=True,
+    ):
+        pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", required=True)
+    parser.add_argument("--port", type=int, default=443)
+    parser.add_argument("--docs", type=int, default=100_000)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'connection':<24} {'best':>8} {'docs/s':>10}")
+    for connection_class in (Urllib3HttpConnection, Http2Connection):
+        client = OpenSearch(
+            [{"host": args.host, "port": args.port}],
+            use_ssl=True,
+            connection_class=connection_class,
+            pool_maxsize=args.threads,
+        )
+        try:
+            client.indices.delete(index=INDEX, ignore=404)
+            # the first round also warms up connections and the index
+            best = min(
+                run(client, args.docs, args.threads, args.chunk_size)
+                for _ in range(args.rounds)
+            )
+        finally:
+            client.indices.delete(index=INDEX, ignore=404)
+            client.close()
+        print(
+            f"{connection_class.__name__:<24} {best:>7.2f}s {args.docs / best:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
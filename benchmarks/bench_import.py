@@ -0,0 +1,77 @@
+"""
+Measure the cold import time of `from opensearchpy import OpenSearch` and
+check that it leaves the DSL, the plugin clients, requests and the other
+lazily loaded modules alone. Exits with status 1 when one of them is
+imported, or when the best time exceeds --max-ms, so it can guard against
+import time regressions.
+
+    PYTHONPATH=opensearch-layer/python python benchmarks/bench_import.py
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# imported on first use only; see _LAZY in opensearchpy/__init__.py
+LAZY_MODULES = [
+    "requests",
+    "dateutil",
+    "h2",
+    "aiohttp",
+    "opensearchpy.helpers.field",
+    "opensearchpy.helpers.search",
+    "opensearchpy.helpers.signer",
+    "opensearchpy.client.cat",
+    "opensearchpy.client.indices",
+    "opensearchpy.plugins.ml",
+    "opensearchpy.connection.http_requests",
+    "opensearchpy.connection.http2",
+]
+
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+from opensearchpy import OpenSearch
+client = OpenSearch([{"host": "localhost", "port": 9200}])
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def measure() -> dict:
+    # a new interpreter each round, so nothing is imported yet
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        check=True,
+        capture_output=True,
+        env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1"),
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    results = [measure() for _ in range(args.rounds)]
+    best = min(result["elapsed"] for result in results) * 1000
+    modules = set(results[0]["modules"])
+    loaded = [name for name in LAZY_MODULES if name in modules]
+
+    print(f"import + OpenSearch(): best of {args.rounds} {best:.1f}ms")
+    print(f"modules imported: {len(modules)}")
+    failed = False
+    if loaded:
+        print(f"eagerly imported: {', '.join(loaded)}")
+        failed = True
+    if args.max_ms is not None and best > args.max_ms:
+        print(f"slower than {args.max_ms:.1f}ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Compare opensearchpy JSON serializer backends on bulk and search payloads.
+
+    PYTHONPATH=opensearch-layer/python python benchmarks/bench_serializer.py
+"""
+import datetime
+import timeit
+import uuid
+
+from opensearchpy.exceptions import ImproperlyConfigured
+from opensearchpy.serializer import JSON_BACKENDS, JSONSerializer
+
+ROUNDS = 20
+
+
+def _photo(i: int) -> dict:
+    return {
+        "objectKey": f"photo-{i}.jpg",
+        "bucket": "photosbucket",
+        "createdTimestamp": datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+        + datetime.timedelta(seconds=i),
+        "labels": ["Dog", "Park", "Tree", "Grass", f"custom-{i % 50}"],
+        "uploadId": uuid.UUID(int=i),
+    }
+
+
+def bulk_actions(n: int = 5000) -> list:
+    actions = []
+    for i in range(n):
+        actions.append({"index": {"_index": "photos", "_id": f"photo-{i}.jpg"}})
+        actions.append(_photo(i))
+    return actions
+
+
+def search_response(n: int = 1000) -> bytes:
+    hits = [
+        {"_index": "photos", "_id": f"photo-{i}.jpg", "_score": 1.0, "_source": _photo(i)}
+        for i in range(n)
+    ]
+    body = {"took": 3, "timed_out": False, "hits": {"total": {"value": n}, "hits": hits}}
+    return JSONSerializer(backend="json").dumps_bytes(body)
+
+
+def main() -> None:
+    actions = bulk_actions()
+    response = search_response()
+    print(f"{'backend':<10} {'bulk dumps':>12} {'search loads':>14}")
+    for name in JSON_BACKENDS:
+        try:
+            serializer = JSONSerializer(backend=name)
+        except ImproperlyConfigured:
+            print(f"{name:<10} {'not installed':>12}")
+            continue
+        dumps = min(
+            timeit.repeat(lambda: b"\n".join(map(serializer.dumps_bytes, actions)), number=1, repeat=ROUNDS)
+        )
+        loads = min(timeit.repeat(lambda: serializer.loads(response), number=1, repeat=ROUNDS))
+        print(f"{name:<10} {dumps * 1000:>10.2f}ms {loads * 1000:>12.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
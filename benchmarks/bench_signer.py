@@ -0,0 +1,106 @@
+"""
+Compare the cost of signing one bulk and one search request with
+opensearchpy's AWSV4Signer, botocore's SigV4Auth (what AWSV4Signer used to
+do for every request) and requests_aws4auth's AWS4Auth. Signers whose
+package is not installed are skipped.
+
+    PYTHONPATH=opensearch-layer/python python benchmarks/bench_signer.py
+"""
+import json
+import timeit
+from collections import namedtuple
+
+import requests
+
+from opensearchpy.helpers.signer import AWSV4Signer
+
+ROUNDS = 5
+NUMBER = 2000
+HOST = "search-photos.us-east-1.es.amazonaws.com"
+
+Credentials = namedtuple("Credentials", "access_key secret_key token")
+CREDENTIALS = Credentials("AKIDEXAMPLE", "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY", "t" * 400)
+
+
+def _requests() -> dict:
+    bulk = b"".join(
+        json.dumps({"index": {"_index": "photos", "_id": f"photo-{i}.jpg"}}).encode()
+        + b"\n"
+        + json.dumps({"objectKey": f"photo-{i}.jpg", "labels": ["Dog", "Park"]}).encode()
+        + b"\n"
+        for i in range(500)
+    )
+    search = json.dumps({"query": {"match": {"labels": "dog"}}, "size": 100}).encode()
+    return {
+        "bulk": ("POST", f"https://{HOST}/_bulk?refresh=false", bulk),
+        "search": ("POST", f"https://{HOST}/photos/_search?size=100", search),
+    }
+
+
+def opensearchpy_signer():
+    signer = AWSV4Signer(CREDENTIALS, "us-east-1", "es")
+    return lambda method, url, body: signer.sign(method, url, body)
+
+
+def botocore_signer():
+    from botocore.auth import SigV4Auth
+    from botocore.awsrequest import AWSRequest
+    from botocore.credentials import Credentials as BotocoreCredentials
+
+    credentials = BotocoreCredentials(*CREDENTIALS)
+
+    def sign(method, url, body):
+        request = AWSRequest(method=method, url=url, data=body)
+        auth = SigV4Auth(credentials.get_frozen_credentials(), "es", "us-east-1")
+        auth.add_auth(request)
+        headers = dict(request.headers.items())
+        headers["X-Amz-Content-SHA256"] = auth.payload(request)
+        return headers
+
+    return sign
+
+
+def aws4auth_signer():
+    from requests_aws4auth import AWS4Auth
+
+    auth = AWS4Auth(
+        CREDENTIALS.access_key,
+        CREDENTIALS.secret_key,
+        "us-east-1",
+        "es",
+        session_token=CREDENTIALS.token,
+    )
+
+    def sign(method, url, body):
+        request = requests.Request(method, url, data=body).prepare()
+        return auth(request).headers
+
+    return sign
+
+
+def main() -> None:
+    payloads = _requests()
+    print(f"{'signer':<14} " + " ".join(f"{name:>12}" for name in payloads))
+    for name, factory in (
+        ("opensearchpy", opensearchpy_signer),
+        ("botocore", botocore_signer),
+        ("aws4auth", aws4auth_signer),
+    ):
+        try:
+            sign = factory()
+        except ImportError:
+            print(f"{name:<14} {'not installed':>12}")
+            continue
+        timings = []
+        for method, url, body in payloads.values():
+            best = min(
+                timeit.repeat(
+                    lambda: sign(method, url, body), number=NUMBER, repeat=ROUNDS
+                )
+            )
+            timings.append(best / NUMBER * 1e6)
+        print(f"{name:<14} " + " ".join(f"{t:>10.1f}us" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
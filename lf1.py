@@ -2,13 +2,17 @@ import logging
 import json
 import boto3
 import os
-from opensearchpy import OpenSearch, RequestsHttpConnection
-from requests_aws4auth import AWS4Auth
+import time
+import uuid
+from opensearchpy import OpenSearch, RequestsAWSV4SignerAuth, RequestsHttpConnection
 from botocore.session import get_session
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Bucket holding LF2's materialized search results; unset disables dirty marking
+MATERIALIZED_BUCKET = os.environ.get("MATERIALIZED_BUCKET")
+
 # connect to OpenSearch domain
 try:
     openSearchHost = "search-photos-5fs2fd32xismuc3coqoqwkbi3q.us-east-1.es.amazonaws.com"  # copy domain url here
@@ -16,14 +20,9 @@ try:
     # Pulls credentials for open search connectiono
     session = get_session()
     credentials = session.get_credentials()
-    # Authenticaton for OpenSearch requests
-    awsauth = AWS4Auth(
-        credentials.access_key, \
-        credentials.secret_key, \
-        region, \
-        "es", \
-        session_token=credentials.token
-    )
+    # Authenticaton for OpenSearch requests; the signer caches its signing key
+    # and refreshes the credentials itself when they are about to expire
+    awsauth = RequestsAWSV4SignerAuth(credentials, region, "es")
     # Connect o OpenSearch
     openSearchClient = OpenSearch(
         hosts=[{"host": openSearchHost, "port": 443}], \
@@ -37,6 +36,26 @@ except Exception as e:
     openSearchClient = None
 
 
+def mark_labels_dirty(labels):
+    """
+    Record the labels of a newly indexed photo so LF2's refresh job recomputes
+    every materialized query that mentions one of them.
+    """
+    if not MATERIALIZED_BUCKET or not labels:
+        return
+    key = f"dirty/{time.strftime('%Y%m%dT%H%M%S', time.gmtime())}-{uuid.uuid4().hex}.json"
+    try:
+        boto3.client("s3").put_object(
+            Bucket=MATERIALIZED_BUCKET,
+            Key=key,
+            Body=json.dumps({"labels": labels}).encode("utf-8"),
+            ContentType="application/json"
+        )
+    except Exception as e:
+        # The photo is indexed either way; its queries just refresh on their next change
+        logger.error("Failed to mark labels dirty: %s", e, exc_info=True)
+
+
 def main(event, context):
     logger.info("## EVENT RECEIVED ##")
     logger.info(json.dumps(event))
@@ -110,6 +129,7 @@ def main(event, context):
 
     if osResponse.get("_shards", {}).get("successful") == 1:
         logger.info("Successfully indexed photo")
+        mark_labels_dirty(A1)
         return {
             "statusCode": 200,
             "body": "Photo indexed successfully."
@@ -1,12 +1,26 @@
+import atexit
+import gzip
+import hashlib
+import http.client
 import json
+import mmap
 import os
 import logging
+import signal
+import struct
+import sys
+import tempfile
+import threading
+import time
+import uuid
 
+import boto3
 import botocore.session
 from botocore.auth import SigV4Auth
 from botocore.awsrequest import AWSRequest
-import urllib.request
-import urllib.error
+from botocore.config import Config
+from botocore.exceptions import ClientError
+import urllib.parse
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -19,6 +33,30 @@ SERVICE = "es"  # OpenSearch/ES service name for SigV4
 #   OS_INDEX: "photos"
 OS_ENDPOINT = os.environ["OS_ENDPOINT"]          # e.g. "search-photos-xxxx.us-east-1.es.amazonaws.com"
 OS_INDEX = os.environ.get("OS_INDEX", "photos")
+OS_POOL_SIZE = int(os.environ.get("OS_POOL_SIZE", "10"))
+LABEL_FIELD = os.environ.get("OS_LABEL_FIELD", "labels.keyword")
+
+# /tmp survives across warm invocations of the same container, so search
+# results and the label vocabulary are kept there instead of in memory.
+CACHE_DIR = os.environ.get("LF2_CACHE_DIR", "/tmp/lf2-cache")
+CACHE_MAX_BYTES = int(os.environ.get("LF2_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+RESULTS_TTL = int(os.environ.get("LF2_RESULTS_TTL", "60"))
+VOCABULARY_TTL = int(os.environ.get("LF2_VOCABULARY_TTL", "900"))
+VOCABULARY_SIZE = int(os.environ.get("LF2_VOCABULARY_SIZE", "10000"))
+# Query tokens further than this from every label word are left uncorrected
+SPELL_MAX_DISTANCE = int(os.environ.get("LF2_SPELL_MAX_DISTANCE", "2"))
+# Popular queries are served from a snapshot in this bucket; unset disables it
+MATERIALIZED_BUCKET = os.environ.get("MATERIALIZED_BUCKET")
+MATERIALIZED_TOP_N = int(os.environ.get("MATERIALIZED_TOP_N", "50"))
+MATERIALIZED_REFRESH_SECONDS = int(os.environ.get("MATERIALIZED_REFRESH_SECONDS", "60"))
+# Pages older than this are recomputed even if no dirty marker names their keywords
+MATERIALIZED_MAX_AGE_SECONDS = int(
+    os.environ.get("MATERIALIZED_MAX_AGE_SECONDS", str(10 * MATERIALIZED_REFRESH_SECONDS))
+)
+POPULARITY_FLUSH_SECONDS = int(os.environ.get("POPULARITY_FLUSH_SECONDS", "60"))
+POPULARITY_WINDOW_HOURS = int(os.environ.get("POPULARITY_WINDOW_HOURS", "24"))
+# Browsers and any CDN in front of API Gateway may reuse a search response this long
+SEARCH_MAX_AGE = int(os.environ.get("LF2_SEARCH_MAX_AGE", "30"))
 
 
 # --- Low-level signed HTTP client to OpenSearch --- #
@@ -27,12 +65,74 @@ _session = botocore.session.get_session()
 _credentials = _session.get_credentials()
 
 
+# What an idle keep-alive connection closed by the server fails with on reuse
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+
+class ConnectionPool:
+    """
+    Keep-alive HTTPS connections to one host, shared by every thread in the process.
+    Up to `maxsize` idle connections are kept; busier moments open extra ones.
+    """
+
+    def __init__(self, host: str, maxsize: int, timeout: float = 5):
+        self.host = host
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._idle: list[http.client.HTTPSConnection] = []
+        self._lock = threading.Lock()
+
+    def _checkout(self) -> tuple[http.client.HTTPSConnection, bool]:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        return http.client.HTTPSConnection(self.host, timeout=self.timeout), False
+
+    def _checkin(self, conn: http.client.HTTPSConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.maxsize:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def request(self, method: str, target: str, body: bytes | None, headers: dict) -> tuple[int, bytes]:
+        """
+        Returns (status_code, body_bytes). A reused connection the server already
+        closed is retried once on a fresh one; timeouts and errors after a response
+        started arriving are raised, since the request may have been processed.
+        """
+        conn, reused = self._checkout()
+        while True:
+            resp = None
+            try:
+                conn.request(method, target, body=body, headers=headers)
+                resp = conn.getresponse()
+                data = resp.read()
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                if not (reused and resp is None and isinstance(e, _STALE_CONNECTION_ERRORS)):
+                    raise
+                conn, reused = http.client.HTTPSConnection(self.host, timeout=self.timeout), False
+                continue
+            break
+
+        if resp.will_close:
+            conn.close()
+        else:
+            self._checkin(conn)
+        return resp.status, data
+
+
+_host = OS_ENDPOINT.replace("https://", "").replace("http://", "").rstrip("/")
+opensearch_pool = ConnectionPool(_host, OS_POOL_SIZE)
+
+
 def signed_opensearch_request(path: str, method: str = "GET", body: dict | None = None) -> tuple[int, str]:
     """
-    Send a signed HTTP request to the OpenSearch domain using SigV4 + urllib.
+    Send a signed HTTP request to the OpenSearch domain using SigV4 over pooled keep-alive connections.
     Returns (status_code, body_text), even for non-2xx responses.
     """
-    host = OS_ENDPOINT.replace("https://", "").replace("http://", "").rstrip("/")
+    host = _host
     base_url = f"https://{host}"
     url = base_url + path
 
@@ -51,38 +151,447 @@ def signed_opensearch_request(path: str, method: str = "GET", body: dict | None
     SigV4Auth(_credentials, SERVICE, REGION).add_auth(aws_request)
     prepared = aws_request.prepare()
 
-    req = urllib.request.Request(
-        url=prepared.url,
-        data=body_bytes if method in ("POST", "PUT") else None,
-        headers=dict(prepared.headers),
-        method=method,
-    )
+    split = urllib.parse.urlsplit(prepared.url)
+    target = split.path + (f"?{split.query}" if split.query else "")
 
     try:
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            resp_body = resp.read().decode("utf-8")
-            status = resp.getcode()
-    except urllib.error.HTTPError as e:
-        # Non-2xx status: capture status and body instead of raising
-        status = e.code
-        resp_body = e.read().decode("utf-8", errors="ignore")
-        logger.error("OpenSearch HTTPError %s for %s: %s", status, url, resp_body)
+        status, raw = opensearch_pool.request(
+            method,
+            target,
+            body_bytes if method in ("POST", "PUT") else None,
+            dict(prepared.headers),
+        )
     except Exception as e:
         logger.exception("Error calling OpenSearch at %s", url)
         # Re-raise so lambda_handler turns this into a 500
         raise
 
+    if status >= 400:
+        # Non-2xx status: capture status and body instead of raising
+        resp_body = raw.decode("utf-8", errors="ignore")
+        logger.error("OpenSearch HTTPError %s for %s: %s", status, url, resp_body)
+    else:
+        resp_body = raw.decode("utf-8")
+
     return status, resp_body
 
 
-def search_photos(keywords: list[str]) -> list[dict]:
+# --- Persistent /tmp cache --- #
+
+# Entry file layout:
+#   header: magic, version, expires_at (unix time), record count
+#   offsets: (count + 1) uint32 record offsets, relative to the first record
+#   records: uint32 weight, uint16 field count, then uint16-length-prefixed
+#            UTF-8 fields
+# Records are decoded straight out of the mmap one at a time, so a lookup
+# never deserializes the whole entry.
+_ENTRY_HEADER = struct.Struct("<4sBxxxdI")
+_ENTRY_MAGIC = b"LF2C"
+_ENTRY_VERSION = 1
+_RECORD_HEADER = struct.Struct("<IH")
+_FIELD_LENGTH = struct.Struct("<H")
+_OFFSET = struct.Struct("<I")
+_MAX_FIELD_BYTES = 0xFFFF
+
+
+def _encode_records(records: list[tuple[int, list[str]]]) -> bytes:
     """
-    Run a terms query on labels.keyword with the given keywords.
-    Returns a list of photo dicts: {objectKey, bucket, labels, createdTimestamp}.
+    Encode (weight, fields) records into the offsets + records section of an entry.
+    Fields longer than a uint16 length allows are truncated at a character boundary.
     """
-    if not keywords:
-        return []
+    offsets = [0]
+    chunks = []
+    position = 0
+    for weight, fields in records:
+        parts = [_RECORD_HEADER.pack(weight, len(fields))]
+        for field in fields:
+            encoded = field.encode("utf-8")
+            if len(encoded) > _MAX_FIELD_BYTES:
+                encoded = encoded[:_MAX_FIELD_BYTES].decode("utf-8", "ignore").encode("utf-8")
+            parts.append(_FIELD_LENGTH.pack(len(encoded)))
+            parts.append(encoded)
+        record = b"".join(parts)
+        chunks.append(record)
+        position += len(record)
+        offsets.append(position)
+    return struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(chunks)
+
+
+class CachedRecords:
+    """
+    Read-only view over a memory-mapped cache entry.
+    Records are decoded lazily on access; use as a context manager so the map is released.
+    """
+
+    def __init__(self, mapped: mmap.mmap, count: int):
+        self._mapped = mapped
+        self._count = count
+        self._data_start = _ENTRY_HEADER.size + _OFFSET.size * (count + 1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> "CachedRecords":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mapped.close()
+
+    def _record_start(self, i: int) -> int:
+        (offset,) = _OFFSET.unpack_from(self._mapped, _ENTRY_HEADER.size + _OFFSET.size * i)
+        return self._data_start + offset
+
+    def _read_field(self, position: int) -> tuple[str, int]:
+        (length,) = _FIELD_LENGTH.unpack_from(self._mapped, position)
+        position += _FIELD_LENGTH.size
+        return self._mapped[position:position + length].decode("utf-8"), position + length
+
+    def __getitem__(self, i: int) -> tuple[int, list[str]]:
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        position = self._record_start(i)
+        weight, field_count = _RECORD_HEADER.unpack_from(self._mapped, position)
+        position += _RECORD_HEADER.size
+        fields = []
+        for _ in range(field_count):
+            field, position = self._read_field(position)
+            fields.append(field)
+        return weight, fields
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+
+class DiskCache:
+    """
+    Size-bounded key/value cache of record lists stored as files under `directory`.
+    Writes are atomic (temp file + rename); the least recently read entries are
+    evicted once the directory grows past `max_bytes`.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._bytes_used: int | None = None
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(key.encode("utf-8")).hexdigest())
+
+    def get(self, key: str) -> CachedRecords | None:
+        """
+        Return a view of the entry for `key`, or None if it is missing or expired.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Missing file, or an empty one (mmap refuses zero-length maps)
+            return None
+
+        if len(mapped) < _ENTRY_HEADER.size:
+            mapped.close()
+            return None
+        magic, version, expires_at, count = _ENTRY_HEADER.unpack_from(mapped)
+        if magic != _ENTRY_MAGIC or version != _ENTRY_VERSION or expires_at < time.time():
+            mapped.close()
+            return None
+
+        try:
+            # mtime doubles as the LRU clock
+            os.utime(path)
+        except OSError:
+            pass
+        return CachedRecords(mapped, count)
+
+    def put(self, key: str, records: list[tuple[int, list[str]]], ttl: int) -> None:
+        """
+        Atomically write `records` under `key`. Failures are logged, never raised.
+        """
+        tmp_path = None
+        try:
+            header = _ENTRY_HEADER.pack(_ENTRY_MAGIC, _ENTRY_VERSION, time.time() + ttl, len(records))
+            # records that can't be encoded (e.g. fields that aren't strings) skip the cache
+            payload = _encode_records(records)
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                f.write(payload)
+            os.replace(tmp_path, self._path(key))
+        except (OSError, struct.error, TypeError, AttributeError):
+            logger.warning("Failed to write cache entry for %s", key, exc_info=True)
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            return
+
+        if self._bytes_used is None:
+            self._bytes_used = self._scan_bytes()
+        else:
+            self._bytes_used += len(header) + len(payload)
+        if self._bytes_used > self.max_bytes:
+            self._evict()
+
+    def _entries(self) -> list[os.DirEntry]:
+        try:
+            with os.scandir(self.directory) as it:
+                return [e for e in it if e.is_file() and not e.name.startswith(".tmp-")]
+        except OSError:
+            return []
+
+    def _scan_bytes(self) -> int:
+        return sum(e.stat().st_size for e in self._entries())
+
+    def _evict(self) -> None:
+        """
+        Remove least recently used entries until usage drops to 80% of the budget.
+        """
+        entries = []
+        for e in self._entries():
+            try:
+                st = e.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, e.path))
+        entries.sort()
+
+        used = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.8
+        for _, size, path in entries:
+            if used <= target:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            used -= size
+        self._bytes_used = used
+
+
+_cache = DiskCache(CACHE_DIR, CACHE_MAX_BYTES)
+
+
+def _results_cache_key(keywords: list[str]) -> str:
+    # A terms query ignores keyword order and duplicates, so neither should split the cache
+    return "results\x00" + "\x00".join(sorted(set(keywords)))
+
+
+def _encode_results(results: list[dict]) -> list[tuple[int, list[str]]]:
+    return [
+        (
+            0,
+            [r["objectKey"] or "", r["bucket"] or "", r["createdTimestamp"] or "", *r["labels"]],
+        )
+        for r in results
+    ]
+
+
+def _decode_results(records: CachedRecords) -> list[dict]:
+    results = []
+    for _, fields in records:
+        object_key, bucket, created, *labels = fields
+        results.append(
+            {
+                "objectKey": object_key or None,
+                "bucket": bucket or None,
+                "labels": labels,
+                "createdTimestamp": created or None,
+            }
+        )
+    return results
+
+
+def get_label_vocabulary() -> CachedRecords | list[tuple[int, list[str]]] | None:
+    """
+    Return the label vocabulary as (document frequency, [label]) records.
+    Served from the /tmp cache when fresh, otherwise rebuilt with a terms aggregation;
+    if the rebuilt vocabulary can't be cached, it is returned as a list instead.
+    Returns None if the vocabulary cannot be loaded.
+    """
+    key = "vocabulary\x00" + OS_INDEX
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
+
+    query = {
+        "size": 0,
+        "aggs": {"labels": {"terms": {"field": LABEL_FIELD, "size": VOCABULARY_SIZE}}},
+    }
+    status, body_text = signed_opensearch_request(f"/{OS_INDEX}/_search", method="POST", body=query)
+    if status != 200:
+        logger.error("Vocabulary aggregation returned %s, body=%s", status, body_text)
+        return None
+
+    payload = json.loads(body_text or "{}")
+    buckets = payload.get("aggregations", {}).get("labels", {}).get("buckets", [])
+    records = [(b["doc_count"], [str(b["key"])]) for b in buckets]
+    _cache.put(key, records, VOCABULARY_TTL)
+    # put only logs failures, e.g. a full /tmp
+    cached = _cache.get(key)
+    return records if cached is None else cached
+
+
+# --- Typo correction against the label vocabulary --- #
+
+
+def _deletes(word: str, max_distance: int) -> set[str]:
+    """
+    Every string reachable from `word` by deleting up to `max_distance` characters.
+    """
+    results = set()
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        results |= frontier
+    return results
+
+
+def _edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance (adjacent transpositions cost 1).
+    Returns max_distance + 1 as soon as the distance is known to exceed the limit.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous2: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def _max_distance_for(word: str) -> int:
+    # Short words are a distance or two away from too many others to correct safely
+    if len(word) < 3:
+        return 0
+    if len(word) < 5:
+        return min(1, SPELL_MAX_DISTANCE)
+    return SPELL_MAX_DISTANCE
+
+
+class SpellCorrector:
+    """
+    Symmetric-delete (SymSpell-style) index over lowercased label words.
+    Both dictionary words and query tokens are reduced to their deletes, so a lookup is
+    a handful of dict probes instead of a scan of the vocabulary.
+    """
+
+    def __init__(self, frequencies: dict[str, int]):
+        self.frequencies = frequencies
+        self._index: dict[str, list[str]] = {}
+        for word in frequencies:
+            for key in _deletes(word, _max_distance_for(word)) | {word}:
+                self._index.setdefault(key, []).append(word)
+
+    def correct(self, token: str) -> str | None:
+        """
+        Return the closest known word for an unknown token, or None if the token is
+        already known or nothing is close enough. Ties on distance go to the word
+        that labels the most documents.
+        """
+        word = token.lower()
+        if word in self.frequencies:
+            return None
+        max_distance = _max_distance_for(word)
+        if max_distance == 0:
+            return None
+
+        best = None
+        best_rank = None
+        seen = set()
+        for key in _deletes(word, max_distance) | {word}:
+            for candidate in self._index.get(key, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                distance = _edit_distance(word, candidate, max_distance)
+                if distance > max_distance:
+                    continue
+                rank = (distance, -self.frequencies[candidate])
+                if best_rank is None or rank < best_rank:
+                    best, best_rank = candidate, rank
+        return best
+
+
+_speller: SpellCorrector | None = None
+_speller_built_at = 0.0
+_speller_lock = threading.Lock()
+
+
+def _get_speller() -> SpellCorrector | None:
+    """
+    The corrector for the current vocabulary, rebuilt once the vocabulary TTL has passed.
+    """
+    global _speller, _speller_built_at
+    with _speller_lock:
+        if _speller is not None and time.monotonic() - _speller_built_at < VOCABULARY_TTL:
+            return _speller
+
+        vocabulary = get_label_vocabulary()
+        if vocabulary is None:
+            return _speller
+
+        frequencies: dict[str, int] = {}
+        try:
+            for doc_count, (label,) in vocabulary:
+                # Labels are searched through an analyzed text field, so index their words
+                for word in label.lower().split():
+                    frequencies[word] = frequencies.get(word, 0) + doc_count
+        finally:
+            if isinstance(vocabulary, CachedRecords):
+                vocabulary.close()
+        _speller = SpellCorrector(frequencies)
+        _speller_built_at = time.monotonic()
+        return _speller
+
+
+def correct_keywords(keywords: list[str]) -> tuple[list[str], list[dict]]:
+    """
+    Replace misspelled keywords with their closest label word.
+    Returns (keywords, corrections) where corrections lists {"from", "to"} pairs.
+    """
+    try:
+        speller = _get_speller()
+    except Exception:
+        logger.warning("Label vocabulary unavailable, skipping typo correction", exc_info=True)
+        return keywords, []
+    if speller is None:
+        return keywords, []
+
+    corrected = []
+    corrections = []
+    for keyword in keywords:
+        replacement = speller.correct(keyword)
+        if replacement is None:
+            corrected.append(keyword)
+        else:
+            corrected.append(replacement)
+            corrections.append({"from": keyword, "to": replacement})
+    if corrections:
+        logger.info("Applied query corrections: %s", corrections)
+    return corrected, corrections
 
+
+def _query_opensearch(keywords: list[str]) -> list[dict]:
+    """
+    Run a terms query on labels with the given keywords.
+    Returns a list of photo dicts: {objectKey, bucket, labels, createdTimestamp}.
+    """
     query = {
         "size": 100,
         "query": {
@@ -122,6 +631,315 @@ def search_photos(keywords: list[str]) -> list[dict]:
     return results
 
 
+def search_photos(keywords: list[str]) -> list[dict]:
+    """
+    Search photos by keywords, preferring a materialized page, then the /tmp cache,
+    then OpenSearch itself.
+    """
+    if not keywords:
+        return []
+
+    page = get_materialized_page(keywords)
+    if page is not None:
+        return page
+
+    cache_key = _results_cache_key(keywords)
+    cached = _cache.get(cache_key)
+    if cached is not None:
+        with cached:
+            return _decode_results(cached)
+
+    results = _query_opensearch(keywords)
+    _cache.put(cache_key, _encode_results(results), RESULTS_TTL)
+    return results
+
+
+# --- Materialized popular queries --- #
+
+# Layout of MATERIALIZED_BUCKET:
+#   popularity/<time>-<container>-<n>.json  query counts flushed by one LF2 container
+#   aggregate/popularity.json.gz            hourly counts folded in by the refresh job
+#   dirty/<time>-<id>.json                  label words of photos LF1 indexed since
+#   snapshot.json.gz                        ranked result pages of the top-N queries,
+#                                           and when each page was computed
+_POPULARITY_PREFIX = "popularity/"
+_AGGREGATE_KEY = "aggregate/popularity.json.gz"
+_DIRTY_PREFIX = "dirty/"
+_SNAPSHOT_KEY = "snapshot.json.gz"
+
+_s3 = boto3.client("s3") if MATERIALIZED_BUCKET else None
+# Popularity flushes give up quickly instead of holding a frozen container's thread
+_s3_popularity = (
+    boto3.client(
+        "s3",
+        config=Config(connect_timeout=2, read_timeout=2, retries={"max_attempts": 2}),
+    )
+    if MATERIALIZED_BUCKET
+    else None
+)
+_container_id = uuid.uuid4().hex[:12]
+
+
+def query_key(keywords: list[str]) -> str:
+    """
+    Canonical form of a query: a terms query ignores keyword order and duplicates.
+    """
+    return " ".join(sorted(set(keywords)))
+
+
+class PopularityCounter:
+    """
+    Query counts buffered in memory and flushed to S3 at most every `flush_interval`
+    seconds. Each flush writes its own object, so containers never contend on one key.
+    Flushes run on a background thread, never on the request that makes one due.
+    """
+
+    def __init__(self, flush_interval: int):
+        self.flush_interval = flush_interval
+        self._counts: dict[str, int] = {}
+        self._last_flush = time.monotonic()
+        self._flushes = 0
+        self._flushing = False
+        self._lock = threading.Lock()
+
+    def record(self, key: str) -> None:
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0) + 1
+            due = (
+                not self._flushing
+                and time.monotonic() - self._last_flush >= self.flush_interval
+            )
+            if due:
+                self._flushing = True
+        if due:
+            threading.Thread(target=self._flush_in_background, name="popularity-flush", daemon=True).start()
+
+    def _flush_in_background(self) -> None:
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                self._flushing = False
+
+    def flush(self) -> None:
+        with self._lock:
+            counts, self._counts = self._counts, {}
+            self._last_flush = time.monotonic()
+            self._flushes += 1
+            sequence = self._flushes
+        if not counts:
+            return
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+        try:
+            _s3_popularity.put_object(
+                Bucket=MATERIALIZED_BUCKET,
+                Key=f"{_POPULARITY_PREFIX}{stamp}-{_container_id}-{sequence}.json",
+                Body=json.dumps({"counts": counts}).encode("utf-8"),
+                ContentType="application/json",
+            )
+        except Exception:
+            logger.warning("Failed to flush %d query counts", len(counts), exc_info=True)
+            # Keep them for the next flush rather than losing the window
+            with self._lock:
+                for key, count in counts.items():
+                    self._counts[key] = self._counts.get(key, 0) + count
+
+
+_popularity = PopularityCounter(POPULARITY_FLUSH_SECONDS)
+
+
+def _flush_popularity_on_shutdown(signum, frame) -> None:
+    """
+    Flush buffered counts before the container goes away. Lambda sends SIGTERM on
+    shutdown when an extension is registered; atexit covers other exits.
+    """
+    _popularity.flush()
+    if callable(_previous_sigterm):
+        _previous_sigterm(signum, frame)
+    elif _previous_sigterm != signal.SIG_IGN:
+        sys.exit(0)
+
+
+if _s3 is not None:
+    atexit.register(_popularity.flush)
+    try:
+        _previous_sigterm = signal.signal(signal.SIGTERM, _flush_popularity_on_shutdown)
+    except ValueError:
+        # Not imported from the main thread; atexit still applies
+        pass
+
+_materialized: dict[str, list[dict]] = {}
+_materialized_etag: str | None = None
+_materialized_checked_at = float("-inf")
+_materialized_lock = threading.Lock()
+
+
+def _load_materialized() -> dict[str, list[dict]]:
+    """
+    The current snapshot, re-checked against S3 at most every MATERIALIZED_REFRESH_SECONDS.
+    """
+    global _materialized, _materialized_etag, _materialized_checked_at
+    with _materialized_lock:
+        if time.monotonic() - _materialized_checked_at < MATERIALIZED_REFRESH_SECONDS:
+            return _materialized
+        _materialized_checked_at = time.monotonic()
+
+        kwargs = {"Bucket": MATERIALIZED_BUCKET, "Key": _SNAPSHOT_KEY}
+        if _materialized_etag:
+            kwargs["IfNoneMatch"] = _materialized_etag
+        try:
+            obj = _s3.get_object(**kwargs)
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code")
+            if code not in ("304", "NotModified", "NoSuchKey"):
+                logger.warning("Failed to load materialized snapshot: %s", e)
+            return _materialized
+
+        snapshot = json.loads(gzip.decompress(obj["Body"].read()))
+        _materialized = snapshot.get("queries", {})
+        _materialized_etag = obj.get("ETag")
+        logger.info("Loaded materialized snapshot with %d queries", len(_materialized))
+        return _materialized
+
+
+def get_materialized_page(keywords: list[str]) -> list[dict] | None:
+    """
+    Precomputed results for a popular query, or None if it is not materialized.
+    """
+    if _s3 is None:
+        return None
+    try:
+        pages = _load_materialized()
+    except Exception:
+        logger.warning("Materialized snapshot unavailable", exc_info=True)
+        return None
+    return pages.get(query_key(keywords))
+
+
+def _list_objects(prefix: str) -> list[dict]:
+    paginator = _s3.get_paginator("list_objects_v2")
+    objects = []
+    for page in paginator.paginate(Bucket=MATERIALIZED_BUCKET, Prefix=prefix):
+        objects.extend(page.get("Contents", []))
+    return objects
+
+
+def _read_gzip_json(key: str) -> dict | None:
+    try:
+        obj = _s3.get_object(Bucket=MATERIALIZED_BUCKET, Key=key)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") == "NoSuchKey":
+            return None
+        raise
+    return json.loads(gzip.decompress(obj["Body"].read()))
+
+
+def _put_gzip_json(key: str, data: dict) -> None:
+    _s3.put_object(
+        Bucket=MATERIALIZED_BUCKET,
+        Key=key,
+        Body=gzip.compress(json.dumps(data, separators=(",", ":")).encode("utf-8")),
+        ContentType="application/json",
+        ContentEncoding="gzip",
+    )
+
+
+def _delete_objects(keys: list[str]) -> None:
+    for i in range(0, len(keys), 1000):
+        _s3.delete_objects(
+            Bucket=MATERIALIZED_BUCKET,
+            Delete={"Objects": [{"Key": k} for k in keys[i:i + 1000]], "Quiet": True},
+        )
+
+
+def _fold_popularity() -> dict[str, int]:
+    """
+    Fold newly flushed counts into the hourly aggregate, drop hours outside the
+    popularity window, and return the windowed total per query. The aggregate records
+    the keys it has folded, so objects left behind by a failed delete aren't counted twice.
+    """
+    aggregate = _read_gzip_json(_AGGREGATE_KEY) or {"hours": {}}
+    hours = aggregate["hours"]
+    folded = set(aggregate.get("folded", []))
+
+    flushed = _list_objects(_POPULARITY_PREFIX)
+    for obj in flushed:
+        if obj["Key"] in folded:
+            continue
+        hour = obj["LastModified"].strftime("%Y%m%d%H")
+        counts = json.loads(_s3.get_object(Bucket=MATERIALIZED_BUCKET, Key=obj["Key"])["Body"].read())
+        bucket = hours.setdefault(hour, {})
+        for key, count in counts.get("counts", {}).items():
+            bucket[key] = bucket.get(key, 0) + count
+
+    oldest = time.strftime("%Y%m%d%H", time.gmtime(time.time() - POPULARITY_WINDOW_HOURS * 3600))
+    for hour in [h for h in hours if h < oldest]:
+        del hours[hour]
+
+    # Deleted objects are no longer listed, so this only keeps keys still pending deletion
+    aggregate["folded"] = sorted(obj["Key"] for obj in flushed)
+    _put_gzip_json(_AGGREGATE_KEY, aggregate)
+    _delete_objects([obj["Key"] for obj in flushed])
+
+    totals: dict[str, int] = {}
+    for bucket in hours.values():
+        for key, count in bucket.items():
+            totals[key] = totals.get(key, 0) + count
+    return totals
+
+
+def refresh_materialized() -> dict:
+    """
+    Scheduled job: republish result pages for the top-N queries. Pages already in the
+    snapshot are reused unless LF1 has since indexed a photo with one of their keywords,
+    or they were computed more than MATERIALIZED_MAX_AGE_SECONDS ago. The age bound
+    catches changes no marker reports: marker writes that failed, removed labels, and
+    markers deleted before the refresh that should have consumed them.
+    """
+    if _s3 is None:
+        logger.warning("MATERIALIZED_BUCKET is not set, nothing to refresh")
+        return {"queries": 0, "recomputed": 0}
+
+    totals = _fold_popularity()
+    top = sorted(totals, key=lambda k: (-totals[k], k))[:MATERIALIZED_TOP_N]
+
+    snapshot = _read_gzip_json(_SNAPSHOT_KEY) or {}
+    previous = snapshot.get("queries", {})
+    previous_computed_at = snapshot.get("computedAt", {})
+
+    markers = _list_objects(_DIRTY_PREFIX)
+    dirty_words: set[str] = set()
+    for obj in markers:
+        marker = json.loads(_s3.get_object(Bucket=MATERIALIZED_BUCKET, Key=obj["Key"])["Body"].read())
+        for label in marker.get("labels", []):
+            dirty_words.update(label.lower().split())
+
+    now = int(time.time())
+    queries = {}
+    computed_at = {}
+    recomputed = 0
+    for key in top:
+        keywords = key.split(" ")
+        # Snapshots written before pages were stamped count as expired
+        fresh = now - previous_computed_at.get(key, 0) < MATERIALIZED_MAX_AGE_SECONDS
+        if key in previous and fresh and not any(k.lower() in dirty_words for k in keywords):
+            queries[key] = previous[key]
+            computed_at[key] = previous_computed_at[key]
+            continue
+        queries[key] = _query_opensearch(keywords)
+        computed_at[key] = now
+        recomputed += 1
+
+    _put_gzip_json(
+        _SNAPSHOT_KEY, {"generatedAt": now, "queries": queries, "computedAt": computed_at}
+    )
+    # Only markers listed before recomputing are consumed; later ones wait for the next run
+    _delete_objects([obj["Key"] for obj in markers])
+
+    logger.info("Materialized %d queries, %d recomputed", len(queries), recomputed)
+    return {"queries": len(queries), "recomputed": recomputed}
+
+
 def _parse_keywords_from_event(event: dict) -> list[str]:
     """
     Read ?q=... from API Gateway proxy event and split into simple keywords.
@@ -140,53 +958,105 @@ def _parse_keywords_from_event(event: dict) -> list[str]:
     return tokens
 
 
+def _get_header(event: dict, name: str) -> str | None:
+    """
+    Case-insensitive lookup of a request header in an API Gateway proxy event.
+    """
+    headers = event.get("headers") or {}
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _compute_etag(body: str) -> str:
+    """
+    Strong validator for a response body: identical result sets give identical bodies.
+    """
+    return '"' + hashlib.blake2b(body.encode("utf-8"), digest_size=16).hexdigest() + '"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    If-None-Match uses weak comparison, so W/ prefixes are ignored.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _response(status: int, body: str, extra_headers: dict | None = None) -> dict:
+    headers = {
+        "Access-Control-Allow-Origin": "*",
+        "Access-Control-Allow-Methods": "GET,OPTIONS",
+        "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,If-None-Match",
+        "Access-Control-Expose-Headers": "ETag",
+        "Content-Type": "application/json",
+    }
+    if extra_headers:
+        headers.update(extra_headers)
+    return {
+        "statusCode": status,
+        "headers": headers,
+        "body": body,
+    }
+
+
+def _cacheable_response(event: dict, body: str) -> dict:
+    """
+    200 with ETag and Cache-Control, or a bodyless 304 if the client already has this body.
+    """
+    etag = _compute_etag(body)
+    validators = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={SEARCH_MAX_AGE}",
+    }
+    if _etag_matches(_get_header(event, "If-None-Match"), etag):
+        return _response(304, "", validators)
+    return _response(200, body, validators)
+
+
 def main(event, context):
     """
     Lambda proxy integration handler for GET /search?q=...
+    Scheduled EventBridge invocations refresh the materialized snapshot instead.
     """
     logger.info("Event: %s", json.dumps(event))
 
+    if event.get("source") == "aws.events":
+        return refresh_materialized()
+
     keywords = _parse_keywords_from_event(event)
     if not keywords:
         body = {"results": []}
-        return {
-            "statusCode": 200,
-            "headers": {
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Methods": "GET,OPTIONS",
-                "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token",
-                "Content-Type": "application/json",
-            },
-            "body": json.dumps(body),
-        }
+        return _cacheable_response(event, json.dumps(body))
 
     try:
+        keywords, corrections = correct_keywords(keywords)
+        if _s3 is not None:
+            _popularity.record(query_key(keywords))
         results = search_photos(keywords)
         body = {"results": results}
-        return {
-            "statusCode": 200,
-            "headers": {
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Methods": "GET,OPTIONS",
-                "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token",
-                "Content-Type": "application/json",
-            },
-            "body": json.dumps(body),
-        }
+        if corrections:
+            body["corrections"] = corrections
+        return _cacheable_response(event, json.dumps(body))
     except Exception as e:
         logger.exception("Search failed")
-        return {
-            "statusCode": 500,
-            "headers": {
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Methods": "GET,OPTIONS",
-                "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token",
-                "Content-Type": "application/json",
-            },
-            "body": json.dumps(
+        return _response(
+            500,
+            json.dumps(
                 {
                     "message": "Search failed",
                     "error": str(e),
                 }
             ),
-        }
+        )
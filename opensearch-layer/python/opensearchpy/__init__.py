@@ -30,6 +30,9 @@
 import logging
 import re
 import warnings
+from importlib import import_module
+from importlib.util import find_spec
+from typing import Any
 
 from ._version import __versionstr__
 
@@ -43,13 +46,14 @@ logger = logging.getLogger("opensearch")
 logger.addHandler(logging.NullHandler())
 
 from .client import OpenSearch
-from .connection import (
-    Connection,
-    RequestsHttpConnection,
-    Urllib3HttpConnection,
-    connections,
+from .connection import Connection, Urllib3HttpConnection, connections
+from .connection_pool import (
+    ConnectionPool,
+    ConnectionSelector,
+    ConsistentHashSelector,
+    LatencyAwareSelector,
+    RoundRobinSelector,
 )
-from .connection_pool import ConnectionPool, ConnectionSelector, RoundRobinSelector
 from .exceptions import (
     AuthenticationException,
     AuthorizationException,
@@ -70,72 +74,88 @@ from .exceptions import (
     UnknownDslObject,
     ValidationException,
 )
-from .helpers import AWSV4SignerAuth, RequestsAWSV4SignerAuth, Urllib3AWSV4SignerAuth
-from .helpers.aggs import A
-from .helpers.analysis import analyzer, char_filter, normalizer, token_filter, tokenizer
-from .helpers.document import Document, InnerDoc, MetaField
-from .helpers.faceted_search import (
-    DateHistogramFacet,
-    Facet,
-    FacetedResponse,
-    FacetedSearch,
-    HistogramFacet,
-    NestedFacet,
-    RangeFacet,
-    TermsFacet,
-)
-from .helpers.field import (
-    Binary,
-    Boolean,
-    Byte,
-    Completion,
-    CustomField,
-    Date,
-    DateRange,
-    Double,
-    DoubleRange,
-    Field,
-    Float,
-    FloatRange,
-    GeoPoint,
-    GeoShape,
-    HalfFloat,
-    Integer,
-    IntegerRange,
-    Ip,
-    IpRange,
-    Join,
-    Keyword,
-    KnnVector,
-    Long,
-    LongRange,
-    Murmur3,
-    Nested,
-    Object,
-    Percolator,
-    RangeField,
-    RankFeature,
-    RankFeatures,
-    ScaledFloat,
-    SearchAsYouType,
-    Short,
-    SparseVector,
-    Text,
-    TokenCount,
-    construct_field,
-)
-from .helpers.function import SF
-from .helpers.index import Index, IndexTemplate
-from .helpers.mapping import Mapping
-from .helpers.query import Q
-from .helpers.search import MultiSearch, Search
-from .helpers.update_by_query import UpdateByQuery
-from .helpers.utils import AttrDict, AttrList, DslBase
-from .helpers.wrappers import Range
-from .metrics import Metrics, MetricsEvents, MetricsNone
+from .metrics import Metrics, MetricsEvents, MetricsHistogram, MetricsNone
 from .serializer import JSONSerializer
 from .transport import Transport
 
+# the DSL, signers and less common connection classes are imported when first
+# used, which keeps `from opensearchpy import OpenSearch` fast
+_LAZY = {
+    "CachingTransport": ".caching",
+    "Http2Connection": ".connection",
+    "RequestsHttpConnection": ".connection",
+    "AWSV4SignerAuth": ".helpers",
+    "RequestsAWSV4SignerAuth": ".helpers",
+    "Urllib3AWSV4SignerAuth": ".helpers",
+    "A": ".helpers.aggs",
+    "analyzer": ".helpers.analysis",
+    "char_filter": ".helpers.analysis",
+    "normalizer": ".helpers.analysis",
+    "token_filter": ".helpers.analysis",
+    "tokenizer": ".helpers.analysis",
+    "Document": ".helpers.document",
+    "InnerDoc": ".helpers.document",
+    "MetaField": ".helpers.document",
+    "DateHistogramFacet": ".helpers.faceted_search",
+    "Facet": ".helpers.faceted_search",
+    "FacetedResponse": ".helpers.faceted_search",
+    "FacetedSearch": ".helpers.faceted_search",
+    "HistogramFacet": ".helpers.faceted_search",
+    "NestedFacet": ".helpers.faceted_search",
+    "RangeFacet": ".helpers.faceted_search",
+    "TermsFacet": ".helpers.faceted_search",
+    "Binary": ".helpers.field",
+    "Boolean": ".helpers.field",
+    "Byte": ".helpers.field",
+    "Completion": ".helpers.field",
+    "CustomField": ".helpers.field",
+    "Date": ".helpers.field",
+    "DateRange": ".helpers.field",
+    "Double": ".helpers.field",
+    "DoubleRange": ".helpers.field",
+    "Field": ".helpers.field",
+    "Float": ".helpers.field",
+    "FloatRange": ".helpers.field",
+    "GeoPoint": ".helpers.field",
+    "GeoShape": ".helpers.field",
+    "HalfFloat": ".helpers.field",
+    "Integer": ".helpers.field",
+    "IntegerRange": ".helpers.field",
+    "Ip": ".helpers.field",
+    "IpRange": ".helpers.field",
+    "Join": ".helpers.field",
+    "Keyword": ".helpers.field",
+    "KnnVector": ".helpers.field",
+    "Long": ".helpers.field",
+    "LongRange": ".helpers.field",
+    "Murmur3": ".helpers.field",
+    "Nested": ".helpers.field",
+    "Object": ".helpers.field",
+    "Percolator": ".helpers.field",
+    "RangeField": ".helpers.field",
+    "RankFeature": ".helpers.field",
+    "RankFeatures": ".helpers.field",
+    "ScaledFloat": ".helpers.field",
+    "SearchAsYouType": ".helpers.field",
+    "Short": ".helpers.field",
+    "SparseVector": ".helpers.field",
+    "Text": ".helpers.field",
+    "TokenCount": ".helpers.field",
+    "construct_field": ".helpers.field",
+    "SF": ".helpers.function",
+    "Index": ".helpers.index",
+    "IndexTemplate": ".helpers.index",
+    "Mapping": ".helpers.mapping",
+    "Q": ".helpers.query",
+    "MultiSearch": ".helpers.search",
+    "Search": ".helpers.search",
+    "UpdateByQuery": ".helpers.update_by_query",
+    "AttrDict": ".helpers.utils",
+    "AttrList": ".helpers.utils",
+    "DslBase": ".helpers.utils",
+    "Range": ".helpers.wrappers",
+}
+
 # Only raise one warning per deprecation message so as not
 # to spam up the user if the same action is done multiple times.
 warnings.simplefilter("default", category=OpenSearchDeprecationWarning, append=True)
@@ -143,13 +163,17 @@ warnings.simplefilter("default", category=OpenSearchDeprecationWarning, append=T
 __all__ = [
     "OpenSearch",
     "Transport",
+    "CachingTransport",
     "ConnectionPool",
     "ConnectionSelector",
     "RoundRobinSelector",
+    "LatencyAwareSelector",
+    "ConsistentHashSelector",
     "JSONSerializer",
     "Connection",
     "RequestsHttpConnection",
     "Urllib3HttpConnection",
+    "Http2Connection",
     "ImproperlyConfigured",
     "OpenSearchException",
     "SerializationError",
@@ -243,22 +267,35 @@ __all__ = [
     "Metrics",
     "MetricsEvents",
     "MetricsNone",
+    "MetricsHistogram",
 ]
 
-try:
-    from ._async.client import AsyncOpenSearch
-    from ._async.http_aiohttp import AIOHttpConnection, AsyncConnection
-    from ._async.transport import AsyncTransport
-    from .connection import AsyncHttpConnection
-    from .helpers import AWSV4SignerAsyncAuth
+_ASYNC = {
+    "AIOHttpConnection": "._async.http_aiohttp",
+    "AsyncConnection": "._async.http_aiohttp",
+    "AsyncTransport": "._async.transport",
+    "AsyncOpenSearch": "._async.client",
+    "AsyncHttpConnection": ".connection",
+    "AWSV4SignerAsyncAuth": ".helpers",
+}
+
+if find_spec("aiohttp") is not None:
+    __all__ += list(_ASYNC)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        module = import_module(_LAZY[name], __name__)
+    elif name in _ASYNC:
+        try:
+            module = import_module(_ASYNC[name], __name__)
+        except (ImportError, SyntaxError) as e:
+            raise AttributeError(f"{name} needs aiohttp: {e}") from e
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(module, name)
+    return value
+
 
-    __all__ += [
-        "AIOHttpConnection",
-        "AsyncConnection",
-        "AsyncTransport",
-        "AsyncOpenSearch",
-        "AsyncHttpConnection",
-        "AWSV4SignerAsyncAuth",
-    ]
-except (ImportError, SyntaxError):
-    pass
+def __dir__() -> Any:
+    return sorted(set(globals()) | set(__all__))
@@ -38,27 +38,15 @@ import logging
 from typing import Any, Type
 
 from ..transport import AsyncTransport, TransportError
-from .cat import CatClient
 from .client import Client
-from .cluster import ClusterClient
-from .dangling_indices import DanglingIndicesClient
-from .features import FeaturesClient
-from .http import HttpClient
-from .indices import IndicesClient
-from .ingest import IngestClient
-from .ingestion import IngestionClient
-from .insights import InsightsClient
-from .list import ListClient
-from .nodes import NodesClient
-from .plugins import PluginsClient
-from .remote import RemoteClient
-from .remote_store import RemoteStoreClient
-from .search_pipeline import SearchPipelineClient
-from .security import SecurityClient
-from .snapshot import SnapshotClient
-from .tasks import TasksClient
-from .utils import SKIP_IN_PATH, _bulk_body, _make_path, query_params
-from .wlm import WlmClient
+from .plugins import PLUGINS
+from .utils import (
+    SKIP_IN_PATH,
+    LazyNamespace,
+    _bulk_body,
+    _make_path,
+    query_params,
+)
 
 logger = logging.getLogger("opensearch")
 
@@ -190,6 +178,34 @@ class AsyncOpenSearch(Client):
 
     """
 
+    # namespaced clients for compatibility with API names, created when
+    # first used
+    ingestion = LazyNamespace("opensearchpy._async.client.ingestion", "IngestionClient")
+    wlm = LazyNamespace("opensearchpy._async.client.wlm", "WlmClient")
+    list = LazyNamespace("opensearchpy._async.client.list", "ListClient")
+    insights = LazyNamespace("opensearchpy._async.client.insights", "InsightsClient")
+    search_pipeline = LazyNamespace(
+        "opensearchpy._async.client.search_pipeline", "SearchPipelineClient"
+    )
+    cat = LazyNamespace("opensearchpy._async.client.cat", "CatClient")
+    cluster = LazyNamespace("opensearchpy._async.client.cluster", "ClusterClient")
+    dangling_indices = LazyNamespace(
+        "opensearchpy._async.client.dangling_indices", "DanglingIndicesClient"
+    )
+    indices = LazyNamespace("opensearchpy._async.client.indices", "IndicesClient")
+    ingest = LazyNamespace("opensearchpy._async.client.ingest", "IngestClient")
+    nodes = LazyNamespace("opensearchpy._async.client.nodes", "NodesClient")
+    remote = LazyNamespace("opensearchpy._async.client.remote", "RemoteClient")
+    security = LazyNamespace("opensearchpy._async.client.security", "SecurityClient")
+    snapshot = LazyNamespace("opensearchpy._async.client.snapshot", "SnapshotClient")
+    tasks = LazyNamespace("opensearchpy._async.client.tasks", "TasksClient")
+    remote_store = LazyNamespace(
+        "opensearchpy._async.client.remote_store", "RemoteStoreClient"
+    )
+    features = LazyNamespace("opensearchpy._async.client.features", "FeaturesClient")
+    plugins = LazyNamespace("opensearchpy._async.client.plugins", "PluginsClient")
+    http = LazyNamespace("opensearchpy._async.client.http", "HttpClient")
+
     def __init__(
         self,
         hosts: Any = None,
@@ -212,27 +228,13 @@ class AsyncOpenSearch(Client):
         """
         super().__init__(hosts, transport_class, **kwargs)
 
-        # namespaced clients for compatibility with API names
-        self.ingestion = IngestionClient(self)
-        self.wlm = WlmClient(self)
-        self.list = ListClient(self)
-        self.insights = InsightsClient(self)
-        self.search_pipeline = SearchPipelineClient(self)
-        self.cat = CatClient(self)
-        self.cluster = ClusterClient(self)
-        self.dangling_indices = DanglingIndicesClient(self)
-        self.indices = IndicesClient(self)
-        self.ingest = IngestClient(self)
-        self.nodes = NodesClient(self)
-        self.remote = RemoteClient(self)
-        self.security = SecurityClient(self)
-        self.snapshot = SnapshotClient(self)
-        self.tasks = TasksClient(self)
-        self.remote_store = RemoteStoreClient(self)
-
-        self.features = FeaturesClient(self)
-        self.plugins = PluginsClient(self)
-        self.http = HttpClient(self)
+    def __getattr__(self, name: str) -> Any:
+        # plugins are reachable from the client itself, see PluginsClient
+        if name in PLUGINS:
+            return getattr(self.plugins, name)
+        raise AttributeError(
+            f"{self.__class__.__name__!r} object has no attribute {name!r}"
+        )
 
     def __repr__(self) -> Any:
         try:
@@ -10,109 +10,105 @@
 import warnings
 from typing import Any
 
-from ..plugins.alerting import AlertingClient
-from ..plugins.asynchronous_search import AsynchronousSearchClient
-from ..plugins.flow_framework import FlowFrameworkClient
-from ..plugins.geospatial import GeospatialClient
-from ..plugins.index_management import IndexManagementClient
-from ..plugins.knn import KnnClient
-from ..plugins.ltr import LtrClient
-from ..plugins.ml import MlClient
-from ..plugins.neural import NeuralClient
-from ..plugins.notifications import NotificationsClient
-from ..plugins.observability import ObservabilityClient
-from ..plugins.ppl import PplClient
-from ..plugins.query import QueryClient
-from ..plugins.replication import ReplicationClient
-from ..plugins.rollups import RollupsClient
-from ..plugins.search_relevance import SearchRelevanceClient
-from ..plugins.security_analytics import SecurityAnalyticsClient
-from ..plugins.sm import SmClient
-from ..plugins.sql import SqlClient
-from ..plugins.transforms import TransformsClient
-from ..plugins.ubi import UbiClient
 from .client import Client
-from .utils import NamespacedClient
+from .utils import LazyNamespace, NamespacedClient
+
+# plugin namespaces, also reachable as attributes of the client itself
+PLUGINS = (
+    "ubi",
+    "security_analytics",
+    "search_relevance",
+    "sm",
+    "neural",
+    "ltr",
+    "geospatial",
+    "replication",
+    "flow_framework",
+    "asynchronous_search",
+    "alerting",
+    "index_management",
+    "knn",
+    "ml",
+    "notifications",
+    "observability",
+    "ppl",
+    "query",
+    "rollups",
+    "sql",
+    "transforms",
+)
 
 
 class PluginsClient(NamespacedClient):
-    ubi: Any
-    security_analytics: Any
-    search_relevance: Any
-    sm: Any
-    neural: Any
-    ltr: Any
-    geospatial: Any
-    asynchronous_search: Any
-    alerting: Any
-    index_management: Any
-    knn: Any
-    ml: Any
-    notifications: Any
-    observability: Any
-    ppl: Any
-    query: Any
-    rollups: Any
-    sql: Any
-    transforms: Any
+    # the plugin clients are created when first used
+    ubi = LazyNamespace("opensearchpy._async.plugins.ubi", "UbiClient", nested=True)
+    security_analytics = LazyNamespace(
+        "opensearchpy._async.plugins.security_analytics",
+        "SecurityAnalyticsClient",
+        nested=True,
+    )
+    search_relevance = LazyNamespace(
+        "opensearchpy._async.plugins.search_relevance",
+        "SearchRelevanceClient",
+        nested=True,
+    )
+    sm = LazyNamespace("opensearchpy._async.plugins.sm", "SmClient", nested=True)
+    neural = LazyNamespace(
+        "opensearchpy._async.plugins.neural", "NeuralClient", nested=True
+    )
+    ltr = LazyNamespace("opensearchpy._async.plugins.ltr", "LtrClient", nested=True)
+    geospatial = LazyNamespace(
+        "opensearchpy._async.plugins.geospatial", "GeospatialClient", nested=True
+    )
+    replication = LazyNamespace(
+        "opensearchpy._async.plugins.replication", "ReplicationClient", nested=True
+    )
+    flow_framework = LazyNamespace(
+        "opensearchpy._async.plugins.flow_framework", "FlowFrameworkClient", nested=True
+    )
+    asynchronous_search = LazyNamespace(
+        "opensearchpy._async.plugins.asynchronous_search",
+        "AsynchronousSearchClient",
+        nested=True,
+    )
+    alerting = LazyNamespace(
+        "opensearchpy._async.plugins.alerting", "AlertingClient", nested=True
+    )
+    index_management = LazyNamespace(
+        "opensearchpy._async.plugins.index_management",
+        "IndexManagementClient",
+        nested=True,
+    )
+    knn = LazyNamespace("opensearchpy._async.plugins.knn", "KnnClient", nested=True)
+    ml = LazyNamespace("opensearchpy._async.plugins.ml", "MlClient", nested=True)
+    notifications = LazyNamespace(
+        "opensearchpy._async.plugins.notifications", "NotificationsClient", nested=True
+    )
+    observability = LazyNamespace(
+        "opensearchpy._async.plugins.observability", "ObservabilityClient", nested=True
+    )
+    ppl = LazyNamespace("opensearchpy._async.plugins.ppl", "PplClient", nested=True)
+    query = LazyNamespace(
+        "opensearchpy._async.plugins.query", "QueryClient", nested=True
+    )
+    rollups = LazyNamespace(
+        "opensearchpy._async.plugins.rollups", "RollupsClient", nested=True
+    )
+    sql = LazyNamespace("opensearchpy._async.plugins.sql", "SqlClient", nested=True)
+    transforms = LazyNamespace(
+        "opensearchpy._async.plugins.transforms", "TransformsClient", nested=True
+    )
 
     def __init__(self, client: Client) -> None:
         super().__init__(client)
 
-        self.ubi = UbiClient(client)
-        self.security_analytics = SecurityAnalyticsClient(client)
-        self.search_relevance = SearchRelevanceClient(client)
-        self.sm = SmClient(client)
-        self.neural = NeuralClient(client)
-        self.ltr = LtrClient(client)
-        self.geospatial = GeospatialClient(client)
-        self.replication = ReplicationClient(client)
-        self.flow_framework = FlowFrameworkClient(client)
-        self.asynchronous_search = AsynchronousSearchClient(client)
-        self.alerting = AlertingClient(client)
-        self.index_management = IndexManagementClient(client)
-        self.knn = KnnClient(client)
-        self.ml = MlClient(client)
-        self.notifications = NotificationsClient(client)
-        self.observability = ObservabilityClient(client)
-        self.ppl = PplClient(client)
-        self.query = QueryClient(client)
-        self.rollups = RollupsClient(client)
-        self.sql = SqlClient(client)
-        self.transforms = TransformsClient(client)
-
         self._dynamic_lookup(client)
 
     def _dynamic_lookup(self, client: Any) -> None:
         # Issue : https://github.com/opensearch-project/opensearch-py/issues/90#issuecomment-1003396742
-
-        plugins = [
-            "ubi",
-            "security_analytics",
-            "search_relevance",
-            "sm",
-            "neural",
-            "ltr",
-            "geospatial",
-            "replication",
-            "flow_framework",
-            "asynchronous_search",
-            "alerting",
-            "index_management",
-            "knn",
-            "ml",
-            "notifications",
-            "observability",
-            "ppl",
-            "query",
-            "rollups",
-            "sql",
-            "transforms",
-        ]
-        for plugin in plugins:
-            if not hasattr(client, plugin):
-                setattr(client, plugin, getattr(self, plugin))
-            else:
+        # the client forwards the other plugin names here in __getattr__
+        for plugin in PLUGINS:
+            if plugin in vars(client) or hasattr(type(client), plugin):
                 warnings.warn(
                     f"Cannot load `{plugin}` directly to {self.client.__class__.__name__} as it already exists. Use `{self.client.__class__.__name__}.plugin.{plugin}` instead.",
                     category=RuntimeWarning,
@@ -28,6 +28,7 @@
 from ...client.utils import NamespacedClient  # noqa
 from ...client.utils import (
     SKIP_IN_PATH,
+    LazyNamespace,
     _bulk_body,
     _escape,
     _make_path,
@@ -38,6 +39,7 @@ from ...client.utils import (
 __all__ = [
     "SKIP_IN_PATH",
     "NamespacedClient",
+    "LazyNamespace",
     "_make_path",
     "query_params",
     "_bulk_body",
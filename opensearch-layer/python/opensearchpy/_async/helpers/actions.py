@@ -30,6 +30,7 @@
 # See the LICENSE file in the project root for more information
 
 import asyncio
+import gzip
 import logging
 from typing import (
     Any,
@@ -44,12 +45,15 @@ from typing import (
     Union,
 )
 
-from ...compat import map
+from ...connection.compression import GzipBody
 from ...exceptions import TransportError
 from ...helpers.actions import (
     _ActionChunker,
+    _add_retry,
+    _bulk_request_body,
     _process_bulk_chunk_error,
     _process_bulk_chunk_success,
+    _retry_body,
     expand_action,
 )
 from ...helpers.errors import ScanError
@@ -58,14 +62,23 @@ logger: logging.Logger = logging.getLogger("opensearchpy.helpers")
 
 
 async def _chunk_actions(
-    actions: Any, chunk_size: int, max_chunk_bytes: int, serializer: Any
+    actions: Any,
+    chunk_size: int,
+    max_chunk_bytes: int,
+    serializer: Any,
+    retain_payloads: bool = True,
+    compress_level: Optional[int] = None,
 ) -> AsyncGenerator[Any, None]:
     """
-    Split actions into chunks by number or size, serialize them into strings in
+    Split actions into chunks by number or size, serialize them into bytes in
     the process.
     """
     chunker = _ActionChunker(
-        chunk_size=chunk_size, max_chunk_bytes=max_chunk_bytes, serializer=serializer
+        chunk_size=chunk_size,
+        max_chunk_bytes=max_chunk_bytes,
+        serializer=serializer,
+        retain_payloads=retain_payloads,
+        compress_level=compress_level,
     )
     async for action, data in actions:
         ret = chunker.feed(action, data)
@@ -94,7 +107,7 @@ async def _process_bulk_chunk(
 
     try:
         # send the actual request
-        resp = await client.bulk(body="\n".join(bulk_actions) + "\n", *args, **kwargs)
+        resp = await client.bulk(body=_bulk_request_body(bulk_actions), *args, **kwargs)
     except TransportError as e:
         gen = _process_bulk_chunk_error(
             error=e,
@@ -158,6 +171,8 @@ async def async_streaming_bulk(
     max_backoff: Union[float, int] = 600,
     yield_ok: bool = True,
     ignore_status: Any = (),
+    retain_payloads: bool = True,
+    compress_level: Optional[int] = None,
     *args: Any,
     **kwargs: Any
 ) -> AsyncGenerator[Tuple[bool, Any], None]:
@@ -193,18 +208,32 @@ async def async_streaming_bulk(
     :arg max_backoff: maximum number of seconds a retry will wait
     :arg yield_ok: if set to False will skip successful documents in the output
     :arg ignore_status: list of HTTP status code that you want to ignore
+    :arg retain_payloads: if set to False the raw actions and documents are
+        not kept while their chunk is in flight; failed items then carry their
+        ``position`` in ``actions`` instead of the original ``data``
+    :arg compress_level: gzip level (``1``-``9``) to compress each chunk
+        with while it is being built, so it is sent with ``Content-Encoding:
+        gzip`` whatever the connection's ``http_compress``;
+        ``max_chunk_bytes`` still counts uncompressed bytes
     """
 
     async def map_actions() -> Any:
         async for item in aiter(actions):
             yield expand_action_callback(item)
 
+    serializer = client.transport.serializer
     async for bulk_data, bulk_actions in _chunk_actions(
-        map_actions(), chunk_size, max_chunk_bytes, client.transport.serializer
+        map_actions(),
+        chunk_size,
+        max_chunk_bytes,
+        serializer,
+        retain_payloads,
+        compress_level,
     ):
         for attempt in range(max_retries + 1):
-            to_retry: Any = []
+            to_retry = bytearray()
             to_retry_data: Any = []
+            retry_source = bulk_actions
             if attempt:
                 await asyncio.sleep(
                     min(max_backoff, initial_backoff * 2 ** (attempt - 1))
@@ -233,12 +262,14 @@ async def async_streaming_bulk(
                             and info["status"] == 429
                             and (attempt + 1) <= max_retries
                         ):
-                            # _process_bulk_chunk expects strings so we need to
-                            # re-serialize the data
-                            to_retry.extend(
-                                map(client.transport.serializer.dumps, data)
+                            if not retain_payloads and isinstance(
+                                retry_source, GzipBody
+                            ):
+                                # once per chunk, to copy the actions out of it
+                                retry_source = gzip.decompress(retry_source)
+                            to_retry_data.append(
+                                _add_retry(serializer, to_retry, retry_source, data)
                             )
-                            to_retry_data.append(data)
                         else:
                             yield ok, {action: info}
                     elif yield_ok:
@@ -252,7 +283,8 @@ async def async_streaming_bulk(
                 if not to_retry:
                     break
                 # retry only subset of documents that didn't succeed
-                bulk_actions, bulk_data = to_retry, to_retry_data
+                bulk_actions = _retry_body(to_retry, compress_level)
+                bulk_data = to_retry_data
 
 
 async def async_bulk(
@@ -312,6 +344,46 @@ async def async_bulk(
     return success, failed if stats_only else errors
 
 
+_END = object()
+
+
+async def _prefetch(iterator: Any, depth: int) -> AsyncGenerator[Any, None]:
+    """
+    Iterate the async ``iterator`` in a background task that stays up to
+    ``depth`` items ahead of the consumer. Errors are re-raised in the
+    consumer.
+    """
+    items: Any = asyncio.Queue(depth)
+
+    async def _run() -> None:
+        try:
+            async for item in iterator:
+                await items.put((item, None))
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            await items.put((None, e))
+            return
+        await items.put((_END, None))
+
+    task = asyncio.ensure_future(_run())
+    try:
+        while True:
+            item, error = await items.get()
+            if error is not None:
+                raise error
+            if item is _END:
+                return
+            yield item
+    finally:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        await iterator.aclose()
+
+
 async def async_scan(
     client: Any,
     query: Any = None,
@@ -322,6 +394,7 @@ async def async_scan(
     request_timeout: Any = None,
     clear_scroll: bool = True,
     scroll_kwargs: Any = None,
+    prefetch: int = 0,
     **kwargs: Any
 ) -> Any:
     """
@@ -352,6 +425,9 @@ async def async_scan(
         to true.
     :arg scroll_kwargs: additional kwargs to be passed to
         :meth:`~opensearchpy.AsyncOpenSearch.scroll`
+    :arg prefetch: number of pages to fetch ahead in a background task while
+        earlier ones are being consumed, 0 (default) to fetch each page only
+        once the previous one has been consumed
 
     Any additional keyword arguments will be passed to the initial
     :meth:`~opensearchpy.AsyncOpenSearch.search` call::
@@ -383,16 +459,22 @@ async def async_scan(
         for key, val in transport_kwargs.items():
             scroll_kwargs.setdefault(key, val)
 
-    # initial search
-    resp = await client.search(
-        body=query, scroll=scroll, size=size, request_timeout=request_timeout, **kwargs
-    )
-    scroll_id = resp.get("_scroll_id")
+    scroll_id = None
+
+    async def _pages() -> Any:
+        nonlocal scroll_id
+        # initial search
+        resp = await client.search(
+            body=query,
+            scroll=scroll,
+            size=size,
+            request_timeout=request_timeout,
+            **kwargs
+        )
+        scroll_id = resp.get("_scroll_id")
 
-    try:
         while scroll_id and resp.get("hits", {}).get("hits"):
-            for hit in resp.get("hits", {}).get("hits", []):
-                yield hit
+            yield resp.get("hits", {}).get("hits", [])
 
             _shards = resp.get("_shards")
 
@@ -426,7 +508,17 @@ async def async_scan(
             )
             scroll_id = resp.get("_scroll_id")
 
+    pages = _pages()
+    if prefetch:
+        pages = _prefetch(pages, prefetch)
+    try:
+        async for hits in pages:
+            for hit in hits:
+                yield hit
+
     finally:
+        # stops a prefetching task before its scroll is cleared
+        await pages.aclose()
         if scroll_id and clear_scroll:
             await client.clear_scroll(
                 body={"scroll_id": [scroll_id]},
@@ -285,7 +285,7 @@ class AIOHttpConnection(AsyncConnection):
         if headers:
             req_headers.update(headers)
 
-        if self.http_compress and body:
+        if self._compresses(body):
             body = self._gzip_compress(body)
             req_headers["content-encoding"] = "gzip"
 
@@ -299,7 +299,10 @@ class AIOHttpConnection(AsyncConnection):
                 timeout=timeout,
                 fingerprint=self.ssl_assert_fingerprint,
             ) as response:
-                raw_data = await response.text()
+                if self.response_as_bytes:
+                    raw_data = await response.read()
+                else:
+                    raw_data = await response.text()
                 duration = self.loop.time() - start
 
         # We want to reraise a cancellation or recursion error.
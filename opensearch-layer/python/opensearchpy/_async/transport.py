@@ -340,6 +340,7 @@ class AsyncTransport(Transport):
         :arg connection: instance of :class:`~opensearchpy.Connection` that failed
         """
         self.connection_pool.mark_dead(connection)
+        self.metrics.connection_marked_dead(connection)
         if self.sniff_on_connection_fail:
             self.create_sniff_task()
 
@@ -388,15 +389,16 @@ class AsyncTransport(Transport):
             connection = self.get_connection()
 
             try:
-                status, headers_response, data = await connection.perform_request(
-                    method,
-                    url,
-                    params,
-                    body,
-                    headers=headers,
-                    ignore=ignore,
-                    timeout=timeout,
-                )
+                with self.connection_pool.track(connection):
+                    status, headers_response, data = await connection.perform_request(
+                        method,
+                        url,
+                        params,
+                        body,
+                        headers=headers,
+                        ignore=ignore,
+                        timeout=timeout,
+                    )
 
                 # Lowercase all the header names for consistency in accessing them.
                 headers_response = {
@@ -425,6 +427,7 @@ class AsyncTransport(Transport):
                     # raise exception on last retry
                     if attempt == self.max_retries:
                         raise e
+                    self.metrics.request_retried(method, url)
                 else:
                     raise e
 
@@ -0,0 +1,242 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any, Collection, Dict, Mapping, Optional, Set, Union
+from urllib.parse import unquote
+
+from .transport import Transport, _response_status, _streaming
+
+# responses worth caching: searches and counts, and single documents when
+# read with GET - POST or PUT to the same path writes the document
+_CACHEABLE = re.compile(r"/_(?:m?search|count)$")
+_CACHEABLE_GET = re.compile(r"^/[^_/][^/]*/_doc/[^/]+$")
+# apis that never modify an index, even when sent as POST or DELETE
+_READ_ONLY = re.compile(
+    r"/_(?:m?search|count|mget|field_caps|validate|explain|analyze)(?:/|$)"
+)
+# tag of responses that don't name their indices in the url
+_ALL = "_all"
+
+
+class CachingTransport(Transport):
+    """
+    :class:`~opensearchpy.Transport` that keeps deserialized successful
+    (``2xx``) responses of ``_search``, ``_msearch``, ``_count`` and
+    ``GET /{index}/_doc/{id}`` requests for ``cache_ttl`` seconds, evicting the least recently used
+    ones once they exceed ``cache_max_bytes`` (as serialized JSON). The key
+    is a hash of the method, path, params, headers and serialized body.
+
+    Any other request that may modify data - every ``POST``, ``PUT`` or
+    ``DELETE`` outside the read-only apis - invalidates the cached
+    responses of the indices named in its url, or all of them if it names
+    none, such as ``_bulk``. Writes made by other clients, or through
+    aliases, are only seen once the entries expire or are dropped with
+    :meth:`invalidate`.
+
+    ::
+
+        client = OpenSearch(hosts, transport_class=CachingTransport, cache_ttl=30)
+
+    :arg cache_ttl: seconds a response is served from the cache
+    :arg cache_max_bytes: total size of the cached responses
+    """
+
+    def __init__(
+        self,
+        hosts: Any,
+        cache_ttl: float = 60.0,
+        cache_max_bytes: int = 64 * 1024 * 1024,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(hosts, **kwargs)
+        self.cache_ttl = cache_ttl
+        self.cache_max_bytes = cache_max_bytes
+        self.cache_size = 0
+        self.hits = 0
+        self.misses = 0
+
+        # key -> (expires, size, raw, tags)
+        self._entries: "OrderedDict[bytes, Any]" = OrderedDict()
+        # index name or pattern from the url -> keys cached under it
+        self._tags: Dict[str, Set[bytes]] = {}
+        # bumped on every invalidation so responses read before one aren't
+        # stored after it
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self, index: Optional[str] = None) -> None:
+        """
+        Drop the cached responses of ``index`` - and of the wildcard
+        patterns or multi-index requests it may be part of - or all of them.
+        """
+        with self._lock:
+            self._generation += 1
+            if index is None:
+                self._entries.clear()
+                self._tags.clear()
+                self.cache_size = 0
+                return
+            for tag in list(self._tags):
+                if (
+                    tag == _ALL
+                    or fnmatchcase(index, tag)
+                    or fnmatchcase(tag, index)
+                ):
+                    for key in list(self._tags.get(tag, ())):
+                        self._drop(key)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self.invalidate()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "bytes": self.cache_size,
+        }
+
+    def _perform_request(
+        self,
+        method: str,
+        url: str,
+        params: Any,
+        body: Any,
+        timeout: Optional[Union[int, float]],
+        ignore: Collection[int],
+        headers: Optional[Mapping[str, str]],
+    ) -> Any:
+        path = url.split("?", 1)[0]
+        if (
+            (
+                (method in ("GET", "POST") and _CACHEABLE.search(path))
+                or (method == "GET" and _CACHEABLE_GET.match(path))
+            )
+            and _streaming.get() is None
+            and not (params and "scroll" in params)
+        ):
+            return self._cached_request(
+                method, url, params, body, timeout, ignore, headers
+            )
+
+        if method in ("POST", "PUT", "DELETE") and not _READ_ONLY.search(path):
+            indices = _indices(path)
+            try:
+                return super()._perform_request(
+                    method, url, params, body, timeout, ignore, headers
+                )
+            finally:
+                # also after a failure, which may have been applied anyway
+                if indices == [_ALL]:
+                    self.invalidate()
+                else:
+                    for index in indices:
+                        self.invalidate(index)
+
+        return super()._perform_request(
+            method, url, params, body, timeout, ignore, headers
+        )
+
+    def _cached_request(
+        self,
+        method: str,
+        url: str,
+        params: Any,
+        body: Any,
+        timeout: Optional[Union[int, float]],
+        ignore: Collection[int],
+        headers: Optional[Mapping[str, str]],
+    ) -> Any:
+        key = hashlib.blake2b(
+            repr(
+                (
+                    method,
+                    url,
+                    sorted((k, str(v)) for k, v in params.items()) if params else (),
+                    sorted(headers.items()) if headers else (),
+                    tuple(ignore),
+                )
+            ).encode("utf-8")
+            + b"\0"
+            + (bytes(body) if body is not None else b""),
+            digest_size=16,
+        ).digest()
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                self._drop(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            generation = self._generation
+        if entry is not None:
+            return self.serializer.loads(entry[2])
+
+        data = super()._perform_request(
+            method, url, params, body, timeout, ignore, headers
+        )
+        # statuses passed in ignore are returned too, but aren't worth keeping:
+        # the missing document may be created by another process meanwhile
+        status = _response_status.get()
+        if status is None or not 200 <= status < 300:
+            return data
+        raw = _dumps(self.serializer, data)
+        if len(raw) > self.cache_max_bytes:
+            return data
+
+        tags = _indices(url.split("?", 1)[0])
+        with self._lock:
+            if generation != self._generation:
+                return data
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (now + self.cache_ttl, len(raw), raw, tags)
+            self.cache_size += len(raw)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while self.cache_size > self.cache_max_bytes:
+                self._drop(next(iter(self._entries)))
+        return data
+
+    def _drop(self, key: bytes) -> None:
+        _, size, _, tags = self._entries.pop(key)
+        self.cache_size -= size
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+def _indices(path: str) -> Any:
+    # "/photos,logs-*/_search" -> ["photos", "logs-*"]; "/_bulk" -> ["_all"]
+    target = path.lstrip("/").split("/", 1)[0]
+    if not target or target.startswith("_"):
+        return [_ALL]
+    return [unquote(index) for index in target.split(",")]
+
+
+def _dumps(serializer: Any, data: Any) -> bytes:
+    dumps_bytes = getattr(serializer, "dumps_bytes", None)
+    if dumps_bytes is not None:
+        return bytes(dumps_bytes(data))
+    return serializer.dumps(data).encode("utf-8")  # type: ignore
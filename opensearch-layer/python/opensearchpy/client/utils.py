@@ -29,11 +29,13 @@ import base64
 import weakref
 from datetime import date, datetime
 from functools import wraps
+from importlib import import_module
 from typing import Any, Callable, Optional
 
 from opensearchpy.serializer import Serializer
 
 from ..compat import quote, string_types, to_bytes, to_str, unquote, urlparse
+from ..connection.compression import GzipBody
 
 # parts of URL to be omitted
 SKIP_IN_PATH: Any = (None, "", b"", [], ())
@@ -181,9 +183,21 @@ def query_params(*opensearch_query_params: Any) -> Callable:  # type: ignore
 
 
 def _bulk_body(serializer: Optional[Serializer], body: Any) -> Any:
+    # a prebuilt buffer (as made by the bulk helpers) is sent without copying
+    if isinstance(body, GzipBody):
+        return body
+    if isinstance(body, (bytearray, memoryview)):
+        if body[-1:] != b"\n":
+            body = bytes(body) + b"\n"
+        return body
+
     # if not passed in a string, serialize items and join by newline
     if not isinstance(body, string_types):
-        body = "\n".join(map(serializer.dumps, body))  # type: ignore
+        dumps_bytes = getattr(serializer, "dumps_bytes", None)
+        if dumps_bytes is not None:
+            body = b"\n".join(map(dumps_bytes, body))
+        else:
+            body = "\n".join(map(serializer.dumps, body))  # type: ignore
 
     # bulk body must end with a newline
     if isinstance(body, bytes):
@@ -214,6 +228,36 @@ class NamespacedClient:
         return self.client.transport
 
 
+class LazyNamespace:
+    """
+    Class attribute holding the namespaced client ``name`` of ``module``,
+    which is only imported and created the first time the attribute is read
+    from an instance; the result is then stored on the instance.
+
+    :arg module: absolute name of the module defining the client class
+    :arg name: name of the client class
+    :arg nested: pass the instance's own ``client`` to the namespaced client
+        instead of the instance, for namespaces within namespaces
+    """
+
+    def __init__(self, module: str, name: str, nested: bool = False) -> None:
+        self.module = module
+        self.name = name
+        self.nested = nested
+        self.attr = name
+
+    def __set_name__(self, owner: Any, attr: str) -> None:
+        self.attr = attr
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        cls = getattr(import_module(self.module), self.name)
+        namespace = cls(instance.client if self.nested else instance)
+        # later reads find the instance attribute before this descriptor
+        return instance.__dict__.setdefault(self.attr, namespace)
+
+
 class AddonClient(NamespacedClient):
     @classmethod
     def infect_client(cls: Any, client: NamespacedClient) -> NamespacedClient:
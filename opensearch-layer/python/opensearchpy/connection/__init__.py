@@ -25,22 +25,47 @@
 #  under the License.
 
 
+from importlib import import_module
+from importlib.util import find_spec
+from typing import Any
+
 from .base import Connection
-from .http_requests import RequestsHttpConnection
 from .http_urllib3 import Urllib3HttpConnection, create_ssl_context
 
+# connection classes imported when first used, as they pull in requests, h2
+# or aiohttp
+_LAZY = {
+    "Http2Connection": ".http2",
+    "RequestsHttpConnection": ".http_requests",
+    "AsyncHttpConnection": ".http_async",
+}
+
 __all__ = [
     "Connection",
+    "Http2Connection",
     "RequestsHttpConnection",
     "Urllib3HttpConnection",
     "create_ssl_context",
 ]
 
-try:
-    from .http_async import AsyncHttpConnection
-
+if find_spec("aiohttp") is not None:
     __all__ += [
         "AsyncHttpConnection",
     ]
-except (ImportError, SyntaxError):
-    pass
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = import_module(_LAZY[name], __name__)
+    except (ImportError, SyntaxError) as e:
+        if name != "AsyncHttpConnection":
+            raise
+        raise AttributeError(f"{name} needs aiohttp: {e}") from e
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__() -> Any:
+    return sorted(set(globals()) | set(__all__))
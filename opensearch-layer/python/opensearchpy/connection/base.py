@@ -25,7 +25,6 @@
 #  under the License.
 
 import gzip
-import io
 import logging
 import os
 import re
@@ -40,6 +39,8 @@ except ImportError:
 
 from .._version import __versionstr__
 from ..exceptions import HTTP_EXCEPTIONS, OpenSearchWarning, TransportError
+from .compression import DEFAULT_LEVEL, GzipBody, gzip_compress
+from .streaming import DEFAULT_SPILL_THRESHOLD
 
 logger = logging.getLogger("opensearch")
 
@@ -67,8 +68,15 @@ class Connection:
     :arg url_prefix: optional url prefix for opensearch
     :arg timeout: default timeout in seconds (float, default: 10)
     :arg http_compress: Use gzip compression
+    :arg http_compress_level: gzip compression level of request bodies, from
+        ``1`` (fastest) to ``9`` (smallest, default)
+    :arg http_compress_threads: number of threads compressing request bodies
+        larger than 1MiB in parallel blocks (default: 1)
     :arg opaque_id: Send this value in the 'X-Opaque-Id' HTTP header
         For tracing all requests made by this transport.
+    :arg response_as_bytes: return response bodies as undecoded ``bytes``
+        instead of ``str``. The JSON serializer parses them directly and they
+        are only decoded for logging when a handler is enabled.
     """
 
     def __init__(
@@ -80,7 +88,10 @@ class Connection:
         timeout: int = 10,
         headers: Optional[Dict[str, str]] = None,
         http_compress: Optional[bool] = None,
+        http_compress_level: int = DEFAULT_LEVEL,
+        http_compress_threads: int = 1,
         opaque_id: Optional[str] = None,
+        response_as_bytes: bool = False,
         **kwargs: Any,
     ) -> None:
         if port is None:
@@ -114,6 +125,10 @@ class Connection:
             use_ssl = True
         self.use_ssl = use_ssl
         self.http_compress = http_compress or False
+        if not 0 <= http_compress_level <= 9:
+            raise ValueError("http_compress_level must be between 0 and 9")
+        self.http_compress_level = http_compress_level
+        self.http_compress_threads = http_compress_threads
 
         self.scheme = scheme
         self.hostname = host
@@ -128,6 +143,7 @@ class Connection:
             url_prefix = "/" + url_prefix.strip("/")
         self.url_prefix = url_prefix
         self.timeout = timeout
+        self.response_as_bytes = response_as_bytes
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}: {self.host}>"
@@ -145,11 +161,19 @@ class Connection:
     def __hash__(self) -> int:
         return id(self)
 
-    def _gzip_compress(self, body: Any) -> bytes:
-        buf = io.BytesIO()
-        with gzip.GzipFile(fileobj=buf, mode="wb") as f:
-            f.write(body)
-        return buf.getvalue()
+    def _decode_response(self, data: bytes) -> Union[str, bytes]:
+        if self.response_as_bytes:
+            return data
+        return data.decode("utf-8", "surrogatepass")
+
+    def _compresses(self, body: Any) -> bool:
+        # bodies compressed up front (e.g. by the bulk helpers) are always sent as gzip
+        return bool(body) and (self.http_compress or isinstance(body, GzipBody))
+
+    def _gzip_compress(self, body: Any) -> GzipBody:
+        if isinstance(body, GzipBody):
+            return body
+        return gzip_compress(body, self.http_compress_level, self.http_compress_threads)
 
     def _raise_warnings(self, warning_headers: Any) -> None:
         """If 'headers' contains a 'Warning' header raise
@@ -180,22 +204,30 @@ class Connection:
 
     def _pretty_json(self, data: Union[str, bytes]) -> str:
         # pretty JSON in tracer curl logs
+        if isinstance(data, (bytearray, memoryview)):
+            data = bytes(data)
         try:
             return json.dumps(
                 json.loads(data), sort_keys=True, indent=2, separators=(",", ": ")
             ).replace("'", r"\u0027")
         except (ValueError, TypeError):
             # non-json data or a bulk request
-            return data  # type: ignore
+            if isinstance(data, bytes):
+                return data.decode("utf-8", "ignore")
+            return data
 
     def _log_request_response(
-        self, body: Optional[Union[str, bytes]], response: Optional[str]
+        self, body: Optional[Union[str, bytes]], response: Optional[Union[str, bytes]]
     ) -> None:
         if logger.isEnabledFor(logging.DEBUG):
-            if body and isinstance(body, bytes):
-                body = body.decode("utf-8", "ignore")
+            if isinstance(body, GzipBody):
+                body = gzip.decompress(body)
+            if body and isinstance(body, (bytes, bytearray, memoryview)):
+                body = bytes(body).decode("utf-8", "ignore")
             logger.debug("> %s", body)
             if response is not None:
+                if isinstance(response, bytes):
+                    response = response.decode("utf-8", "surrogatepass")
                 logger.debug("< %s", response)
 
     def _log_trace(
@@ -204,12 +236,15 @@ class Connection:
         path: str,
         body: Optional[Union[str, bytes]],
         status_code: Optional[int],
-        response: Optional[str],
+        response: Optional[Union[str, bytes]],
         duration: Optional[float],
     ) -> None:
         if not tracer.isEnabledFor(logging.INFO) or not tracer.handlers:
             return
 
+        if isinstance(body, GzipBody):
+            body = gzip.decompress(body)
+
         # include pretty in trace curls
         path = path.replace("?", "?pretty&", 1) if "?" in path else path + "?pretty"
         if self.url_prefix:
@@ -242,6 +277,26 @@ class Connection:
     ) -> Any:
         raise NotImplementedError()
 
+    def perform_streaming_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        body: Optional[bytes] = None,
+        timeout: Optional[Union[int, float]] = None,
+        ignore: Collection[int] = (),
+        headers: Optional[Mapping[str, str]] = None,
+        loads: Any = None,
+        spill_threshold: int = DEFAULT_SPILL_THRESHOLD,
+    ) -> Any:
+        """
+        Like :meth:`perform_request`, but returns the body unread as a
+        :class:`~opensearchpy.connection.streaming.StreamingResponse` that
+        parses it with ``loads(data, content_type)``. Error responses are
+        read in full and raised as usual.
+        """
+        raise NotImplementedError()
+
     def log_request_success(
         self,
         method: str,
@@ -249,11 +304,12 @@ class Connection:
         path: str,
         body: Any,
         status_code: int,
-        response: str,
+        response: Union[str, bytes],
         duration: float,
     ) -> None:
         """Log a successful API call."""
         #  TODO: optionally pass in params instead of full_url and do urlencode only when needed
+        self._record_request(method, path, body, status_code, response, duration)
 
         logger.info(
             "%s %s [status:%s request:%.3fs]", method, full_url, status_code, duration
@@ -270,10 +326,11 @@ class Connection:
         body: Any,
         duration: float,
         status_code: Optional[int] = None,
-        response: Optional[str] = None,
+        response: Optional[Union[str, bytes]] = None,
         exception: Optional[Exception] = None,
     ) -> None:
         """Log an unsuccessful API call."""
+        self._record_request(method, path, body, status_code, response, duration)
         # do not log 404s on HEAD requests
         if method == "HEAD" and status_code == 404:
             return
@@ -289,6 +346,26 @@ class Connection:
         self._log_request_response(body, response)
         self._log_trace(method, path, body, status_code, response, duration)
 
+    def _record_request(
+        self,
+        method: str,
+        path: str,
+        body: Any,
+        status_code: Optional[int],
+        response: Any,
+        duration: float,
+    ) -> None:
+        metrics = getattr(self, "metrics", None)
+        if metrics is not None:
+            metrics.request_completed(
+                method,
+                path,
+                status_code,
+                duration,
+                _byte_length(body),
+                _byte_length(response),
+            )
+
     def _raise_error(
         self,
         status_code: int,
@@ -296,6 +373,8 @@ class Connection:
         content_type: Optional[str] = None,
     ) -> None:
         """Locate appropriate exception and raise it."""
+        if isinstance(raw_data, bytes):
+            raw_data = raw_data.decode("utf-8", "surrogatepass")
         error_message = raw_data
         additional_info = None
         try:
@@ -337,3 +416,12 @@ class Connection:
                 pass
 
         return ca_certs
+
+
+def _byte_length(data: Any) -> int:
+    # str bodies and responses count their UTF-8 size, not characters
+    if not data:
+        return 0
+    if isinstance(data, str) and not data.isascii():
+        return len(data.encode("utf-8", "surrogatepass"))
+    return len(data)
@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import hashlib
+import struct
+import zlib
+from typing import Any, List
+
+DEFAULT_LEVEL = 9
+# bodies are split into blocks of this size to be compressed in parallel
+DEFAULT_BLOCK_SIZE = 1024 * 1024
+# deflate back-references reach at most this far
+_WINDOW_SIZE = 32 * 1024
+# magic, deflate, no flags, no mtime
+_GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00"
+# unknown OS, as zlib writes it
+_GZIP_OS = b"\xff"
+
+
+class GzipBody(bytes):
+    """
+    A gzip compressed request body, sent as-is with ``Content-Encoding:
+    gzip`` by every connection class. ``sha256`` is the hex digest of the
+    compressed bytes, computed while they were produced, which the AWS
+    signers use instead of hashing the body again.
+    """
+
+    sha256: str
+
+
+class GzipWriter:
+    """
+    Compresses a body incrementally as it is written, so it can be built and
+    compressed in a single pass. :meth:`close` returns the :class:`GzipBody`.
+    """
+
+    def __init__(self, level: int = DEFAULT_LEVEL) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        self._parts: List[bytes] = []
+        self._digest = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: Any) -> None:
+        self.size += len(data)
+        self._append(self._compressor.compress(data))
+
+    def close(self) -> GzipBody:
+        self._append(self._compressor.flush())
+        return _body(self._parts, self._digest)
+
+    def _append(self, compressed: bytes) -> None:
+        if compressed:
+            self._parts.append(compressed)
+            self._digest.update(compressed)
+
+
+def gzip_compress(
+    data: Any,
+    level: int = DEFAULT_LEVEL,
+    threads: int = 1,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> GzipBody:
+    """
+    Compress ``data`` into a :class:`GzipBody`.
+
+    With more than one thread, bodies larger than ``block_size`` are split
+    into blocks that are deflated in parallel, as pigz does: every block is
+    primed with the 32KiB before it, so the ratio barely changes, and all but
+    the last end on a byte boundary so the blocks can simply be joined.
+    zlib releases the GIL while compressing, so the threads run in parallel.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8", "surrogatepass")
+    view = memoryview(data).cast("B")
+    if threads <= 1 or len(view) <= block_size:
+        writer = GzipWriter(level)
+        writer.write(view)
+        return writer.close()
+
+    # imported here so connections that never compress in parallel don't pay for it
+    from concurrent.futures import ThreadPoolExecutor
+
+    def deflate(start: int) -> bytes:
+        compressor = zlib.compressobj(
+            level,
+            zlib.DEFLATED,
+            -zlib.MAX_WBITS,
+            zdict=view[max(start - _WINDOW_SIZE, 0) : start] if start else b"",
+        )
+        end = start + block_size
+        last = end >= len(view)
+        return compressor.compress(view[start:end]) + compressor.flush(
+            zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH
+        )
+
+    with ThreadPoolExecutor(threads) as executor:
+        crc = executor.submit(zlib.crc32, view)
+        blocks = executor.map(deflate, range(0, len(view), block_size))
+
+        digest = hashlib.sha256()
+        xfl = b"\x02" if level == 9 else b"\x04" if level == 1 else b"\x00"
+        parts = [_GZIP_HEADER + xfl + _GZIP_OS]
+        digest.update(parts[0])
+        # hash each block as soon as it's ready, while later ones compress
+        for block in blocks:
+            parts.append(block)
+            digest.update(block)
+        parts.append(struct.pack("<II", crc.result(), len(view) & 0xFFFFFFFF))
+        digest.update(parts[-1])
+    return _body(parts, digest)
+
+
+def _body(parts: List[bytes], digest: Any) -> GzipBody:
+    body = GzipBody(b"".join(parts))
+    body.sha256 = digest.hexdigest()
+    return body
@@ -0,0 +1,615 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import gzip
+import logging
+import os
+import socket
+import ssl
+import threading
+import time
+import zlib
+from typing import Any, Collection, Dict, List, Mapping, Optional, Union
+
+import urllib3
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.errors
+    import h2.events
+    import h2.settings
+
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+from ..compat import reraise_exceptions, urlencode
+from ..exceptions import (
+    ConnectionError,
+    ConnectionTimeout,
+    ImproperlyConfigured,
+    SSLError,
+)
+from .http_urllib3 import (
+    SSL_SHOW_WARN_DEFAULT,
+    VERIFY_CERTS_DEFAULT,
+    Urllib3HttpConnection,
+)
+
+logger = logging.getLogger("opensearch")
+
+# flow control window advertised for each stream and the whole connection
+_WINDOW = 16 * 1024 * 1024
+_READ_SIZE = 256 * 1024
+# connection-specific headers, forbidden in HTTP/2
+_HOP_BY_HOP = frozenset(
+    (
+        "connection",
+        "host",
+        "keep-alive",
+        "proxy-connection",
+        "te",
+        "transfer-encoding",
+        "upgrade",
+    )
+)
+
+
+class Http2Connection(Urllib3HttpConnection):
+    """
+    Connection class that multiplexes concurrent requests as HTTP/2 streams
+    over a single TLS connection to the node, instead of opening a socket
+    and TLS session per concurrent request. Requires the ``h2`` package.
+
+    ``h2`` is offered alongside ``http/1.1`` through ALPN. When the node
+    doesn't pick it - or the connection isn't TLS, or a custom
+    ``ssl_context`` or ``ssl_assert_fingerprint`` is configured - requests
+    are sent over HTTP/1.1 exactly as by
+    :class:`~opensearchpy.Urllib3HttpConnection`, which also handles
+    streaming requests. Authentication, including
+    :class:`~opensearchpy.Urllib3AWSV4SignerAuth`, and compression work the
+    same in both cases.
+
+    Takes the same arguments as :class:`~opensearchpy.Urllib3HttpConnection`,
+    and:
+
+    :arg max_concurrent_streams: maximum number of requests in flight over
+        the connection, lowered to the node's own limit if that is smaller
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: Optional[int] = None,
+        verify_certs: Any = VERIFY_CERTS_DEFAULT,
+        ssl_show_warn: Any = SSL_SHOW_WARN_DEFAULT,
+        ca_certs: Any = None,
+        client_cert: Any = None,
+        client_key: Any = None,
+        ssl_assert_hostname: Any = None,
+        ssl_assert_fingerprint: Any = None,
+        ssl_context: Any = None,
+        max_concurrent_streams: int = 100,
+        **kwargs: Any,
+    ) -> None:
+        if not H2_AVAILABLE:
+            raise ImproperlyConfigured("Please install h2 to use Http2Connection.")
+
+        super().__init__(
+            host=host,
+            port=port,
+            verify_certs=verify_certs,
+            ssl_show_warn=ssl_show_warn,
+            ca_certs=ca_certs,
+            client_cert=client_cert,
+            client_key=client_key,
+            ssl_assert_hostname=ssl_assert_hostname,
+            ssl_assert_fingerprint=ssl_assert_fingerprint,
+            ssl_context=ssl_context,
+            **kwargs,
+        )
+        self.max_concurrent_streams = max_concurrent_streams
+
+        self._tls_context = None
+        if self.use_ssl and ssl_context is None and ssl_assert_fingerprint is None:
+            self._tls_context = _h2_ssl_context(
+                verify_certs is VERIFY_CERTS_DEFAULT or bool(verify_certs),
+                self.default_ca_certs() if ca_certs is None else ca_certs,
+                client_cert,
+                client_key,
+                ssl_assert_hostname is not False,
+            )
+        self._server_hostname = (
+            ssl_assert_hostname
+            if isinstance(ssl_assert_hostname, str)
+            else self.hostname
+        )
+        # the default port is left out of the authority, as urllib3 leaves
+        # it out of the Host header, so that SigV4 signatures match
+        self._authority = (
+            f"[{self.hostname}]" if ":" in self.hostname else self.hostname
+        )
+        if self.port not in (None, 443):
+            self._authority += f":{self.port}"
+        self._session: Optional[_H2Session] = None
+        # sessions replaced after a GOAWAY, still finishing their streams
+        self._draining: List[_H2Session] = []
+        self._session_lock = threading.Lock()
+        # set once the node has declined h2; HTTP/1.1 from then on
+        self._http11 = self._tls_context is None
+
+    def perform_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        body: Optional[bytes] = None,
+        timeout: Optional[Union[int, float]] = None,
+        ignore: Collection[int] = (),
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Any:
+        session = None
+        if not self._http11:
+            try:
+                session = self._get_session()
+            except reraise_exceptions:
+                raise
+            except Exception as e:
+                self.log_request_fail(
+                    method, self.host + url, url, body, 0, exception=e
+                )
+                raise _connection_error(e)
+        if session is None:
+            return super().perform_request(
+                method, url, params, body, timeout, ignore, headers
+            )
+
+        url = self.url_prefix + url
+        if params:
+            url = f"{url}?{urlencode(params)}"
+
+        full_url = self.host + url
+
+        start = time.time()
+        orig_body = body
+        try:
+            request_headers, body = self._prepare_request(
+                method, full_url, body, headers
+            )
+
+            self.metrics.request_start()
+
+            status, response_headers, data = session.request(
+                method,
+                url,
+                self._authority,
+                request_headers,
+                body,
+                timeout or self.timeout,
+            )
+            duration = time.time() - start
+            encoding = response_headers.get("content-encoding")
+            if encoding == "gzip":
+                data = gzip.decompress(data)
+            elif encoding == "deflate":
+                data = zlib.decompress(data)
+            raw_data = self._decode_response(data)
+        except reraise_exceptions:
+            raise
+        except Exception as e:
+            self.log_request_fail(
+                method, full_url, url, orig_body, time.time() - start, exception=e
+            )
+            raise _connection_error(e)
+        finally:
+            self.metrics.request_end()
+
+        # raise warnings if any from the 'Warnings' header.
+        warning_headers = response_headers.get_all("warning", ())
+        self._raise_warnings(warning_headers)
+
+        # raise errors based on http status codes, let the client handle those if needed
+        if not (200 <= status < 300) and status not in ignore:
+            self.log_request_fail(
+                method, full_url, url, orig_body, duration, status, raw_data
+            )
+            self._raise_error(
+                status, raw_data, response_headers.get("content-type")
+            )
+
+        self.log_request_success(
+            method, full_url, url, orig_body, status, raw_data, duration
+        )
+
+        return status, response_headers, raw_data
+
+    def _get_session(self) -> Optional["_H2Session"]:
+        session = self._session
+        if session is not None and session.usable:
+            return session
+        with self._session_lock:
+            session = self._session
+            if session is not None and session.usable:
+                return session
+            if session is not None:
+                if session.error is None:
+                    # a draining session closes itself once its streams finish
+                    self._draining = [
+                        s for s in self._draining if s.error is None
+                    ] + [session]
+                else:
+                    session.close()
+            session = _H2Session.connect(
+                self.hostname,
+                self.port or 443,
+                self._tls_context,
+                self._server_hostname,
+                self.timeout,
+                self.max_concurrent_streams,
+            )
+            if session is None:
+                logger.info(
+                    "%s doesn't negotiate HTTP/2, using HTTP/1.1 instead", self.host
+                )
+                self._http11 = True
+            self._session = session
+            return session
+
+    def close(self) -> None:
+        """
+        Explicitly closes connection
+        """
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+            for session in self._draining:
+                session.close()
+            self._draining = []
+        super().close()
+
+
+def _connection_error(e: Exception) -> Exception:
+    if isinstance(e, ssl.SSLError):
+        return SSLError("N/A", str(e), e)
+    if isinstance(e, TimeoutError):
+        return ConnectionTimeout("TIMEOUT", str(e), e)
+    return ConnectionError("N/A", str(e), e)
+
+
+def _h2_ssl_context(
+    verify_certs: bool,
+    ca_certs: Any,
+    client_cert: Any,
+    client_key: Any,
+    check_hostname: bool,
+) -> ssl.SSLContext:
+    context = ssl.create_default_context()
+    if verify_certs:
+        if not ca_certs:
+            raise ImproperlyConfigured(
+                "Root certificates are missing for certificate "
+                "validation. Either pass them in using the ca_certs parameter or "
+                "install certifi to use it automatically."
+            )
+        if os.path.isdir(ca_certs):
+            context.load_verify_locations(capath=ca_certs)
+        else:
+            context.load_verify_locations(cafile=ca_certs)
+        context.check_hostname = check_hostname
+    else:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    if client_cert:
+        context.load_cert_chain(client_cert, client_key)
+    context.set_alpn_protocols(["h2", "http/1.1"])
+    return context
+
+
+class _Stream:
+    __slots__ = ("status", "headers", "data", "error", "done")
+
+    def __init__(self) -> None:
+        self.status = 0
+        self.headers: Any = None
+        self.data = bytearray()
+        self.error: Optional[Exception] = None
+        self.done = threading.Event()
+
+
+if H2_AVAILABLE:
+
+    class _DrainingH2Connection(h2.connection.H2Connection):  # type: ignore
+        """
+        h2 closes the connection as soon as a GOAWAY arrives and rejects every
+        frame after it, but the server still answers streams up to the
+        GOAWAY's last stream id (RFC 9113, section 6.8). The connection is
+        kept open for them; :class:`_H2Session` starts no new streams once
+        it is draining.
+        """
+
+        def _receive_goaway_frame(self, frame: Any) -> Any:
+            state = self.state_machine.state
+            frames, events = super()._receive_goaway_frame(frame)
+            if state == h2.connection.ConnectionState.CLIENT_OPEN:
+                self.state_machine.state = state
+            return frames, events
+
+
+class _H2Session:
+    """
+    One HTTP/2 connection shared by every thread. Requests encode their
+    frames under ``lock`` - HPACK needs header blocks sent in the order they
+    were encoded - and a reader thread hands the frames received to the
+    waiting streams.
+    """
+
+    def __init__(self, sock: Any, max_concurrent_streams: int) -> None:
+        self.sock = sock
+        self.max_concurrent_streams = max_concurrent_streams
+        self.conn = _DrainingH2Connection(
+            config=h2.config.H2Configuration(client_side=True, header_encoding=None)
+        )
+        self.lock = threading.Condition()
+        self.streams: Dict[int, _Stream] = {}
+        self.error: Optional[Exception] = None
+        # set on GOAWAY: streams in flight finish, no new ones start
+        self.draining = False
+
+        self.conn.initiate_connection()
+        self.conn.update_settings(
+            {
+                h2.settings.SettingCodes.ENABLE_PUSH: 0,
+                h2.settings.SettingCodes.INITIAL_WINDOW_SIZE: _WINDOW,
+            }
+        )
+        self.conn.increment_flow_control_window(_WINDOW - 65535)
+        self.sock.sendall(self.conn.data_to_send())
+
+        self._reader = threading.Thread(
+            target=self._read_loop, name="opensearch-h2-reader", daemon=True
+        )
+        self._reader.start()
+
+    @classmethod
+    def connect(
+        cls,
+        host: str,
+        port: int,
+        context: ssl.SSLContext,
+        server_hostname: str,
+        timeout: Optional[float],
+        max_concurrent_streams: int,
+    ) -> Optional["_H2Session"]:
+        """
+        Open a TLS connection and start HTTP/2 on it, or return ``None`` if
+        the server chose another protocol.
+        """
+        sock = socket.create_connection((host, port), timeout)
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            tls = context.wrap_socket(sock, server_hostname=server_hostname)
+        except BaseException:
+            sock.close()
+            raise
+        if tls.selected_alpn_protocol() != "h2":
+            tls.close()
+            return None
+        # the reader blocks until data arrives, requests time out on their own
+        tls.settimeout(None)
+        return cls(tls, max_concurrent_streams)
+
+    @property
+    def usable(self) -> bool:
+        return self.error is None and not self.draining
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        authority: str,
+        headers: Mapping[str, Any],
+        body: Any,
+        timeout: Optional[float],
+    ) -> Any:
+        deadline = time.monotonic() + timeout if timeout else None
+        stream = _Stream()
+        request_headers = [
+            (b":method", method.encode("ascii")),
+            (b":scheme", b"https"),
+            (b":authority", authority.encode("ascii")),
+            (b":path", path.encode("utf-8")),
+        ]
+        for name, value in headers.items():
+            name = name.lower()
+            if name not in _HOP_BY_HOP:
+                request_headers.append(
+                    (
+                        name.encode("ascii"),
+                        value if isinstance(value, bytes) else str(value).encode(),
+                    )
+                )
+
+        with self.lock:
+            while True:
+                self._check()
+                if self.draining:
+                    raise OSError("Connection is shutting down (GOAWAY)")
+                limit = min(
+                    self.max_concurrent_streams,
+                    self.conn.remote_settings.max_concurrent_streams,
+                )
+                if len(self.streams) < limit:
+                    break
+                self._wait(deadline)
+            stream_id = self.conn.get_next_available_stream_id()
+            self.streams[stream_id] = stream
+            self.conn.send_headers(stream_id, request_headers, end_stream=not body)
+            self._flush()
+
+        try:
+            if body:
+                self._send_body(stream_id, stream, body, deadline)
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if not stream.done.wait(remaining):
+                raise TimeoutError(f"No response within {timeout} seconds")
+        except BaseException:
+            self._cancel(stream_id)
+            raise
+
+        if stream.error is not None:
+            raise stream.error
+        response_headers = urllib3.HTTPHeaderDict()
+        for name, value in stream.headers:
+            if name != b":status":
+                response_headers.add(name.decode("ascii"), value.decode("latin-1"))
+        return stream.status, response_headers, bytes(stream.data)
+
+    def close(self) -> None:
+        with self.lock:
+            if self.error is None:
+                self.error = OSError("Connection closed")
+                try:
+                    self.conn.close_connection()
+                    self._flush()
+                except Exception:
+                    pass
+        self._close_socket()
+
+    def _close_socket(self) -> None:
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+    def _send_body(
+        self, stream_id: int, stream: _Stream, body: Any, deadline: Optional[float]
+    ) -> None:
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        view = memoryview(body).cast("B")
+        pos = 0
+        while pos < len(view):
+            with self.lock:
+                while True:
+                    if stream.done.is_set():
+                        # reset, or answered before the whole body was sent
+                        return
+                    self._check()
+                    window = self.conn.local_flow_control_window(stream_id)
+                    if window > 0:
+                        break
+                    self._wait(deadline)
+                # send as much as the window allows before letting go of the lock
+                while pos < len(view) and window > 0:
+                    size = min(window, self.conn.max_outbound_frame_size)
+                    chunk = bytes(view[pos : pos + size])
+                    pos += size
+                    self.conn.send_data(
+                        stream_id, chunk, end_stream=pos >= len(view)
+                    )
+                    window -= size
+                self._flush()
+
+    def _cancel(self, stream_id: int) -> None:
+        with self.lock:
+            if self.streams.pop(stream_id, None) is None or self.error is not None:
+                return
+            try:
+                self.conn.reset_stream(stream_id, h2.errors.ErrorCodes.CANCEL)
+                self._flush()
+            except Exception:
+                pass
+            self.lock.notify_all()
+            if self.draining and not self.streams:
+                # the last stream of a draining session; wakes up the reader
+                self._close_socket()
+
+    def _check(self) -> None:
+        if self.error is not None:
+            raise self.error
+
+    def _wait(self, deadline: Optional[float]) -> None:
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            raise TimeoutError("Timed out waiting for the HTTP/2 connection")
+        self.lock.wait(remaining)
+
+    def _flush(self) -> None:
+        data = self.conn.data_to_send()
+        if data:
+            try:
+                self.sock.sendall(data)
+            except OSError as e:
+                # frames may be half written, the connection can't be reused
+                if self.error is None:
+                    self.error = e
+                raise
+
+    def _read_loop(self) -> None:
+        try:
+            while True:
+                data = self.sock.recv(_READ_SIZE)
+                if not data:
+                    raise OSError("Connection closed by the server")
+                with self.lock:
+                    for event in self.conn.receive_data(data):
+                        self._handle(event)
+                    self._flush()
+                    self.lock.notify_all()
+        except Exception as e:
+            with self.lock:
+                if self.error is None:
+                    self.error = e
+                for stream in self.streams.values():
+                    stream.error = stream.error or e
+                    stream.done.set()
+                self.streams.clear()
+                self.lock.notify_all()
+            # nothing reads from the socket any more; draining sessions end here
+            self._close_socket()
+
+    def _handle(self, event: Any) -> None:
+        if isinstance(event, h2.events.ConnectionTerminated):
+            self.draining = True
+            error = OSError(f"Connection terminated by the server ({event.error_code!r})")
+            for stream_id in [
+                s for s in self.streams if s > (event.last_stream_id or 0)
+            ]:
+                stream = self.streams.pop(stream_id)
+                stream.error = error
+                stream.done.set()
+            if not self.streams:
+                raise error
+            return
+
+        stream = self.streams.get(getattr(event, "stream_id", 0))
+        if stream is None:
+            return
+        if isinstance(event, h2.events.ResponseReceived):
+            stream.headers = event.headers
+            for name, value in event.headers:
+                if name == b":status":
+                    stream.status = int(value)
+        elif isinstance(event, h2.events.DataReceived):
+            stream.data += event.data
+            self.conn.acknowledge_received_data(
+                event.flow_controlled_length, event.stream_id
+            )
+        elif isinstance(event, h2.events.StreamEnded):
+            del self.streams[event.stream_id]
+            stream.done.set()
+        elif isinstance(event, h2.events.StreamReset):
+            del self.streams[event.stream_id]
+            stream.error = OSError(f"Stream reset by the server ({event.error_code!r})")
+            stream.done.set()
+        if self.draining and not self.streams:
+            raise OSError("Connection terminated by the server")
@@ -31,6 +31,7 @@ from typing import Any, Collection, Mapping, MutableMapping, Optional, Union
 
 try:
     import requests
+    from urllib3.exceptions import HTTPError, ReadTimeoutError
 
     REQUESTS_AVAILABLE = True
 except ImportError:
@@ -46,6 +47,25 @@ from ..exceptions import (
     SSLError,
 )
 from .base import Connection
+from .streaming import DEFAULT_READ_SIZE, DEFAULT_SPILL_THRESHOLD, StreamingResponse
+from .timing import (
+    TimedHTTPConnectionPool,
+    TimedHTTPSConnectionPool,
+    current_timings,
+    mark_download,
+)
+
+
+if REQUESTS_AVAILABLE:
+
+    class _TimedHTTPAdapter(requests.adapters.HTTPAdapter):
+        # records RequestTimings like Urllib3HttpConnection does
+        def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = {
+                "http": TimedHTTPConnectionPool,
+                "https": TimedHTTPSConnectionPool,
+            }
 
 
 class RequestsHttpConnection(Connection):
@@ -109,9 +129,11 @@ class RequestsHttpConnection(Connection):
 
         # Mount http-adapter with custom connection-pool size. Default=10
         if pool_maxsize and isinstance(pool_maxsize, int):
-            pool_adapter = requests.adapters.HTTPAdapter(pool_maxsize=pool_maxsize)
-            self.session.mount("http://", pool_adapter)
-            self.session.mount("https://", pool_adapter)
+            pool_adapter = _TimedHTTPAdapter(pool_maxsize=pool_maxsize)
+        else:
+            pool_adapter = _TimedHTTPAdapter()
+        self.session.mount("http://", pool_adapter)
+        self.session.mount("https://", pool_adapter)
 
         super().__init__(
             host=host,
@@ -180,9 +202,12 @@ class RequestsHttpConnection(Connection):
             url = f"{url}?{urlencode(params or {})}"
 
         orig_body = body
-        if self.http_compress and body:
+        if self._compresses(body):
             body = self._gzip_compress(body)
             headers["content-encoding"] = "gzip"  # type: ignore
+        elif isinstance(body, (bytearray, memoryview)):
+            # requests would stream any other buffer type as an iterable
+            body = bytes(body)
 
         start = time.time()
         request = requests.Request(method=method, headers=headers, url=url, data=body)
@@ -199,7 +224,9 @@ class RequestsHttpConnection(Connection):
             self.metrics.request_start()
             response = self.session.send(prepared_request, **send_kwargs)
             duration = time.time() - start
-            raw_data = response.content.decode("utf-8", "surrogatepass")
+            # requests reads the body before send() returns
+            mark_download(current_timings.get())
+            raw_data = self._decode_response(response.content)
         except reraise_exceptions:
             raise
         except Exception as e:
@@ -257,6 +284,116 @@ class RequestsHttpConnection(Connection):
 
         return response.status_code, response.headers, raw_data
 
+    def perform_streaming_request(  # type: ignore
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        body: Optional[bytes] = None,
+        timeout: Optional[Union[int, float]] = None,
+        ignore: Collection[int] = (),
+        headers: Optional[Mapping[str, str]] = None,
+        loads: Any = None,
+        spill_threshold: int = DEFAULT_SPILL_THRESHOLD,
+    ) -> Any:
+        url = self.base_url + url
+        headers = headers or {}
+        if params:
+            url = f"{url}?{urlencode(params or {})}"
+
+        orig_body = body
+        if self._compresses(body):
+            body = self._gzip_compress(body)
+            headers["content-encoding"] = "gzip"  # type: ignore
+        elif isinstance(body, (bytearray, memoryview)):
+            body = bytes(body)
+
+        start = time.time()
+        request = requests.Request(method=method, headers=headers, url=url, data=body)
+        prepared_request = self.session.prepare_request(request)
+        settings = self.session.merge_environment_settings(
+            prepared_request.url, {}, None, None, None
+        )
+        send_kwargs: Any = {"timeout": timeout or self.timeout}
+        send_kwargs.update(settings)
+        # after the environment settings, which carry stream=None
+        send_kwargs["stream"] = True
+        try:
+            self.metrics.request_start()
+            response = self.session.send(prepared_request, **send_kwargs)
+            duration = time.time() - start
+        except reraise_exceptions:
+            raise
+        except Exception as e:
+            self.log_request_fail(
+                method,
+                url,
+                prepared_request.path_url,
+                orig_body,
+                time.time() - start,
+                exception=e,
+            )
+            if isinstance(e, requests.exceptions.SSLError):
+                raise SSLError("N/A", str(e), e)
+            if isinstance(e, requests.Timeout):
+                raise ConnectionTimeout("TIMEOUT", str(e), e)
+            raise ConnectionError("N/A", str(e), e)
+        finally:
+            self.metrics.request_end()
+
+        warnings_headers = (
+            (response.headers["warning"],) if "warning" in response.headers else ()
+        )
+        self._raise_warnings(warnings_headers)
+
+        content_type = response.headers.get("Content-Type")
+        if (
+            not (200 <= response.status_code < 300)
+            and response.status_code not in ignore
+        ):
+            try:
+                raw_data = self._decode_response(response.content)
+            finally:
+                response.close()
+            self.log_request_fail(
+                method,
+                url,
+                response.request.path_url,
+                orig_body,
+                duration,
+                response.status_code,
+                raw_data,
+            )
+            self._raise_error(response.status_code, raw_data, content_type)
+
+        self.log_request_success(
+            method,
+            url,
+            response.request.path_url,
+            orig_body,
+            response.status_code,
+            None,
+            duration,
+        )
+
+        def _release(complete: bool) -> None:
+            if complete:
+                response.raw.release_conn()
+            else:
+                # unread data would be taken for the next response
+                response.close()
+
+        return (
+            response.status_code,
+            response.headers,
+            StreamingResponse(
+                _read_chunks(response),
+                lambda data: loads(data, content_type),
+                spill_threshold,
+                _release,
+            ),
+        )
+
     @property
     def headers(self) -> Any:  # type: ignore
         return self.session.headers
@@ -266,3 +403,12 @@ class RequestsHttpConnection(Connection):
         Explicitly closes connections
         """
         self.session.close()
+
+
+def _read_chunks(response: Any) -> Any:
+    try:
+        yield from response.raw.stream(DEFAULT_READ_SIZE, decode_content=True)
+    except ReadTimeoutError as e:
+        raise ConnectionTimeout("TIMEOUT", str(e), e)
+    except HTTPError as e:
+        raise ConnectionError("N/A", str(e), e)
@@ -44,6 +44,8 @@ from ..exceptions import (
     SSLError,
 )
 from .base import Connection
+from .streaming import DEFAULT_READ_SIZE, DEFAULT_SPILL_THRESHOLD, StreamingResponse
+from .timing import current_timings, mark_download, time_connections
 
 # sentinel value for `verify_certs` and `ssl_show_warn`.
 # This is used to detect if a user is passing in a value
@@ -227,7 +229,7 @@ class Urllib3HttpConnection(Connection):
         self._create_urllib3_pool()
 
     def _create_urllib3_pool(self) -> None:
-        self.pool = self._urllib3_pool_factory()  # type: ignore
+        self.pool = time_connections(self._urllib3_pool_factory())  # type: ignore
 
     def perform_request(
         self,
@@ -264,16 +266,9 @@ class Urllib3HttpConnection(Connection):
             if not isinstance(method, str):
                 method = method.encode("utf-8")
 
-            request_headers = self.headers.copy()
-            request_headers.update(headers or ())
-
-            if self.http_compress and body:
-                body = self._gzip_compress(body)
-                request_headers["content-encoding"] = "gzip"
-
-            if self.http_auth is not None:
-                if isinstance(self.http_auth, Callable):  # type: ignore
-                    request_headers.update(self.http_auth(method, full_url, body))
+            request_headers, body = self._prepare_request(
+                method, full_url, body, headers
+            )
 
             self.metrics.request_start()
 
@@ -281,7 +276,9 @@ class Urllib3HttpConnection(Connection):
                 method, url, body, retries=Retry(False), headers=request_headers, **kw
             )
             duration = time.time() - start
-            raw_data = response.data.decode("utf-8", "surrogatepass")
+            # the body was read before urlopen() returned
+            mark_download(current_timings.get())
+            raw_data = self._decode_response(response.data)
         except reraise_exceptions:
             raise
         except Exception as e:
@@ -317,6 +314,116 @@ class Urllib3HttpConnection(Connection):
 
         return response.status, response.headers, raw_data
 
+    def _prepare_request(
+        self, method: str, full_url: str, body: Any, headers: Any
+    ) -> Any:
+        request_headers = self.headers.copy()
+        request_headers.update(headers or ())
+
+        if self._compresses(body):
+            body = self._gzip_compress(body)
+            request_headers["content-encoding"] = "gzip"
+
+        if self.http_auth is not None:
+            if isinstance(self.http_auth, Callable):  # type: ignore
+                request_headers.update(self.http_auth(method, full_url, body))
+
+        return request_headers, body
+
+    def perform_streaming_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        body: Optional[bytes] = None,
+        timeout: Optional[Union[int, float]] = None,
+        ignore: Collection[int] = (),
+        headers: Optional[Mapping[str, str]] = None,
+        loads: Any = None,
+        spill_threshold: int = DEFAULT_SPILL_THRESHOLD,
+    ) -> Any:
+        if self.pool is None:
+            self._create_urllib3_pool()
+        assert self.pool is not None
+
+        url = self.url_prefix + url
+        if params:
+            url = f"{url}?{urlencode(params)}"
+
+        full_url = self.host + url
+
+        start = time.time()
+        orig_body = body
+        try:
+            kw = {}
+            if timeout:
+                kw["timeout"] = timeout
+
+            request_headers, body = self._prepare_request(
+                method, full_url, body, headers
+            )
+
+            self.metrics.request_start()
+
+            response = self.pool.urlopen(
+                method,
+                url,
+                body,
+                retries=Retry(False),
+                headers=request_headers,
+                preload_content=False,
+                **kw,
+            )
+            duration = time.time() - start
+        except reraise_exceptions:
+            raise
+        except Exception as e:
+            self.log_request_fail(
+                method, full_url, url, orig_body, time.time() - start, exception=e
+            )
+            if isinstance(e, UrllibSSLError):
+                raise SSLError("N/A", str(e), e)
+            if isinstance(e, ReadTimeoutError):
+                raise ConnectionTimeout("TIMEOUT", str(e), e)
+            raise ConnectionError("N/A", str(e), e)
+        finally:
+            self.metrics.request_end()
+
+        warning_headers = response.headers.get_all("warning", ())
+        self._raise_warnings(warning_headers)
+
+        content_type = self.get_response_headers(response).get("content-type")
+        if not (200 <= response.status < 300) and response.status not in ignore:
+            try:
+                raw_data = self._decode_response(response.data)
+            finally:
+                response.release_conn()
+            self.log_request_fail(
+                method, full_url, url, orig_body, duration, response.status, raw_data
+            )
+            self._raise_error(response.status, raw_data, content_type)
+
+        self.log_request_success(
+            method, full_url, url, orig_body, response.status, None, duration
+        )
+
+        def _release(complete: bool) -> None:
+            if not complete:
+                # unread data would be taken for the next response
+                response.close()
+            response.release_conn()
+
+        return (
+            response.status,
+            response.headers,
+            StreamingResponse(
+                _read_chunks(response),
+                lambda data: loads(data, content_type),
+                spill_threshold,
+                _release,
+            ),
+        )
+
     def get_response_headers(self, response: Any) -> Any:
         return {header.lower(): value for header, value in response.headers.items()}
 
@@ -327,3 +434,12 @@ class Urllib3HttpConnection(Connection):
         if self.pool:
             self.pool.close()
             self.pool = None
+
+
+def _read_chunks(response: Any) -> Any:
+    try:
+        yield from response.stream(DEFAULT_READ_SIZE, decode_content=True)
+    except ReadTimeoutError as e:
+        raise ConnectionTimeout("TIMEOUT", str(e), e)
+    except urllib3.exceptions.HTTPError as e:
+        raise ConnectionError("N/A", str(e), e)
@@ -0,0 +1,286 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import mmap
+import re
+import tempfile
+from typing import Any, Callable, Iterator, Optional
+
+# rest of a JSON string after its opening quote, up to the closing one
+_STRING_REST = re.compile(rb'(?:[^"\\]|\\.)*"', re.DOTALL)
+# as much of a JSON string as has arrived: stops at its closing quote, or at
+# a final backslash whose escaped character is still to come
+_STRING_PART = re.compile(rb'(?:[^"\\]|\\.)*', re.DOTALL)
+_STRUCTURAL = re.compile(rb'["{}\[\]]')
+_NOT_SPACE = re.compile(rb"[^ \t\r\n]")
+
+_QUOTE, _COMMA, _COLON = ord('"'), ord(","), ord(":")
+_OPEN, _CLOSE = b"{[", b"}]"
+
+DEFAULT_SPILL_THRESHOLD = 8 * 1024 * 1024
+DEFAULT_READ_SIZE = 64 * 1024
+
+
+class SpillBuffer:
+    """
+    Append-only byte buffer that is kept in memory up to ``threshold`` bytes
+    and moved to an anonymous temporary file beyond that. :meth:`view` maps
+    the file instead of reading it back.
+    """
+
+    def __init__(self, threshold: int = DEFAULT_SPILL_THRESHOLD) -> None:
+        self.threshold = threshold
+        self.size = 0
+        self._memory: Optional[bytearray] = bytearray()
+        self._file: Any = None
+        self._map: Any = None
+
+    @property
+    def spilled(self) -> bool:
+        return self._file is not None
+
+    def write(self, data: Any) -> None:
+        self.size += len(data)
+        if self._memory is not None:
+            if len(self._memory) + len(data) <= self.threshold:
+                self._memory += data
+                return
+            self._file = tempfile.TemporaryFile()
+            self._file.write(self._memory)
+            self._memory = None
+        self._file.write(data)
+
+    def view(self) -> Any:
+        """Contents as a ``memoryview``, valid until :meth:`close`."""
+        if self._memory is not None:
+            return memoryview(self._memory)
+        if self._map is None:
+            self._file.flush()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(self._map)
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+        self._memory = None
+
+
+class StreamingResponse:
+    """
+    Search or scroll response read from the network as it is consumed.
+
+    :meth:`hits` yields every ``hits.hits`` entry as soon as its bytes have
+    arrived, without materializing the page. Everything else - the
+    envelope with ``_scroll_id``, ``_shards``, aggregations and so on - is
+    collected in a :class:`SpillBuffer` and returned by :meth:`body` with an
+    empty ``hits.hits``; reading it first drains (and discards) the hits.
+    The spill only bounds memory while the hits are streamed: :meth:`body`
+    parses the envelope in one piece, so a large one (e.g. from big
+    aggregations) is read back into memory then. Keep large results in
+    ``hits.hits`` and consume them with :meth:`hits`.
+
+    :arg chunks: iterator of raw response body ``bytes``
+    :arg loads: parses one JSON document from a ``bytes``-like object
+    :arg spill_threshold: envelope bytes kept in memory before spilling to
+        a temporary file
+    :arg release: called once with ``True`` when the body has been read to
+        the end, or with ``False`` when the response is closed before that
+    """
+
+    def __init__(
+        self,
+        chunks: Iterator[bytes],
+        loads: Callable[[Any], Any],
+        spill_threshold: int = DEFAULT_SPILL_THRESHOLD,
+        release: Optional[Callable[[bool], None]] = None,
+    ) -> None:
+        self._chunks = chunks
+        self._loads = loads
+        self._release = release
+        self.envelope = SpillBuffer(spill_threshold)
+
+        self._buf = bytearray()
+        # 0: looking for hits.hits, 1: inside it, 2: past it
+        self._phase = 0
+        # containers enclosing the scan position before hits.hits; objects
+        # hold the last key read, arrays None
+        self._stack: Any = []
+        self._expect_key = False
+        self._hit_end = _ValueEnd()
+        self._consumed = False
+        self._body: Any = None
+        # number of hits yielded so far
+        self.hit_count = 0
+
+    def __enter__(self) -> Any:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.hits()
+
+    def hits(self) -> Iterator[Any]:
+        """
+        Yield the parsed hits in the order they arrive. Stopping early and
+        calling it again resumes after the last hit yielded.
+        """
+        while not self._consumed:
+            if self._phase == 0:
+                self._find_hits()
+            if self._phase == 1:
+                yield from self._read_hits()
+            if self._phase == 2:
+                self.envelope.write(self._buf)
+                self._buf.clear()
+
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._consumed = True
+                # not a search response, or a truncated one; keep what we have
+                self.envelope.write(self._buf)
+                self._buf = bytearray()
+                self._finish(True)
+            else:
+                self._buf += chunk
+
+    def body(self) -> Any:
+        """
+        The response with ``hits.hits`` left empty. The envelope is loaded
+        into memory whole to be parsed, even if it was spilled to disk.
+        """
+        if self._body is None:
+            for _ in self.hits():
+                pass
+            if self.envelope.size:
+                self._body = self._loads(self.envelope.view())
+            self.envelope.close()
+        return self._body
+
+    def close(self) -> None:
+        complete = self._consumed
+        self._consumed = True
+        self.envelope.close()
+        self._finish(complete)
+
+    def _finish(self, complete: bool) -> None:
+        if self._release is not None:
+            release, self._release = self._release, None
+            release(complete)
+
+    def _find_hits(self) -> None:
+        buf, stack = self._buf, self._stack
+        pos, end = 0, len(buf)
+        while pos < end:
+            c = buf[pos]
+            if c == _QUOTE:
+                match = _STRING_REST.match(buf, pos + 1)
+                if match is None:
+                    # string continues in the next chunk
+                    break
+                if self._expect_key and stack:
+                    stack[-1] = bytes(buf[pos + 1 : match.end() - 1])
+                pos = match.end()
+                continue
+            pos += 1
+            if c in _OPEN:
+                if c == _OPEN[1] and stack == [b"hits", b"hits"]:
+                    self._phase = 1
+                    break
+                stack.append(b"" if c == _OPEN[0] else None)
+                self._expect_key = c == _OPEN[0]
+            elif c in _CLOSE:
+                if stack:
+                    stack.pop()
+            elif c == _COLON:
+                self._expect_key = False
+            elif c == _COMMA:
+                self._expect_key = bool(stack) and stack[-1] is not None
+        self.envelope.write(buf[:pos])
+        del buf[:pos]
+
+    def _read_hits(self) -> Iterator[Any]:
+        # consumed bytes are dropped before each yield so that a new call to
+        # hits() picks up exactly where this one stopped
+        buf = self._buf
+        while True:
+            match = _NOT_SPACE.search(buf)
+            if match is None:
+                buf.clear()
+                return
+            start = match.start()
+            c = buf[start]
+            if c == _COMMA:
+                del buf[: start + 1]
+                continue
+            if c == _CLOSE[1]:
+                # end of hits.hits, the envelope resumes here
+                self._phase = 2
+                del buf[:start]
+                return
+            end = self._hit_end.find(buf, start)
+            if end is None:
+                del buf[:start]
+                return
+            hit = self._loads(buf[start:end])
+            del buf[:end]
+            self.hit_count += 1
+            yield hit
+
+
+class _ValueEnd:
+    """
+    Finds the end of the object or array a hit is made of. When the hit is
+    split across chunks, the next call resumes the scan where the last one
+    stopped instead of starting over.
+    """
+
+    __slots__ = ("offset", "depth", "in_string")
+
+    def __init__(self) -> None:
+        # bytes scanned so far, counted from the start of the value
+        self.offset = 0
+        self.depth = 0
+        self.in_string = False
+
+    def find(self, buf: bytearray, start: int) -> Optional[int]:
+        """
+        End offset of the value starting at ``buf[start]``, or ``None`` if
+        it isn't complete yet.
+        """
+        pos = start + self.offset
+        depth = self.depth
+        while True:
+            if self.in_string:
+                pos = _STRING_PART.match(buf, pos).end()  # type: ignore
+                if pos == len(buf) or buf[pos] != _QUOTE:
+                    break
+                pos += 1
+                self.in_string = False
+            match = _STRUCTURAL.search(buf, pos)
+            if match is None:
+                pos = len(buf)
+                break
+            pos = match.end()
+            c = buf[match.start()]
+            if c == _QUOTE:
+                self.in_string = True
+            elif c in _OPEN:
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    self.offset, self.depth = 0, 0
+                    return pos
+        self.offset, self.depth = pos - start, depth
+        return None
@@ -0,0 +1,221 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import socket
+from contextvars import ContextVar
+from time import perf_counter_ns
+from typing import Any, Dict, Optional
+
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+try:
+    from urllib3.exceptions import NameResolutionError
+except ImportError:  # urllib3 < 2
+    NameResolutionError = None  # type: ignore
+
+# timings of the request being made in the current context, if recorded
+current_timings: ContextVar[Optional["RequestTimings"]] = ContextVar(
+    "current_timings", default=None
+)
+
+
+class RequestTimings:
+    """
+    Where the time of one request attempt went, as ``perf_counter_ns``
+    durations in nanoseconds; phases that didn't happen stay ``0``.
+
+    :ivar dns: resolving the node's hostname, on new connections only
+    :ivar connect: establishing the TCP connection
+    :ivar tls: the TLS handshake
+    :ivar send: writing the request headers and body
+    :ivar ttfb: from the request being sent until the response headers
+        arrived, mostly server time
+    :ivar download: reading the response body
+    :ivar deserialize: parsing the response body
+    :ivar total: the whole attempt, as seen by the transport
+    :ivar reused: whether an idle pooled connection was reused
+    :ivar took: the server-reported ``took`` in milliseconds, if any
+    """
+
+    __slots__ = (
+        "method",
+        "url",
+        "status",
+        "dns",
+        "connect",
+        "tls",
+        "send",
+        "ttfb",
+        "download",
+        "deserialize",
+        "total",
+        "reused",
+        "took",
+        "_start",
+        "_mark",
+    )
+
+    def __init__(self, method: str, url: str) -> None:
+        self.method = method
+        self.url = url
+        self.status: Optional[int] = None
+        self.dns = self.connect = self.tls = self.send = 0
+        self.ttfb = self.download = self.deserialize = self.total = 0
+        self.reused = True
+        self.took: Optional[int] = None
+        self._start = perf_counter_ns()
+        # when the phase in progress started
+        self._mark = self._start
+
+    def finish(self) -> None:
+        """Set ``total`` to the time since the attempt started."""
+        self.total = perf_counter_ns() - self._start
+
+    def as_dict(self) -> Dict[str, Any]:
+        """The phases in milliseconds, with the other fields."""
+        result: Dict[str, Any] = {
+            "method": self.method,
+            "url": self.url,
+            "status": self.status,
+            "reused": self.reused,
+            "took": self.took,
+        }
+        for phase in (
+            "dns",
+            "connect",
+            "tls",
+            "send",
+            "ttfb",
+            "download",
+            "deserialize",
+            "total",
+        ):
+            result[phase] = getattr(self, phase) / 1e6
+        return result
+
+    def __repr__(self) -> str:
+        return f"<RequestTimings: {self.as_dict()!r}>"
+
+
+class TimedHTTPConnection(HTTPConnection):
+    """
+    urllib3 connection that records the DNS, connect, send and
+    time-to-first-byte phases into the :class:`RequestTimings` of the
+    current context.
+    """
+
+    def _new_conn(self) -> socket.socket:
+        timings = current_timings.get()
+        if timings is None:
+            return super()._new_conn()
+
+        timings.reused = False
+        host = self._dns_host
+        if host.startswith("["):
+            host = host.strip("[]")
+        start = perf_counter_ns()
+        try:
+            addresses = socket.getaddrinfo(
+                host, self.port, allowed_gai_family(), socket.SOCK_STREAM
+            )
+        except socket.gaierror as e:
+            timings.dns += perf_counter_ns() - start
+            # what urllib3 raises when it fails to resolve the host itself
+            if NameResolutionError is not None:
+                raise NameResolutionError(self.host, self, e) from e
+            raise NewConnectionError(
+                self, f"Failed to establish a new connection: {e}"
+            ) from e
+        resolved = perf_counter_ns()
+        timings.dns += resolved - start
+        if not addresses:
+            return super()._new_conn()
+
+        # connect to each address just resolved in turn, as urllib3 would;
+        # TLS still verifies the host
+        dns_host = self._dns_host
+        try:
+            for address in addresses[:-1]:
+                self._dns_host = address[4][0]
+                try:
+                    return super()._new_conn()
+                except ConnectTimeoutError:
+                    # also covers NewConnectionError, e.g. a refused connection
+                    pass
+            self._dns_host = addresses[-1][4][0]
+            return super()._new_conn()
+        finally:
+            self._dns_host = dns_host
+            timings.connect += perf_counter_ns() - resolved
+
+    def connect(self) -> None:
+        timings = current_timings.get()
+        start = perf_counter_ns()
+        super().connect()
+        if timings is not None:
+            # for HTTPS connect() also does the TLS handshake
+            timings.tls += max(
+                perf_counter_ns() - start - timings.dns - timings.connect, 0
+            )
+
+    def request(self, *args: Any, **kwargs: Any) -> None:  # type: ignore
+        timings = current_timings.get()
+        if timings is None:
+            return super().request(*args, **kwargs)
+        start = perf_counter_ns()
+        setup = timings.dns + timings.connect + timings.tls
+        super().request(*args, **kwargs)
+        end = perf_counter_ns()
+        # plain HTTP connections only connect on their first send
+        setup = timings.dns + timings.connect + timings.tls - setup
+        timings.send += end - start - setup
+        timings._mark = end
+
+    def getresponse(self) -> Any:  # type: ignore
+        response = super().getresponse()
+        timings = current_timings.get()
+        if timings is not None:
+            end = perf_counter_ns()
+            timings.ttfb += end - timings._mark
+            timings._mark = end
+        return response
+
+
+class TimedHTTPSConnection(TimedHTTPConnection, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+def time_connections(pool: Any) -> Any:
+    """Make a urllib3 connection pool record :class:`RequestTimings`."""
+    if isinstance(pool.ConnectionCls, type) and issubclass(
+        pool.ConnectionCls, HTTPSConnection
+    ):
+        pool.ConnectionCls = TimedHTTPSConnection
+    else:
+        pool.ConnectionCls = TimedHTTPConnection
+    return pool
+
+
+def mark_download(timings: Optional[RequestTimings]) -> None:
+    """Record the time since the response headers arrived as the download."""
+    if timings is not None:
+        end = perf_counter_ns()
+        timings.download += end - timings._mark
+        timings._mark = end
@@ -25,18 +25,27 @@
 #  under the License.
 
 
+import bisect
+import hashlib
+import json
 import logging
+import math
 import random
 import threading
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from queue import Empty, PriorityQueue
 from typing import Any, Dict, Optional, Sequence, Tuple, Type
 
 from .connection import Connection
-from .exceptions import ImproperlyConfigured
+from .exceptions import ConnectionError, ImproperlyConfigured
 
 logger: logging.Logger = logging.getLogger("opensearch")
 
+# key set by Transport.affinity() for the requests of the current context
+affinity_key: ContextVar[Any] = ContextVar("affinity_key", default=None)
+
 
 class ConnectionSelector:
     """
@@ -71,6 +80,24 @@ class ConnectionSelector:
         """
         pass
 
+    def request_started(self, connection: Connection) -> None:
+        """
+        Called by the :class:`~opensearchpy.Transport` before a request is
+        sent over ``connection``.
+        """
+
+    def request_finished(
+        self, connection: Connection, duration: float, failed: bool = False
+    ) -> None:
+        """
+        Called by the :class:`~opensearchpy.Transport` once a request sent
+        over ``connection`` has completed or failed.
+
+        :arg duration: seconds until the response headers were received, or
+            until the failure
+        :arg failed: whether the request failed without a response
+        """
+
 
 class RandomSelector(ConnectionSelector):
     """
@@ -96,6 +123,174 @@ class RoundRobinSelector(ConnectionSelector):
         return connections[self.data.rr]
 
 
+class _LatencyStats:
+    __slots__ = ("lock", "ewma", "updated", "in_flight", "started")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.ewma = 0.0
+        self.updated = 0.0
+        self.in_flight = 0
+        # sum of the start times of the requests in flight
+        self.started = 0.0
+
+
+class LatencyAwareSelector(ConnectionSelector):
+    """
+    Selector that tracks an exponentially weighted moving average of each
+    connection's response time and its number of requests in flight. Two
+    live connections are picked at random and the one with the lower
+    ``latency * (in_flight + 1)`` cost wins ("power of two choices"),
+    steering traffic away from a slow node without herding every client
+    onto the single fastest one. ``latency`` is the average, or the mean
+    age of the requests in flight if that is higher, so a node whose
+    requests hang looks slow before any of them completes.
+
+    The average decays over ``decay`` seconds both while samples are
+    recorded and while none are, so a node that was slow gets retried once
+    it has been avoided for a while, and connections without samples yet
+    are preferred. Requests that fail without a response count as taking
+    ``failure_penalty`` times the current average, and at least
+    ``failure_latency`` seconds, so a node failing fast doesn't attract
+    traffic.
+
+    :arg decay: time constant of the moving average, in seconds
+    :arg failure_penalty: multiple of the average recorded for a failure
+    :arg failure_latency: minimum duration recorded for a failure, in seconds
+    """
+
+    def __init__(
+        self,
+        opts: Sequence[Tuple[Connection, Any]],
+        decay: float = 10.0,
+        failure_penalty: float = 5.0,
+        failure_latency: float = 1.0,
+    ) -> None:
+        super().__init__(opts)
+        self.decay = decay
+        self.failure_penalty = failure_penalty
+        self.failure_latency = failure_latency
+        self.stats: Dict[Connection, _LatencyStats] = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, connection: Connection) -> _LatencyStats:
+        stats = self.stats.get(connection)
+        if stats is None:
+            with self._lock:
+                stats = self.stats.setdefault(connection, _LatencyStats())
+        return stats
+
+    def cost(self, connection: Connection, now: Optional[float] = None) -> float:
+        """
+        Current cost of sending a request over ``connection``; lower is better.
+        """
+        stats = self._stats(connection)
+        now = now if now else time.monotonic()
+        weight = math.exp(-max(now - stats.updated, 0.0) / self.decay)
+        latency = stats.ewma * weight
+        in_flight = stats.in_flight
+        if in_flight:
+            latency = max(latency, now - stats.started / in_flight)
+        return latency * (in_flight + 1)
+
+    def select(self, connections: Sequence[Connection]) -> Any:
+        first = random.randrange(len(connections))
+        second = random.randrange(len(connections) - 1)
+        if second >= first:
+            second += 1
+        a, b = connections[first], connections[second]
+        now = time.monotonic()
+        return a if self.cost(a, now) <= self.cost(b, now) else b
+
+    def request_started(self, connection: Connection) -> None:
+        stats = self._stats(connection)
+        now = time.monotonic()
+        with stats.lock:
+            stats.in_flight += 1
+            stats.started += now
+
+    def request_finished(
+        self, connection: Connection, duration: float, failed: bool = False
+    ) -> None:
+        stats = self._stats(connection)
+        now = time.monotonic()
+        with stats.lock:
+            stats.in_flight = max(stats.in_flight - 1, 0)
+            if stats.in_flight:
+                # the transport's duration approximates when this one started
+                stats.started -= now - duration
+            else:
+                stats.started = 0.0
+            if failed:
+                duration = max(
+                    duration, stats.ewma * self.failure_penalty, self.failure_latency
+                )
+            weight = math.exp(-max(now - stats.updated, 0.0) / self.decay)
+            # the first sample replaces the initial zero outright
+            if not stats.updated:
+                weight = 0.0
+            stats.ewma = stats.ewma * weight + duration * (1 - weight)
+            stats.updated = now
+
+
+class ConsistentHashSelector(ConnectionSelector):
+    """
+    Selector that sends every request made with the same affinity key to
+    the same node, so repeated identical queries hit that node's request
+    and query caches. Keys are hashed onto a ring holding ``vnodes``
+    virtual nodes per connection; while a node is dead its keys move to
+    the next live node on the ring and all other keys stay where they are.
+
+    The key is set with :meth:`~opensearchpy.Transport.affinity`; it can be
+    a string, bytes or any JSON-serializable value such as a query body.
+    Requests without a key go to a random live connection.
+
+    :arg vnodes: number of ring positions per connection
+    """
+
+    def __init__(
+        self, opts: Sequence[Tuple[Connection, Any]], vnodes: int = 100
+    ) -> None:
+        super().__init__(opts)
+        ring = []
+        for connection in opts:
+            for i in range(vnodes):
+                ring.append((_ring_hash(f"{connection.host}#{i}"), connection))
+        ring.sort(key=lambda point: point[0])
+        self.ring_hashes = [h for h, _ in ring]
+        self.ring_connections = [c for _, c in ring]
+        # set of the last live connections seen, rebuilt when the pool
+        # replaces its tuple
+        self._live: Any = (None, frozenset())
+
+    def select(self, connections: Sequence[Connection]) -> Any:
+        key = affinity_key.get()
+        if key is None:
+            return random.choice(connections)
+
+        snapshot, live = self._live
+        if snapshot is not connections:
+            live = frozenset(connections)
+            self._live = (connections, live)
+
+        start = bisect.bisect(self.ring_hashes, _ring_hash(key))
+        ring = self.ring_connections
+        for i in range(len(ring)):
+            connection = ring[(start + i) % len(ring)]
+            if connection in live:
+                return connection
+        # connections added after the ring was built, e.g. by a subclass
+        return random.choice(connections)
+
+
+def _ring_hash(key: Any) -> int:
+    if isinstance(key, str):
+        key = key.encode("utf-8")
+    elif not isinstance(key, bytes):
+        key = json.dumps(key, sort_keys=True, default=str).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "big")
+
+
 class ConnectionPool:
     """
     Container holding the :class:`~opensearchpy.Connection` instances,
@@ -105,9 +300,10 @@ class ConnectionPool:
     It's only interactions are with the :class:`~opensearchpy.Transport` class
     that drives all the actions within `ConnectionPool`.
 
-    Initially connections are stored on the class as a list and, along with the
-    connection options, get passed to the `ConnectionSelector` instance for
-    future reference.
+    Initially connections are stored on the class as a tuple and, along with
+    the connection options, get passed to the `ConnectionSelector` instance
+    for future reference. The tuple is replaced, never modified, when a
+    connection dies or is resurrected, so readers can use it without locking.
 
     Upon each request the `Transport` will ask for a `Connection` via the
     `get_connection` method. If the connection fails (its `perform_request`
@@ -154,17 +350,20 @@ class ConnectionPool:
                 "No defined connections, you need to " "specify at least one host."
             )
         self.connection_opts = connections
-        self.connections = [c for (c, opts) in connections]
+        live = [c for (c, opts) in connections]
         # remember original connection list for resurrect(force=True)
-        self.orig_connections = tuple(self.connections)
+        self.orig_connections = tuple(live)
         # PriorityQueue for thread safety and ease of timeout management
-        self.dead = PriorityQueue(len(self.connections))
+        self.dead = PriorityQueue(len(live))
         self.dead_count = {}
 
         if randomize_hosts:
             # randomize the connection list to avoid all clients hitting same node
             # after startup/restart
-            random.shuffle(self.connections)
+            random.shuffle(live)
+        self.connections = tuple(live)
+        # serializes replacing self.connections; reads don't take it
+        self._lock = threading.Lock()
 
         # default timeout after which to try resurrecting a connection
         self.dead_timeout = dead_timeout
@@ -181,9 +380,13 @@ class ConnectionPool:
         """
         # allow inject for testing purposes
         now = now if now else time.time()
-        try:
-            self.connections.remove(connection)
-        except ValueError:
+        with self._lock:
+            removed = connection in self.connections
+            if removed:
+                self.connections = tuple(
+                    c for c in self.connections if c != connection
+                )
+        if not removed:
             logger.info(
                 "Attempted to remove %r, but it does not exist in the connection pool.",
                 connection,
@@ -253,7 +456,8 @@ class ConnectionPool:
             return
 
         # either we were forced or the connection is eligible to be retried
-        self.connections.append(connection)
+        with self._lock:
+            self.connections += (connection,)
         logger.info("Resurrecting connection %r (force=%s).", connection, force)
         return connection
 
@@ -269,7 +473,7 @@ class ConnectionPool:
         Returns a connection instance and its current fail count.
         """
         self.resurrect()
-        connections = self.connections[:]
+        connections = self.connections
 
         # no live nodes, resurrect one by force and return it
         if not connections:
@@ -282,6 +486,39 @@ class ConnectionPool:
         # only one connection, no need for a selector
         return connections[0]
 
+    def request_started(self, connection: Any) -> None:
+        """
+        Report that a request is about to be sent over ``connection``.
+        """
+        self.selector.request_started(connection)
+
+    def request_finished(
+        self, connection: Any, duration: float, failed: bool = False
+    ) -> None:
+        """
+        Report that a request sent over ``connection`` completed after
+        ``duration`` seconds, or ``failed`` without a response.
+        """
+        self.selector.request_finished(connection, duration, failed)
+
+    @contextmanager
+    def track(self, connection: Any) -> Any:
+        """
+        Report the request made within the block to
+        :meth:`request_started` and :meth:`request_finished`.
+        """
+        self.request_started(connection)
+        start = time.perf_counter()
+        try:
+            yield
+        except ConnectionError:
+            self.request_finished(connection, time.perf_counter() - start, True)
+            raise
+        except BaseException:
+            self.request_finished(connection, time.perf_counter() - start)
+            raise
+        self.request_finished(connection, time.perf_counter() - start)
+
     def close(self) -> Any:
         """
         Explicitly closes connections
@@ -316,7 +553,7 @@ class DummyConnectionPool(ConnectionPool):
     def _noop(self, *args: Any, **kwargs: Any) -> Any:
         pass
 
-    mark_dead = mark_live = resurrect = _noop
+    mark_dead = mark_live = resurrect = request_started = request_finished = _noop
 
 
 class EmptyConnectionPool(ConnectionPool):
@@ -333,3 +570,4 @@ class EmptyConnectionPool(ConnectionPool):
         pass
 
     close = mark_dead = mark_live = resurrect = _noop
+    request_started = request_finished = _noop
@@ -25,25 +25,37 @@
 #  under the License.
 
 
-from .._async.helpers.actions import (
-    async_bulk,
-    async_reindex,
-    async_scan,
-    async_streaming_bulk,
-)
+from importlib import import_module
+from typing import Any
+
 from .actions import (
+    AdaptiveBulkController,
     _chunk_actions,
     _process_bulk_chunk,
     bulk,
     expand_action,
     parallel_bulk,
+    parallel_scan,
+    process_parallel_bulk,
     reindex,
     scan,
     streaming_bulk,
 )
-from .asyncsigner import AWSV4SignerAsyncAuth
+from .bulk_processor import BulkingClient, BulkProcessor
 from .errors import BulkIndexError, ScanError
-from .signer import AWSV4SignerAuth, RequestsAWSV4SignerAuth, Urllib3AWSV4SignerAuth
+
+# the signers need requests, and the async helpers asyncio; both are imported
+# when first used
+_LAZY = {
+    "AWSV4SignerAuth": ".signer",
+    "RequestsAWSV4SignerAuth": ".signer",
+    "Urllib3AWSV4SignerAuth": ".signer",
+    "AWSV4SignerAsyncAuth": ".asyncsigner",
+    "async_bulk": ".._async.helpers.actions",
+    "async_reindex": ".._async.helpers.actions",
+    "async_scan": ".._async.helpers.actions",
+    "async_streaming_bulk": ".._async.helpers.actions",
+}
 
 __all__ = [
     "BulkIndexError",
@@ -52,7 +64,12 @@ __all__ = [
     "streaming_bulk",
     "bulk",
     "parallel_bulk",
+    "AdaptiveBulkController",
+    "BulkProcessor",
+    "BulkingClient",
+    "process_parallel_bulk",
     "scan",
+    "parallel_scan",
     "reindex",
     "_chunk_actions",
     "_process_bulk_chunk",
@@ -65,3 +82,14 @@ __all__ = [
     "async_reindex",
     "async_streaming_bulk",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(import_module(_LAZY[name], __name__), name)
+    return value
+
+
+def __dir__() -> Any:
+    return sorted(set(globals()) | set(__all__))
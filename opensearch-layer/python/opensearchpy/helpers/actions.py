@@ -25,18 +25,49 @@
 #  under the License.
 
 
+import copy
+import gzip
 import logging
+import threading
 import time
+from contextlib import contextmanager
 from operator import methodcaller
+from queue import Full
 from typing import Any, Optional
 
 from ..compat import Mapping, Queue, map, string_types
+from ..connection.compression import GzipBody, GzipWriter, gzip_compress
+from ..connection_pool import DummyConnectionPool
 from ..exceptions import TransportError
 from .errors import BulkIndexError, ScanError
 
 logger = logging.getLogger("opensearchpy.helpers")
 
 
+# fields of an action that go into its metadata line
+_BULK_META_FIELDS = (
+    "_id",
+    "_index",
+    "_if_seq_no",
+    "_if_primary_term",
+    "_parent",
+    "_percolate",
+    "_retry_on_conflict",
+    "_routing",
+    "_timestamp",
+    "_version",
+    "_version_type",
+    "if_seq_no",
+    "if_primary_term",
+    "parent",
+    "pipeline",
+    "retry_on_conflict",
+    "routing",
+    "version",
+    "version_type",
+)
+
+
 def expand_action(data: Any) -> Any:
     """
     From one document or action definition passed in by the user extract the
@@ -62,27 +93,7 @@ def expand_action(data: Any) -> Any:
     ):
         action[op_type]["_source"] = data.pop("_source")
 
-    for key in (
-        "_id",
-        "_index",
-        "_if_seq_no",
-        "_if_primary_term",
-        "_parent",
-        "_percolate",
-        "_retry_on_conflict",
-        "_routing",
-        "_timestamp",
-        "_version",
-        "_version_type",
-        "if_seq_no",
-        "if_primary_term",
-        "parent",
-        "pipeline",
-        "retry_on_conflict",
-        "routing",
-        "version",
-        "version_type",
-    ):
+    for key in _BULK_META_FIELDS:
         if key in data:
             if key in {
                 "_if_seq_no",
@@ -104,65 +115,161 @@ def expand_action(data: Any) -> Any:
     return action, data.get("_source", data)
 
 
+def _dumps_bytes(serializer: Any, data: Any) -> bytes:
+    dumps_bytes = getattr(serializer, "dumps_bytes", None)
+    if dumps_bytes is not None:
+        return dumps_bytes(data)  # type: ignore
+    data = serializer.dumps(data)
+    if isinstance(data, str):
+        return data.encode("utf-8", "surrogatepass")
+    return data  # type: ignore
+
+
+class _ActionRef:
+    """
+    Stand-in for the raw ``(action, data)`` of one action when payloads are
+    not retained: its position in the input stream and the byte range its
+    lines occupy in the chunk body.
+    """
+
+    __slots__ = ("position", "op_type", "start", "end")
+
+    def __init__(self, position: int, op_type: str, start: int, end: int) -> None:
+        self.position = position
+        self.op_type = op_type
+        self.start = start
+        self.end = end
+
+
+# uncompressed bytes collected before they are handed to the compressor
+_COMPRESS_BLOCK = 64 * 1024
+
+
 class _ActionChunker:
-    def __init__(self, chunk_size: int, max_chunk_bytes: int, serializer: Any) -> None:
+    """
+    Serializes actions straight into a ``bytearray`` body, so chunk sizes are
+    exact and each chunk is sent as a ``memoryview`` of that buffer without
+    being joined or encoded again. With ``retain_payloads=False`` only an
+    :class:`_ActionRef` per action is kept instead of the raw action and
+    document.
+
+    With a ``compress_level`` the body is gzip compressed while it is built,
+    every ``_COMPRESS_BLOCK`` bytes, and each chunk is a
+    :class:`~opensearchpy.connection.compression.GzipBody` instead.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int,
+        max_chunk_bytes: int,
+        serializer: Any,
+        retain_payloads: bool = True,
+        controller: Any = None,
+        compress_level: Optional[int] = None,
+    ) -> None:
         self.chunk_size = chunk_size
         self.max_chunk_bytes = max_chunk_bytes
         self.serializer = serializer
+        self.retain_payloads = retain_payloads
+        self.controller = controller
+        self.compress_level = compress_level
 
-        self.size = 0
+        # position of the next action within the whole input stream
+        self.position = 0
         self.action_count = 0
-        self.bulk_actions: Any = []
+        self.body = bytearray()
         self.bulk_data: Any = []
+        self.writer = None if compress_level is None else GzipWriter(compress_level)
+
+    @property
+    def size(self) -> int:
+        # uncompressed, including what was already handed to the writer
+        if self.writer is None:
+            return len(self.body)
+        return self.writer.size + len(self.body)
 
     def feed(self, action: Any, data: Any) -> Any:
         ret = None
-        raw_data, raw_action = data, action
-        action = self.serializer.dumps(action)
+        action_line = _dumps_bytes(self.serializer, action)
         # +1 to account for the trailing new line character
-        cur_size = len(action.encode("utf-8")) + 1
+        cur_size = len(action_line) + 1
 
         if data is not None:
-            data = self.serializer.dumps(data)
-            cur_size += len(data.encode("utf-8")) + 1
+            data_line = _dumps_bytes(self.serializer, data)
+            cur_size += len(data_line) + 1
+
+        max_chunk_bytes = self.max_chunk_bytes
+        if self.controller is not None:
+            max_chunk_bytes = min(max_chunk_bytes, self.controller.chunk_bytes)
 
         # full chunk, send it and start a new one
-        if self.bulk_actions and (
-            self.size + cur_size > self.max_chunk_bytes
+        if self.action_count and (
+            self.size + cur_size > max_chunk_bytes
             or self.action_count == self.chunk_size
         ):
-            ret = (self.bulk_data, self.bulk_actions)
-            self.bulk_actions, self.bulk_data = [], []
-            self.size, self.action_count = 0, 0
+            ret = self._take()
 
-        self.bulk_actions.append(action)
+        start = self.size
+        self.body += action_line
+        self.body += b"\n"
         if data is not None:
-            self.bulk_actions.append(data)
-            self.bulk_data.append((raw_action, raw_data))
+            self.body += data_line
+            self.body += b"\n"
+
+        if not self.retain_payloads:
+            op_type = next(iter(action)) if isinstance(action, Mapping) else "index"
+            self.bulk_data.append(_ActionRef(self.position, op_type, start, self.size))
+        elif data is not None:
+            self.bulk_data.append((action, data))
         else:
-            self.bulk_data.append((raw_action,))
+            self.bulk_data.append((action,))
 
-        self.size += cur_size
+        self.position += 1
         self.action_count += 1
+        if self.writer is not None and len(self.body) >= _COMPRESS_BLOCK:
+            self.writer.write(self.body)
+            self.body = bytearray()
         return ret
 
     def flush(self) -> Any:
         ret = None
-        if self.bulk_actions:
-            ret = (self.bulk_data, self.bulk_actions)
-            self.bulk_actions, self.bulk_data = [], []
+        if self.action_count:
+            ret = self._take()
+        return ret
+
+    def _take(self) -> Any:
+        if self.writer is not None:
+            self.writer.write(self.body)
+            ret = (self.bulk_data, self.writer.close())
+            self.writer = GzipWriter(self.compress_level)  # type: ignore
+        else:
+            # hand the buffer over as-is; a fresh one is started for the next chunk
+            ret = (self.bulk_data, memoryview(self.body))
+        self.body, self.bulk_data = bytearray(), []
+        self.action_count = 0
         return ret
 
 
 def _chunk_actions(
-    actions: Any, chunk_size: int, max_chunk_bytes: int, serializer: Any
+    actions: Any,
+    chunk_size: int,
+    max_chunk_bytes: int,
+    serializer: Any,
+    retain_payloads: bool = True,
+    controller: Any = None,
+    compress_level: Optional[int] = None,
 ) -> Any:
     """
-    Split actions into chunks by number or size, serialize them into strings in
+    Split actions into chunks by number or size, serialize them into bytes in
     the process.
     """
     chunker = _ActionChunker(
-        chunk_size=chunk_size, max_chunk_bytes=max_chunk_bytes, serializer=serializer
+        chunk_size=chunk_size,
+        max_chunk_bytes=max_chunk_bytes,
+        serializer=serializer,
+        retain_payloads=retain_payloads,
+        controller=controller,
+        compress_level=compress_level,
     )
     for action, data in actions:
         ret = chunker.feed(action, data)
@@ -173,6 +280,253 @@ def _chunk_actions(
         yield ret
 
 
+def _bulk_request_body(bulk_actions: Any) -> Any:
+    # chunks built by _ActionChunker are already a complete (maybe compressed) body
+    if isinstance(bulk_actions, (bytes, bytearray, memoryview)):
+        return bulk_actions
+    return "\n".join(bulk_actions) + "\n"
+
+
+def _add_retry(
+    serializer: Any, retry_body: bytearray, bulk_body: Any, data: Any
+) -> Any:
+    """
+    Append one rejected action to ``retry_body`` and return its bulk data
+    entry for the retried chunk. Actions without retained payloads are copied
+    from the bytes they already occupy in ``bulk_body``, which must not be
+    compressed.
+    """
+    if isinstance(data, _ActionRef):
+        start = len(retry_body)
+        retry_body += bulk_body[data.start : data.end]
+        return _ActionRef(data.position, data.op_type, start, len(retry_body))
+    for line in data:
+        retry_body += _dumps_bytes(serializer, line)
+        retry_body += b"\n"
+    return data
+
+
+def _retry_body(retry_body: bytearray, compress_level: Optional[int]) -> Any:
+    if compress_level is None:
+        return memoryview(retry_body)
+    return gzip_compress(retry_body, compress_level)
+
+
+class AdaptiveBulkController:
+    """
+    AIMD (additive increase, multiplicative decrease) controller for the
+    size of bulk chunks and the number of bulk requests in flight.
+
+    Every chunk that completes under ``target_latency`` without ``429``
+    rejections grows the chunk size by ``increase_bytes``, and each round of
+    ``in_flight`` such chunks allows one more request in flight. A ``429`` -
+    for the whole request or any item in it - or write thread pool queue
+    pressure reported by ``nodes.stats`` multiplies both by
+    ``decrease_factor``. Chunks already in flight when a decrease happens
+    can't cause another one, so a burst of rejections only cuts once.
+    ``nodes.stats`` is polled on a background thread, so bulk requests never
+    wait for it; each reading is acted on by the next chunk to complete.
+
+    Pass an instance as ``controller`` to
+    :func:`~opensearchpy.helpers.streaming_bulk`,
+    :func:`~opensearchpy.helpers.bulk` or
+    :func:`~opensearchpy.helpers.parallel_bulk`; :meth:`state` returns a
+    snapshot for monitoring.
+
+    :arg client: client used to poll write queue pressure, ``None`` to rely on
+        latency and rejections only
+    :arg target_latency: seconds a bulk request may take before growth stops
+    :arg initial_chunk_bytes: chunk size to start with
+    :arg min_chunk_bytes: smallest chunk size a decrease can go down to
+    :arg max_chunk_bytes: largest chunk size an increase can go up to
+    :arg increase_bytes: bytes added to the chunk size per fast chunk
+    :arg initial_in_flight: bulk requests allowed in flight to start with
+    :arg max_in_flight: most bulk requests an increase can allow in flight
+    :arg decrease_factor: multiplier applied on rejections and queue pressure
+    :arg queue_pressure: fraction of the write queue capacity, on the fullest
+        node, above which the cluster is considered saturated
+    :arg stats_interval: seconds between ``nodes.stats`` polls
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        target_latency: float = 1.0,
+        initial_chunk_bytes: int = 5 * 1024 * 1024,
+        min_chunk_bytes: int = 256 * 1024,
+        max_chunk_bytes: int = 100 * 1024 * 1024,
+        increase_bytes: int = 1024 * 1024,
+        initial_in_flight: int = 1,
+        max_in_flight: int = 8,
+        decrease_factor: float = 0.5,
+        queue_pressure: float = 0.5,
+        stats_interval: float = 5.0,
+    ) -> None:
+        self.client = client
+        self.target_latency = target_latency
+        self.min_chunk_bytes = min_chunk_bytes
+        self.max_chunk_bytes = max_chunk_bytes
+        self.increase_bytes = increase_bytes
+        self.max_in_flight = max_in_flight
+        self.decrease_factor = decrease_factor
+        self.queue_pressure = queue_pressure
+        self.stats_interval = stats_interval
+
+        self.chunk_bytes = min(
+            max(initial_chunk_bytes, min_chunk_bytes), max_chunk_bytes
+        )
+        self.in_flight = min(max(initial_in_flight, 1), max_in_flight)
+        self.active = 0
+        self.last_latency: Optional[float] = None
+        self.last_pressure: Optional[float] = None
+        self.chunks = 0
+        self.rejections = 0
+        self.decreases = 0
+
+        self._lock = threading.Condition()
+        self._successes = 0
+        self._last_decrease = 0.0
+        self._next_stats = 0.0
+        self._polling = False
+        # pressure read by the last poll, until a chunk completion acts on it
+        self._pressure: Optional[float] = None
+        self._queue_sizes: Any = None
+
+    def state(self) -> Any:
+        """Snapshot of the controller for monitoring."""
+        with self._lock:
+            return {
+                "chunk_bytes": self.chunk_bytes,
+                "in_flight": self.in_flight,
+                "active": self.active,
+                "last_latency": self.last_latency,
+                "last_pressure": self.last_pressure,
+                "chunks": self.chunks,
+                "rejections": self.rejections,
+                "decreases": self.decreases,
+            }
+
+    @contextmanager
+    def slot(self) -> Any:
+        """Block until another bulk request may be sent, and hold it while it is."""
+        with self._lock:
+            while self.active >= self.in_flight:
+                self._lock.wait()
+            self.active += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.active -= 1
+                self._lock.notify()
+
+    def record(self, started: float, latency: float, rejected: bool) -> None:
+        """
+        Feed back the outcome of one bulk request. ``started`` is the
+        ``time.monotonic()`` at which it was sent.
+        """
+        self._start_poll()
+        with self._lock:
+            pressure, self._pressure = self._pressure, None
+            self.chunks += 1
+            self.last_latency = latency
+            if rejected:
+                self.rejections += 1
+            if rejected or (pressure is not None and pressure > self.queue_pressure):
+                if started >= self._last_decrease:
+                    self._decrease()
+            elif latency <= self.target_latency:
+                self.chunk_bytes = min(
+                    self.chunk_bytes + self.increase_bytes, self.max_chunk_bytes
+                )
+                self._successes += 1
+                if self._successes >= self.in_flight:
+                    self._successes = 0
+                    if self.in_flight < self.max_in_flight:
+                        self.in_flight += 1
+                        self._lock.notify()
+
+    def _decrease(self) -> None:
+        self.chunk_bytes = max(
+            int(self.chunk_bytes * self.decrease_factor), self.min_chunk_bytes
+        )
+        self.in_flight = max(int(self.in_flight * self.decrease_factor), 1)
+        self.decreases += 1
+        self._successes = 0
+        self._last_decrease = time.monotonic()
+        logger.debug(
+            "Bulk backing off to %d bytes per chunk and %d requests in flight",
+            self.chunk_bytes,
+            self.in_flight,
+        )
+
+    def _start_poll(self) -> None:
+        """
+        Poll write queue pressure on a background thread, at most every
+        ``stats_interval`` seconds and one poll at a time.
+        """
+        if self.client is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if self._polling or now < self._next_stats:
+                return
+            self._next_stats = now + self.stats_interval
+            self._polling = True
+        threading.Thread(
+            target=self._poll_in_background, name="opensearch-bulk-stats", daemon=True
+        ).start()
+
+    def _poll_in_background(self) -> None:
+        pressure = None
+        try:
+            pressure = self._poll_pressure()
+        except Exception:
+            logger.warning("Unable to read write queue pressure", exc_info=True)
+        finally:
+            with self._lock:
+                self._polling = False
+                if pressure is not None:
+                    self.last_pressure = self._pressure = pressure
+
+    def _poll_pressure(self) -> Optional[float]:
+        """
+        Fill ratio of the fullest node's write queue, or ``None`` if it
+        can't be read.
+        """
+        try:
+            if self._queue_sizes is None:
+                info = self.client.nodes.info(
+                    metric="thread_pool",
+                    filter_path="nodes.*.thread_pool.write.queue_size",
+                )
+                self._queue_sizes = {
+                    node_id: node["thread_pool"]["write"]["queue_size"]
+                    for node_id, node in info.get("nodes", {}).items()
+                }
+            stats = self.client.nodes.stats(
+                metric="thread_pool", filter_path="nodes.*.thread_pool.write.queue"
+            )
+        except TransportError as e:
+            logger.warning("Unable to read write queue pressure: %s", e)
+            return None
+
+        pressure = 0.0
+        queue_sizes = self._queue_sizes
+        for node_id, node in stats.get("nodes", {}).items():
+            if node_id not in queue_sizes:
+                # a node joined since, read capacities again next time
+                self._queue_sizes = None
+                continue
+            queue_size = queue_sizes[node_id]
+            if not queue_size or queue_size < 0:
+                # unknown or unbounded queue
+                continue
+            queue = node["thread_pool"]["write"]["queue"]
+            pressure = max(pressure, queue / queue_size)
+        return pressure
+
+
 def _process_bulk_chunk_success(
     resp: Any, bulk_data: Any, ignore_status: Any = (), raise_on_error: bool = True
 ) -> Any:
@@ -186,9 +540,12 @@ def _process_bulk_chunk_success(
         status_code = item.get("status", 500)
 
         ok = 200 <= status_code < 300
+        if not ok and isinstance(data, _ActionRef):
+            # payloads were not retained, point at the action instead
+            item["position"] = data.position
         if not ok and raise_on_error and status_code not in ignore_status:
             # include original document source
-            if len(data) > 1:
+            if not isinstance(data, _ActionRef) and len(data) > 1:
                 item["data"] = data[1]
             errors.append({op_type: item})
 
@@ -218,8 +575,12 @@ def _process_bulk_chunk_error(
 
     for data in bulk_data:
         # collect all the information about failed actions
-        op_type, action = data[0].copy().popitem()
         info = {"error": err_message, "status": error.status_code, "exception": error}
+        if isinstance(data, _ActionRef):
+            info["position"] = data.position
+            exc_errors.append({data.op_type: info})
+            continue
+        op_type, action = data[0].copy().popitem()
         if op_type != "delete":
             info["data"] = data[1]
         info.update(action)
@@ -243,6 +604,7 @@ def _process_bulk_chunk(
     raise_on_error: bool = True,
     ignore_status: Any = (),
     *args: Any,
+    controller: Any = None,
     **kwargs: Any,
 ) -> Any:
     """
@@ -251,10 +613,13 @@ def _process_bulk_chunk(
     if not isinstance(ignore_status, (list, tuple)):
         ignore_status = (ignore_status,)
 
+    started = time.monotonic()
     try:
         # send the actual request
-        resp = client.bulk(body="\n".join(bulk_actions) + "\n", *args, **kwargs)
+        resp = client.bulk(body=_bulk_request_body(bulk_actions), *args, **kwargs)
     except TransportError as e:
+        if controller is not None:
+            controller.record(started, time.monotonic() - started, e.status_code == 429)
         gen = _process_bulk_chunk_error(
             error=e,
             bulk_data=bulk_data,
@@ -263,6 +628,13 @@ def _process_bulk_chunk(
             raise_on_error=raise_on_error,
         )
     else:
+        if controller is not None:
+            rejected = resp.get("errors", False) and any(
+                item.get("status") == 429
+                for op in resp["items"]
+                for item in op.values()
+            )
+            controller.record(started, time.monotonic() - started, rejected)
         gen = _process_bulk_chunk_success(
             resp=resp,
             bulk_data=bulk_data,
@@ -285,6 +657,9 @@ def streaming_bulk(
     max_backoff: int = 600,
     yield_ok: bool = True,
     ignore_status: Any = (),
+    retain_payloads: bool = True,
+    controller: Optional[AdaptiveBulkController] = None,
+    compress_level: Optional[int] = None,
     *args: Any,
     **kwargs: Any,
 ) -> Any:
@@ -320,15 +695,33 @@ def streaming_bulk(
     :arg max_backoff: maximum number of seconds a retry will wait
     :arg yield_ok: if set to False will skip successful documents in the output
     :arg ignore_status: list of HTTP status code that you want to ignore
+    :arg retain_payloads: if set to False the raw actions and documents are
+        not kept while their chunk is in flight; failed items then carry their
+        ``position`` in ``actions`` instead of the original ``data``
+    :arg controller: :class:`~opensearchpy.helpers.AdaptiveBulkController`
+        that sizes chunks from observed latency and rejections; chunks still
+        hold at most ``chunk_size`` docs and ``max_chunk_bytes`` bytes
+    :arg compress_level: gzip level (``1``-``9``) to compress each chunk
+        with while it is being built, so it is sent with ``Content-Encoding:
+        gzip`` whatever the connection's ``http_compress``;
+        ``max_chunk_bytes`` still counts uncompressed bytes
     """
     actions = map(expand_action_callback, actions)
+    serializer = client.transport.serializer
 
     for bulk_data, bulk_actions in _chunk_actions(
-        actions, chunk_size, max_chunk_bytes, client.transport.serializer
+        actions,
+        chunk_size,
+        max_chunk_bytes,
+        serializer,
+        retain_payloads,
+        controller,
+        compress_level,
     ):
         for attempt in range(max_retries + 1):
-            to_retry: Any = []
+            to_retry = bytearray()
             to_retry_data: Any = []
+            retry_source = bulk_actions
             if attempt:
                 time.sleep(min(max_backoff, initial_backoff * 2 ** (attempt - 1)))
 
@@ -343,6 +736,7 @@ def streaming_bulk(
                         raise_on_error,
                         ignore_status,
                         *args,
+                        controller=controller,
                         **kwargs,
                     ),
                 ):
@@ -355,12 +749,14 @@ def streaming_bulk(
                             and info["status"] == 429
                             and (attempt + 1) <= max_retries
                         ):
-                            # _process_bulk_chunk expects strings so we need to
-                            # re-serialize the data
-                            to_retry.extend(
-                                map(client.transport.serializer.dumps, data)
+                            if not retain_payloads and isinstance(
+                                retry_source, GzipBody
+                            ):
+                                # once per chunk, to copy the actions out of it
+                                retry_source = gzip.decompress(retry_source)
+                            to_retry_data.append(
+                                _add_retry(serializer, to_retry, retry_source, data)
                             )
-                            to_retry_data.append(data)
                         else:
                             yield ok, {action: info}
                     elif yield_ok:
@@ -374,7 +770,8 @@ def streaming_bulk(
                 if not to_retry:
                     break
                 # retry only subset of documents that didn't succeed
-                bulk_actions, bulk_data = to_retry, to_retry_data
+                bulk_actions = _retry_body(to_retry, compress_level)
+                bulk_data = to_retry_data
 
 
 def bulk(
@@ -399,7 +796,8 @@ def bulk(
     error dictionary which can lead to an extra high memory usage. If you need
     to process a lot of data and want to ignore/collect errors please consider
     using the :func:`~opensearchpy.helpers.streaming_bulk` helper which will
-    just return the errors and not store them in memory.
+    just return the errors and not store them in memory, or pass
+    ``retain_payloads=False`` to have errors report positions instead.
 
 
     :arg client: instance of :class:`~opensearchpy.OpenSearch` to use
@@ -443,6 +841,9 @@ def parallel_bulk(
     raise_on_exception: bool = True,
     raise_on_error: bool = True,
     ignore_status: Any = (),
+    retain_payloads: bool = True,
+    controller: Optional[AdaptiveBulkController] = None,
+    compress_level: Optional[int] = None,
     *args: Any,
     **kwargs: Any,
 ) -> Any:
@@ -464,6 +865,16 @@ def parallel_bulk(
     :arg queue_size: size of the task queue between the main thread (producing
         chunks to send) and the processing threads.
     :arg ignore_status: list of HTTP status code that you want to ignore
+    :arg retain_payloads: if set to False the raw actions and documents are
+        not kept while their chunk is in flight; failed items then carry their
+        ``position`` in ``actions`` instead of the original ``data``
+    :arg controller: :class:`~opensearchpy.helpers.AdaptiveBulkController`
+        that sizes chunks and limits the requests in flight from observed
+        latency, rejections and write queue pressure; at most
+        ``thread_count`` requests are ever in flight
+    :arg compress_level: gzip level (``1``-``9``) to compress each chunk
+        with while it is being built, so compressing the next chunk overlaps
+        with sending the previous ones
     """
     # Avoid importing multiprocessing unless parallel_bulk is used
     # to avoid exceptions on restricted environments like App Engine
@@ -479,24 +890,36 @@ def parallel_bulk(
             self._inqueue: Any = Queue(max(queue_size, thread_count))
             self._quick_put = self._inqueue.put
 
+    def _send(bulk_chunk: Any) -> Any:
+        results = _process_bulk_chunk(
+            client,
+            bulk_chunk[1],
+            bulk_chunk[0],
+            raise_on_exception,
+            raise_on_error,
+            ignore_status,
+            *args,
+            controller=controller,
+            **kwargs,
+        )
+        if controller is None:
+            return list(results)
+        with controller.slot():
+            return list(results)
+
     pool = BlockingPool(thread_count)
 
     try:
         for result in pool.imap(
-            lambda bulk_chunk: list(
-                _process_bulk_chunk(
-                    client,
-                    bulk_chunk[1],
-                    bulk_chunk[0],
-                    raise_on_exception,
-                    raise_on_error,
-                    ignore_status,
-                    *args,
-                    **kwargs,
-                )
-            ),
+            _send,
             _chunk_actions(
-                actions, chunk_size, max_chunk_bytes, client.transport.serializer
+                actions,
+                chunk_size,
+                max_chunk_bytes,
+                client.transport.serializer,
+                retain_payloads,
+                controller,
+                compress_level,
             ),
         ):
             yield from result
@@ -506,6 +929,261 @@ def parallel_bulk(
         pool.join()
 
 
+def _serialize_batch(
+    batch: Any,
+    position: int,
+    chunk_size: int,
+    max_chunk_bytes: int,
+    serializer: Any,
+    expand_action_callback: Any,
+    retain_payloads: bool,
+    compress_level: Optional[int] = None,
+) -> Any:
+    # runs in a worker process of process_parallel_bulk
+    chunker = _ActionChunker(
+        chunk_size=chunk_size,
+        max_chunk_bytes=max_chunk_bytes,
+        serializer=serializer,
+        retain_payloads=retain_payloads,
+        compress_level=compress_level,
+    )
+    chunker.position = position
+    chunks = []
+    for item in batch:
+        ret = chunker.feed(*expand_action_callback(item))
+        if ret:
+            chunks.append(ret)
+    ret = chunker.flush()
+    if ret:
+        chunks.append(ret)
+    # memoryviews can't be pickled, send back the buffers behind them
+    return [
+        (bulk_data, body.obj if isinstance(body, memoryview) else body)
+        for bulk_data, body in chunks
+    ]
+
+
+def _pinned_client(client: Any, index: int) -> Any:
+    """
+    Shallow copy of ``client`` whose transport always uses one dedicated
+    connection, opened to the ``index``-th configured host.
+    """
+    transport = copy.copy(client.transport)
+    opts = client.transport.connection_pool.connection_opts
+    host = opts[index % len(opts)][1]
+    kwargs = transport.kwargs.copy()
+    kwargs.update(host)
+    kwargs["pool_maxsize"] = 1
+    connection = transport.connection_class(metrics=transport.metrics, **kwargs)
+    transport.connection_pool = DummyConnectionPool([(connection, host)])
+    transport.seed_connections = []
+    # sniffing would replace the pinned pool with a shared one
+    transport.sniffer_timeout = None
+    transport.sniff_on_connection_fail = False
+
+    pinned = copy.copy(client)
+    pinned.transport = transport
+    return pinned
+
+
+def process_parallel_bulk(
+    client: Any,
+    actions: Any,
+    thread_count: int = 4,
+    process_count: Optional[int] = None,
+    chunk_size: int = 500,
+    max_chunk_bytes: int = 100 * 1024 * 1024,
+    queue_size: int = 4,
+    expand_action_callback: Any = expand_action,
+    raise_on_exception: bool = True,
+    raise_on_error: bool = True,
+    ignore_status: Any = (),
+    retain_payloads: bool = True,
+    compress_level: Optional[int] = None,
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """
+    Variant of :func:`~opensearchpy.helpers.parallel_bulk` that moves
+    serialization off the calling thread. Actions are read in batches of
+    ``chunk_size``, and each batch is expanded, serialized and split into
+    chunks in a process pool, so building request bodies scales with cores
+    instead of being bound by the GIL. The chunks are sent from a thread
+    pool in which every thread owns a dedicated connection, and results are
+    yielded per chunk in the order the requests complete, not the order the
+    actions came in.
+
+    ``actions``, ``expand_action_callback`` and the client's serializer must
+    be picklable, so lambdas and local functions can't be used as the
+    callback.
+
+    :arg client: instance of :class:`~opensearchpy.OpenSearch` to use
+    :arg actions: iterator containing the actions
+    :arg thread_count: number of threads (and connections) sending bulk requests
+    :arg process_count: size of the serialization process pool (default:
+        number of CPUs)
+    :arg chunk_size: number of docs in one chunk sent to client (default: 500)
+    :arg max_chunk_bytes: the maximum size of the request in bytes (default: 100MB)
+    :arg queue_size: number of serialized chunks allowed to wait for a free
+        thread on top of those being sent
+    :arg raise_on_error: raise ``BulkIndexError`` containing errors (as `.errors`)
+        from the execution of the last chunk when some occur. By default we raise.
+    :arg raise_on_exception: if ``False`` then don't propagate exceptions from
+        call to ``bulk`` and just report the items that failed as failed.
+    :arg expand_action_callback: callback executed on each action passed in,
+        should return a tuple containing the action line and the data line
+        (`None` if data line should be omitted).
+    :arg ignore_status: list of HTTP status code that you want to ignore
+    :arg retain_payloads: if set to False the raw actions and documents are
+        neither kept nor sent back from the worker processes; failed items
+        then carry their ``position`` in ``actions`` instead of the original
+        ``data``
+    :arg compress_level: gzip level (``1``-``9``) the worker processes
+        compress each chunk with while building it
+    """
+    # Avoid importing multiprocessing unless this helper is used
+    # to avoid exceptions on restricted environments like App Engine
+    from concurrent.futures import (
+        FIRST_COMPLETED,
+        ProcessPoolExecutor,
+        ThreadPoolExecutor,
+        wait,
+    )
+
+    serializer = client.transport.serializer
+    pinned_clients: Any = []
+    pinned_lock = threading.Lock()
+    local = threading.local()
+
+    def _pin() -> None:
+        with pinned_lock:
+            local.client = _pinned_client(client, len(pinned_clients))
+            pinned_clients.append(local.client)
+
+    def _send(bulk_data: Any, body: Any) -> Any:
+        return list(
+            _process_bulk_chunk(
+                local.client,
+                body,
+                bulk_data,
+                raise_on_exception,
+                raise_on_error,
+                ignore_status,
+                *args,
+                **kwargs,
+            )
+        )
+
+    def _batches() -> Any:
+        position, batch = 0, []
+        for item in actions:
+            batch.append(item)
+            if len(batch) == chunk_size:
+                yield position, batch
+                position, batch = position + len(batch), []
+        if batch:
+            yield position, batch
+
+    processes = ProcessPoolExecutor(process_count)
+    threads = ThreadPoolExecutor(thread_count, initializer=_pin)
+    serializing: Any = set()
+    sending: Any = set()
+    batches = _batches()
+    exhausted = False
+
+    try:
+        while True:
+            # keep every thread busy plus queue_size chunks ready to go
+            while not exhausted and (
+                len(serializing) + len(sending) < thread_count + queue_size
+            ):
+                try:
+                    position, batch = next(batches)
+                except StopIteration:
+                    exhausted = True
+                    break
+                serializing.add(
+                    processes.submit(
+                        _serialize_batch,
+                        batch,
+                        position,
+                        chunk_size,
+                        max_chunk_bytes,
+                        serializer,
+                        expand_action_callback,
+                        retain_payloads,
+                        compress_level,
+                    )
+                )
+
+            if not serializing and not sending:
+                break
+
+            done, _ = wait(serializing | sending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in serializing:
+                    serializing.discard(future)
+                    for bulk_data, body in future.result():
+                        sending.add(threads.submit(_send, bulk_data, body))
+                else:
+                    sending.discard(future)
+                    yield from future.result()
+
+    finally:
+        threads.shutdown(wait=True, cancel_futures=True)
+        processes.shutdown(wait=True, cancel_futures=True)
+        for pinned in pinned_clients:
+            pinned.transport.close()
+
+
+def _put_unless_stopped(items: Any, item: Any, stop: Any) -> bool:
+    # give up once the consumer is gone rather than block forever
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=0.1)
+            return True
+        except Full:
+            pass
+    return False
+
+
+_END = object()
+
+
+def _prefetch(iterator: Any, depth: int) -> Any:
+    """
+    Iterate ``iterator`` on a background thread that stays up to ``depth``
+    items ahead of the consumer. Errors are re-raised in the consumer.
+    """
+    items: Any = Queue(depth)
+    stop = threading.Event()
+
+    def _run() -> None:
+        try:
+            for item in iterator:
+                if not _put_unless_stopped(items, (item, None), stop):
+                    return
+        except BaseException as e:
+            _put_unless_stopped(items, (None, e), stop)
+            return
+        _put_unless_stopped(items, (_END, None), stop)
+
+    thread = threading.Thread(target=_run, name="opensearch-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = items.get()
+            if error is not None:
+                raise error
+            if item is _END:
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+        iterator.close()
+
+
 def scan(
     client: Any,
     query: Any = None,
@@ -516,6 +1194,8 @@ def scan(
     request_timeout: Optional[float] = None,
     clear_scroll: Optional[bool] = True,
     scroll_kwargs: Any = None,
+    prefetch: int = 0,
+    stream: bool = False,
     **kwargs: Any,
 ) -> Any:
     """
@@ -546,6 +1226,12 @@ def scan(
         to true.
     :arg scroll_kwargs: additional kwargs to be passed to
         :meth:`~opensearchpy.OpenSearch.scroll`
+    :arg prefetch: number of pages to fetch ahead on a background thread
+        while earlier ones are being consumed, 0 (default) to fetch each page
+        only once the previous one has been consumed
+    :arg stream: yield each hit as soon as it has been downloaded instead of
+        after its whole page, see :meth:`~opensearchpy.Transport.streaming`;
+        can't be combined with ``prefetch``
 
     Any additional keyword arguments will be passed to the initial
     :meth:`~opensearchpy.OpenSearch.search` call::
@@ -577,15 +1263,22 @@ def scan(
         for key, val in transport_kwargs.items():
             scroll_kwargs.setdefault(key, val)
 
-    # initial search
-    resp = client.search(
-        body=query, scroll=scroll, size=size, request_timeout=request_timeout, **kwargs
-    )
-    scroll_id = resp.get("_scroll_id")
+    scroll_id = None
+
+    def _pages() -> Any:
+        nonlocal scroll_id
+        # initial search
+        resp = client.search(
+            body=query,
+            scroll=scroll,
+            size=size,
+            request_timeout=request_timeout,
+            **kwargs,
+        )
+        scroll_id = resp.get("_scroll_id")
 
-    try:
         while scroll_id and resp.get("hits", {}).get("hits"):
-            yield from resp.get("hits", {}).get("hits", [])
+            yield resp.get("hits", {}).get("hits", [])
 
             _shards = resp.get("_shards")
 
@@ -620,13 +1313,228 @@ def scan(
             )
             scroll_id = resp.get("_scroll_id")
 
+    def _streamed_pages() -> Any:
+        nonlocal scroll_id
+        with client.transport.streaming():
+            resp = client.search(
+                body=query,
+                scroll=scroll,
+                size=size,
+                request_timeout=request_timeout,
+                **kwargs,
+            )
+        while True:
+            try:
+                yield resp
+            except GeneratorExit:
+                if scroll_id is None and clear_scroll:
+                    # the scroll id comes with the rest of the first page
+                    try:
+                        scroll_id = resp.body().get("_scroll_id")
+                    except TransportError:
+                        pass
+                resp.close()
+                raise
+
+            envelope = resp.body()
+            scroll_id = envelope.get("_scroll_id")
+            if not scroll_id or not resp.hit_count:
+                break
+            _check_shards(envelope, raise_on_error, scroll_id)
+
+            with client.transport.streaming():
+                resp = client.scroll(
+                    body={"scroll_id": scroll_id, "scroll": scroll}, **scroll_kwargs
+                )
+
+    if stream and prefetch:
+        raise ValueError("scan() can't both stream and prefetch pages")
+
+    pages = _streamed_pages() if stream else _pages()
+    if prefetch:
+        pages = _prefetch(pages, prefetch)
+    try:
+        for hits in pages:
+            yield from hits
+
     finally:
+        # stops a prefetching thread before its scroll is cleared
+        pages.close()
         if scroll_id and clear_scroll:
             client.clear_scroll(
                 body={"scroll_id": [scroll_id]}, ignore=(404,), **transport_kwargs
             )
 
 
+def _check_shards(resp: Any, raise_on_error: Optional[bool], scroll_id: Any) -> None:
+    _shards = resp.get("_shards")
+    if not _shards:
+        return
+    shards_successful = _shards.get("successful", 0)
+    shards_skipped = _shards.get("skipped", 0)
+    shards_total = _shards.get("total", 0)
+    if (shards_successful + shards_skipped) < shards_total:
+        shards_message = "Search request has only succeeded on %d (+%d skipped) shards out of %d."
+        logger.warning(
+            shards_message, shards_successful, shards_skipped, shards_total
+        )
+        if raise_on_error:
+            raise ScanError(
+                scroll_id,
+                shards_message % (shards_successful, shards_skipped, shards_total),
+            )
+
+
+def _resolve_indices(client: Any, index: Any, transport_kwargs: Any) -> Any:
+    """
+    Names of the concrete indices ``index`` (names, patterns, aliases or data
+    streams) resolves to.
+    """
+    resolved = client.indices.resolve_index(name=index or "*", **transport_kwargs)
+    indices = {entry["name"] for entry in resolved.get("indices", ())}
+    for alias in resolved.get("aliases", ()):
+        indices.update(alias.get("indices", ()))
+    for data_stream in resolved.get("data_streams", ()):
+        indices.update(data_stream.get("backing_indices", ()))
+    return indices
+
+
+def parallel_scan(
+    client: Any,
+    query: Any = None,
+    slices: int = 4,
+    keep_alive: str = "5m",
+    raise_on_error: Optional[bool] = True,
+    size: Optional[int] = 1000,
+    request_timeout: Optional[float] = None,
+    thread_count: Optional[int] = None,
+    queue_size: Optional[int] = None,
+    **kwargs: Any,
+) -> Any:
+    """
+    Parallel counterpart of :func:`~opensearchpy.helpers.scan`. Opens a point
+    in time on the target index, reads it as ``slices`` independent
+    sliced ``search_after`` iterations on a thread pool, and yields the
+    hits of all of them from a single generator as pages arrive. At most
+    ``queue_size`` fetched pages are buffered ahead of the consumer. The
+    point in time is deleted when the generator finishes, fails or is
+    closed.
+
+    Hits are not returned in any order. If ``query`` has no ``sort``, pages
+    are sorted by ``_doc``, which is only a total order within one shard, so
+    ``slices`` is raised to the index's shard count if it is lower; give a
+    ``sort`` with a unique tiebreaker to avoid that. ``_doc`` does not order
+    hits across indices, so a ``sort`` is required when ``index`` resolves
+    to more than one index, or ``ValueError`` is raised.
+
+    :arg client: instance of :class:`~opensearchpy.OpenSearch` to use
+    :arg query: body for the :meth:`~opensearchpy.OpenSearch.search` api
+    :arg slices: number of slices to read in parallel
+    :arg keep_alive: how long the point in time is kept between requests
+    :arg raise_on_error: raises an exception (``ScanError``) if an error is
+        encountered (some shards fail to execute). By default we raise.
+    :arg size: size (per slice) of the batch sent at each iteration.
+    :arg request_timeout: explicit timeout for each search request
+    :arg thread_count: number of threads reading slices (default: ``slices``)
+    :arg queue_size: number of pages buffered ahead of the consumer
+        (default: twice the number of threads)
+
+    Any additional keyword arguments will be passed to the
+    :meth:`~opensearchpy.OpenSearch.search` calls; ``index`` is used to open
+    the point in time::
+
+        parallel_scan(client,
+            query={
+                "query": {"match": {"title": "python"}},
+                "sort": [{"created_at": "asc"}, {"order_id": "asc"}],
+            },
+            index="orders-*",
+            slices=8,
+        )
+
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    query = query.copy() if query else {}
+    index = kwargs.pop("index", None)
+
+    # options that should be propagated to every API call within this helper
+    transport_kwargs = {}
+    for key in ("headers", "api_key", "http_auth"):
+        if key in kwargs:
+            transport_kwargs[key] = kwargs[key]
+
+    if "sort" not in query:
+        indices = _resolve_indices(client, index, transport_kwargs)
+        if len(indices) > 1:
+            raise ValueError(
+                "parallel_scan() needs a 'sort' with a unique tiebreaker when "
+                "'index' resolves to more than one index, got %d: %s"
+                % (len(indices), ", ".join(sorted(indices)))
+            )
+
+    pit = client.create_pit(index=index, keep_alive=keep_alive, **transport_kwargs)
+    pit_id = pit["pit_id"]
+    try:
+        if "sort" not in query:
+            query["sort"] = ["_doc"]
+            slices = max(slices, pit.get("_shards", {}).get("total", 1))
+        thread_count = thread_count or slices
+        pages: Any = Queue(queue_size or 2 * thread_count)
+        stop = threading.Event()
+
+        def _put(item: Any) -> bool:
+            return _put_unless_stopped(pages, item, stop)
+
+        def _read_slice(slice_id: int) -> None:
+            body = query.copy()
+            body["pit"] = {"id": pit_id, "keep_alive": keep_alive}
+            if slices > 1:
+                body["slice"] = {"id": slice_id, "max": slices}
+            try:
+                while not stop.is_set():
+                    resp = client.search(
+                        body=body,
+                        size=size,
+                        request_timeout=request_timeout,
+                        **kwargs,
+                    )
+                    _check_shards(resp, raise_on_error, pit_id)
+                    hits = resp.get("hits", {}).get("hits")
+                    if not hits:
+                        break
+                    if not _put(hits):
+                        return
+                    body["pit"]["id"] = resp.get("pit_id", body["pit"]["id"])
+                    body["search_after"] = hits[-1]["sort"]
+            except BaseException as e:
+                _put(e)
+                return
+            _put(None)
+
+        executor = ThreadPoolExecutor(
+            thread_count, thread_name_prefix="opensearch-scan"
+        )
+        try:
+            for slice_id in range(slices):
+                executor.submit(_read_slice, slice_id)
+
+            remaining = slices
+            while remaining:
+                page = pages.get()
+                if page is None:
+                    remaining -= 1
+                elif isinstance(page, BaseException):
+                    raise page
+                else:
+                    yield from page
+        finally:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+    finally:
+        client.delete_pit(body={"pit_id": [pit_id]}, ignore=(404,), **transport_kwargs)
+
+
 def reindex(
     client: Any,
     source_index: Any,
@@ -0,0 +1,384 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional
+
+from ..compat import Mapping
+from .actions import (
+    _BULK_META_FIELDS,
+    _ActionRef,
+    _dumps_bytes,
+    _process_bulk_chunk,
+    expand_action,
+)
+from .errors import BulkIndexError
+
+logger = logging.getLogger("opensearchpy.helpers")
+
+
+class BulkProcessor:
+    """
+    Long-lived, thread-safe batcher for the
+    :meth:`~opensearchpy.OpenSearch.bulk` api. Actions - in the same format
+    as for :func:`~opensearchpy.helpers.bulk` - can be added from any number
+    of threads; they are serialized by the adding thread and buffered until
+    ``max_actions`` actions or ``max_bytes`` bytes are pending, or the oldest
+    of them has waited ``linger`` seconds. At most ``max_in_flight`` bulk
+    requests are sent at once; :meth:`add` blocks while that many are in
+    flight and another chunk is ready.
+
+    Every :meth:`add` returns a :class:`~concurrent.futures.Future` that
+    resolves to the action's ``{op_type: item}`` result, or fails with a
+    :class:`~opensearchpy.helpers.BulkIndexError` holding it. ``callback``,
+    if given, is also called with ``(ok, {op_type: item})`` for every action
+    from the thread that sent it.
+
+    ::
+
+        with BulkProcessor(client, linger=0.5) as processor:
+            for doc in docs:
+                processor.add({"_index": "photos", "_id": doc["id"], "_source": doc})
+
+    :arg client: instance of :class:`~opensearchpy.OpenSearch` to use
+    :arg max_actions: number of actions that triggers a flush
+    :arg max_bytes: size of the pending request body that triggers a flush
+    :arg linger: seconds an action may wait for more to join its chunk,
+        ``None`` to only flush on size or explicitly
+    :arg max_in_flight: maximum number of bulk requests sent concurrently
+    :arg expand_action_callback: callback executed on each action added,
+        should return a tuple containing the action line and the data line
+        (`None` if data line should be omitted).
+    :arg callback: called with ``(ok, item)`` for each completed action
+    :arg ignore_status: list of HTTP status code that you want to ignore
+
+    Any additional keyword arguments will be passed to every
+    :meth:`~opensearchpy.OpenSearch.bulk` call.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_actions: int = 500,
+        max_bytes: int = 5 * 1024 * 1024,
+        linger: Optional[float] = 1.0,
+        max_in_flight: int = 2,
+        expand_action_callback: Any = expand_action,
+        callback: Optional[Callable[[bool, Any], None]] = None,
+        ignore_status: Any = (),
+        **kwargs: Any,
+    ) -> None:
+        self.client = client
+        self.max_actions = max_actions
+        self.max_bytes = max_bytes
+        self.linger = linger
+        self.max_in_flight = max_in_flight
+        self.expand_action_callback = expand_action_callback
+        self.callback = callback
+        self.ignore_status = ignore_status
+        self.kwargs = kwargs
+
+        self._serializer = client.transport.serializer
+        self._lock = threading.Condition()
+        self._closed = False
+        # number of actions added so far, used as their position
+        self._position = 0
+        self._body = bytearray()
+        self._bulk_data: Any = []
+        self._futures: Any = []
+        self._oldest: Optional[float] = None
+
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._in_flight: Any = set()
+        self._executor = ThreadPoolExecutor(
+            max_in_flight, thread_name_prefix="opensearch-bulk"
+        )
+        self._flusher = None
+        if linger is not None:
+            self._flusher = threading.Thread(
+                target=self._linger, name="opensearch-bulk-linger", daemon=True
+            )
+            self._flusher.start()
+
+    def __enter__(self) -> Any:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def add(self, action: Any) -> "Future[Any]":
+        """
+        Queue one action and return a future for its result.
+        """
+        op, data = self.expand_action_callback(action)
+        lines = _dumps_bytes(self._serializer, op) + b"\n"
+        if data is not None:
+            lines += _dumps_bytes(self._serializer, data) + b"\n"
+        op_type = next(iter(op)) if isinstance(op, Mapping) else "index"
+
+        future: "Future[Any]" = Future()
+        chunks = []
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot add actions to a closed BulkProcessor")
+            if self._bulk_data and len(self._body) + len(lines) > self.max_bytes:
+                chunks.append(self._take())
+
+            start = len(self._body)
+            self._body += lines
+            self._bulk_data.append(
+                _ActionRef(self._position, op_type, start, len(self._body))
+            )
+            self._futures.append(future)
+            self._position += 1
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+                self._lock.notify_all()
+
+            if len(self._bulk_data) >= self.max_actions:
+                chunks.append(self._take())
+
+        for chunk in chunks:
+            self._send(chunk)
+        return future
+
+    def flush(self) -> None:
+        """
+        Send all pending actions and wait until every request sent so far
+        has completed.
+        """
+        with self._lock:
+            chunk = self._take() if self._bulk_data else None
+        if chunk is not None:
+            self._send(chunk)
+        with self._lock:
+            in_flight = list(self._in_flight)
+        wait(in_flight)
+
+    def close(self) -> None:
+        """
+        Flush pending actions and stop the background threads. Actions can't
+        be added afterwards.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._lock.notify_all()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    def _take(self) -> Any:
+        chunk = (self._body, self._bulk_data, self._futures)
+        self._body, self._bulk_data, self._futures = bytearray(), [], []
+        self._oldest = None
+        return chunk
+
+    def _send(self, chunk: Any) -> None:
+        # blocks the caller while max_in_flight requests are outstanding
+        self._slots.acquire()
+        try:
+            sent = self._executor.submit(self._run, *chunk)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._in_flight.add(sent)
+        sent.add_done_callback(self._done)
+
+    def _done(self, sent: Any) -> None:
+        with self._lock:
+            self._in_flight.discard(sent)
+        self._slots.release()
+
+    def _run(self, body: bytearray, bulk_data: Any, futures: Any) -> None:
+        try:
+            results = list(
+                _process_bulk_chunk(
+                    self.client,
+                    memoryview(body),
+                    bulk_data,
+                    False,
+                    False,
+                    self.ignore_status,
+                    **self.kwargs,
+                )
+            )
+        except Exception as e:
+            logger.warning("Bulk request of %d actions failed: %s", len(futures), e)
+            for data, future in zip(bulk_data, futures):
+                self._resolve(future, False, _failed_item(data, str(e), e), e)
+            return
+
+        if len(results) != len(futures):
+            logger.warning(
+                "Bulk response has %d items for %d actions", len(results), len(futures)
+            )
+        for future, (ok, item) in zip(futures, results):
+            self._resolve(future, ok, item)
+        # actions without an item in the response must not wait forever
+        for data, future in zip(bulk_data[len(results) :], futures[len(results) :]):
+            item = _failed_item(data, "no item in the bulk response")
+            self._resolve(future, False, item)
+
+    def _resolve(
+        self, future: Any, ok: bool, item: Any, error: Optional[Exception] = None
+    ) -> None:
+        if ok:
+            future.set_result(item)
+        else:
+            future.set_exception(
+                error or BulkIndexError("1 document(s) failed to index.", [item])
+            )
+        if self.callback is not None:
+            try:
+                self.callback(ok, item)
+            except Exception:
+                logger.exception("BulkProcessor callback failed")
+
+    def _linger(self) -> None:
+        while True:
+            with self._lock:
+                while not self._closed:
+                    if self._oldest is None:
+                        self._lock.wait()
+                        continue
+                    age = time.monotonic() - self._oldest
+                    remaining = self.linger - age  # type: ignore
+                    if remaining <= 0:
+                        break
+                    self._lock.wait(remaining)
+                if self._closed:
+                    return
+                chunk = self._take()
+            self._send(chunk)
+
+
+class BulkingClient:
+    """
+    Wraps a client so that :meth:`index`, :meth:`create` and :meth:`delete`
+    are batched through a :class:`BulkProcessor` into ``_bulk`` requests
+    instead of each making a request of its own. Every other attribute is
+    passed through to the wrapped client.
+
+    The batched calls return a :class:`~concurrent.futures.Future` for the
+    item's bulk result (the same fields as the single-document api's
+    response, plus ``status``), or with ``blocking=True`` wait for it and
+    return it - many threads making blocking calls still share requests.
+    Parameters that apply to a whole request, such as ``refresh``, can be
+    set on the processor.
+
+    :arg client: instance of :class:`~opensearchpy.OpenSearch` to wrap
+    :arg processor: processor to batch through, by default one is created
+        from ``kwargs``
+    :arg blocking: wait for each result instead of returning a future
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        processor: Optional[BulkProcessor] = None,
+        blocking: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        self.client = client
+        self.processor = processor or BulkProcessor(client, **kwargs)
+        self.blocking = blocking
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+    def __enter__(self) -> Any:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def index(
+        self,
+        index: Any,
+        body: Any,
+        id: Any = None,
+        op_type: str = "index",
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Batched version of :meth:`~opensearchpy.OpenSearch.index`. ``kwargs``
+        may hold the per-document parameters of the bulk api, such as
+        ``routing``, ``pipeline``, ``if_seq_no`` or ``version``; parameters
+        of the whole request, such as ``refresh``, raise a ``TypeError``.
+        """
+        _check_meta("index", kwargs)
+        action = {"_op_type": op_type, "_index": index, "_source": body, **kwargs}
+        if id is not None:
+            action["_id"] = id
+        return self._submit(action)
+
+    def create(self, index: Any, id: Any, body: Any, **kwargs: Any) -> Any:
+        """Batched version of :meth:`~opensearchpy.OpenSearch.create`."""
+        return self.index(index, body, id=id, op_type="create", **kwargs)
+
+    def delete(self, index: Any, id: Any, **kwargs: Any) -> Any:
+        """Batched version of :meth:`~opensearchpy.OpenSearch.delete`."""
+        _check_meta("delete", kwargs)
+        action = {"_op_type": "delete", "_index": index, "_id": id, **kwargs}
+        return self._submit(action)
+
+    def flush(self) -> None:
+        self.processor.flush()
+
+    def close(self) -> None:
+        """Flush and close the processor; the wrapped client stays open."""
+        self.processor.close()
+
+    def _submit(self, action: Any) -> Any:
+        future = self.processor.add(action)
+        if self.blocking:
+            return _unwrap_item(future.result())
+        unwrapped: "Future[Any]" = Future()
+
+        def _resolve(done: Any) -> None:
+            error = done.exception()
+            if error is not None:
+                unwrapped.set_exception(error)
+            else:
+                unwrapped.set_result(_unwrap_item(done.result()))
+
+        future.add_done_callback(_resolve)
+        return unwrapped
+
+
+def _failed_item(data: _ActionRef, message: str, error: Any = None) -> Any:
+    # the shape _process_bulk_chunk_error gives actions of a failed request
+    info = {"error": message, "status": getattr(error, "status_code", None)}
+    if error is not None:
+        info["exception"] = error
+    info["position"] = data.position
+    return {data.op_type: info}
+
+
+def _check_meta(method: str, kwargs: Any) -> None:
+    # anything else would be silently dropped by expand_action
+    unknown = sorted(set(kwargs).difference(_BULK_META_FIELDS))
+    if unknown:
+        raise TypeError(
+            f"{method}() got parameters that can't be set per document in a bulk "
+            f"request: {', '.join(unknown)}; set request parameters such as "
+            "refresh on the BulkProcessor instead"
+        )
+
+
+def _unwrap_item(item: Any) -> Any:
+    # {"index": {...}} -> {...}, the shape of a single-document response
+    return next(iter(item.values()))
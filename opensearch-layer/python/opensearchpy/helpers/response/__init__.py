@@ -24,11 +24,67 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
-from typing import Any
+from typing import Any, Callable, Dict, Iterator, List
 
 from ..utils import AttrDict, AttrList, _wrap
 from .hit import Hit, HitMeta
 
+# marks the hits of a HitList that have not been created yet
+_MISSING = object()
+
+
+class HitList(AttrList):
+    """
+    The hits of a :class:`Response`, each turned into a :class:`Hit` (or the
+    document class of the search) only when it is first accessed. The other
+    keys of the ``hits`` section, such as ``total`` and ``max_score``, are
+    available as attributes.
+    """
+
+    def __init__(self, hits: Dict[str, Any], get_result: Callable[..., Any]) -> None:
+        super().__init__(hits.get("hits", []))
+        self._hits_ = hits
+        self._get_result = get_result
+        self._results: List[Any] = [_MISSING] * len(self._l_)
+
+    def _result(self, i: int) -> Any:
+        result = self._results[i]
+        if result is _MISSING:
+            try:
+                result = self._results[i] = self._get_result(self._l_[i])
+            except AttributeError as e:
+                # avoid raising AttributeError since it will be hidden by the property
+                raise TypeError("Could not parse hits.", e)
+        return result
+
+    def __getitem__(self, k: Any) -> Any:
+        if isinstance(k, slice):
+            return AttrList([self._result(i) for i in range(*k.indices(len(self)))])
+        return self._result(k)
+
+    def __setitem__(self, k: Any, value: Any) -> None:
+        self._results[k] = value
+
+    def __iter__(self) -> Any:
+        return map(self._result, range(len(self._l_)))
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, AttrList):
+            other = list(other)
+        return bool(list(self) == other)
+
+    def __getattr__(self, name: Any) -> Any:
+        hits = self.__dict__.get("_hits_", {})
+        if name in hits:
+            return _wrap(hits[name])
+        return super().__getattr__(name)
+
+    def __reduce__(self) -> Any:
+        return AttrList, (list(self),)
+
 
 class Response(AttrDict):
     def __init__(self, search: Any, response: Any, doc_class: Any = None) -> None:
@@ -67,21 +123,28 @@ class Response(AttrDict):
     def success(self) -> bool:
         return self._shards.total == self._shards.successful and not self.timed_out
 
+    def sources(self) -> Iterator[Dict[str, Any]]:
+        """
+        The ``_source`` of every hit, as the dict from the response, without
+        creating any :class:`Hit`; the cheapest way to go through the hits
+        when only the documents are needed.
+        """
+        for hit in self._d_["hits"]["hits"]:
+            yield hit.get("_source", {})
+
     @property
     def hits(self) -> Any:
         if not hasattr(self, "_hits"):
-            h = self._d_["hits"]
-
             try:
-                hits = AttrList(map(self._search._get_result, h["hits"]))
+                get_result = self._search._get_result
             except AttributeError as e:
                 # avoid raising AttributeError since it will be hidden by the property
                 raise TypeError("Could not parse hits.", e)
 
             # avoid assigning _hits into self._d_
-            super(AttrDict, self).__setattr__("_hits", hits)
-            for k in h:
-                setattr(self._hits, k, _wrap(h[k]))
+            super(AttrDict, self).__setattr__(
+                "_hits", HitList(self._d_["hits"], get_result)
+            )
         return self._hits
 
     @property
@@ -127,4 +190,11 @@ class UpdateByQueryResponse(AttrDict):
         return not self.timed_out and not self.failures
 
 
-__all__ = ["Response", "AggResponse", "UpdateByQueryResponse", "Hit", "HitMeta"]
+__all__ = [
+    "Response",
+    "AggResponse",
+    "UpdateByQueryResponse",
+    "Hit",
+    "HitList",
+    "HitMeta",
+]
@@ -24,12 +24,21 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
-from typing import Any
+from typing import Any, Dict, Optional, Tuple
 
-from ..utils import AttrDict, HitMeta
+from ..utils import _SCALARS, AttrDict, HitMeta, _wrap
 
 
 class Hit(AttrDict):
+    """
+    A search hit: its ``_source`` and ``fields`` as attributes, and the
+    rest of the hit (``id``, ``score``, ...) as ``meta``, which is only
+    built when first used. Objects and lists within the hit are wrapped
+    once and reused for as long as the hit holds the same value.
+    """
+
+    __slots__ = ("_hit", "_meta", "_wrapped")
+
     def __init__(self, document: Any) -> None:
         data = {}
         if "_source" in document:
@@ -38,15 +47,52 @@ class Hit(AttrDict):
             data.update(document["fields"])
 
         super().__init__(data)
-        # assign meta as attribute and not as key in self._d_
-        super(AttrDict, self).__setattr__("meta", HitMeta(document))
+        # set the slots directly, as AttrDict.__setattr__ writes into self._d_
+        super(AttrDict, self).__setattr__("_hit", document)
+        super(AttrDict, self).__setattr__("_meta", None)
+        super(AttrDict, self).__setattr__("_wrapped", None)
+
+    @property
+    def meta(self) -> HitMeta:
+        meta = self._meta
+        if meta is None:
+            meta = HitMeta(self._hit)
+            super(AttrDict, self).__setattr__("_meta", meta)
+        return meta
+
+    @meta.setter
+    def meta(self, meta: HitMeta) -> None:
+        super(AttrDict, self).__setattr__("_meta", meta)
+
+    def __getattr__(self, attr_name: Any) -> Any:
+        try:
+            value = self._d_[attr_name]
+        except KeyError:
+            raise AttributeError(
+                f"{self.__class__.__name__!r} object has no attribute {attr_name!r}"
+            )
+        if type(value) in _SCALARS:
+            return value
+
+        wrapped: Optional[Dict[str, Tuple[Any, Any]]] = self._wrapped
+        if wrapped is None:
+            wrapped = {}
+            super(AttrDict, self).__setattr__("_wrapped", wrapped)
+        cached = wrapped.get(attr_name)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+        result = _wrap(value)
+        wrapped[attr_name] = (value, result)
+        return result
 
     def __getstate__(self) -> Any:
-        # add self.meta since it is not in self.__dict__
+        # add self.meta since it is not in self._d_
         return super().__getstate__() + (self.meta,)
 
     def __setstate__(self, state: Any) -> None:
-        super(AttrDict, self).__setattr__("meta", state[-1])
+        super(AttrDict, self).__setattr__("_hit", None)
+        super(AttrDict, self).__setattr__("_meta", state[-1])
+        super(AttrDict, self).__setattr__("_wrapped", None)
         super().__setstate__(state[:-1])
 
     def __dir__(self) -> Any:
@@ -7,15 +7,35 @@
 # Modifications Copyright OpenSearch Contributors. See
 # GitHub history for details.
 
-from typing import Any, Callable, Dict, Optional
-from urllib.parse import parse_qs, urlencode, urlparse
+import hashlib
+import hmac
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, quote, urlencode, urlsplit
 
 import requests
 
+EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# frozen credentials are used for this many seconds before they are fetched
+# again; botocore refreshes temporary credentials at least 10 minutes before
+# they expire, so these are always still valid
+CREDENTIALS_TTL = 60.0
+
 
 class AWSV4Signer:
     """
     Generic AWS V4 Request Signer.
+
+    Produces the same headers as botocore's ``SigV4Auth``, without building
+    a request object for every call: the signing key is derived once a day,
+    frozen credentials are reused for ``CREDENTIALS_TTL`` seconds, canonical
+    paths, query strings and hosts are cached, and the body is hashed once.
+    A body digest already present as ``X-Amz-Content-SHA256`` in ``headers``
+    is used as is.
     """
 
     def __init__(self, credentials, region: str, service: str = "es") -> Any:  # type: ignore
@@ -31,6 +51,11 @@ class AWSV4Signer:
             raise ValueError("Service name cannot be empty")
         self.service = service
 
+        # (fetched at, frozen credentials) and (secret key, date, signing key),
+        # each replaced as a whole so threads never see half an update
+        self._frozen: Tuple[float, Any] = (0.0, None)
+        self._signing_key: Tuple[str, str, bytes] = ("", "", b"")
+
     def sign(
         self, method: str, url: str, body: Any, headers: Optional[Dict[str, str]] = None
     ) -> Dict[str, str]:
@@ -41,15 +66,60 @@ class AWSV4Signer:
         :param body: body
         :return: headers
         """
+        credentials = self._frozen_credentials()
+        amz_date = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+        date = amz_date[:8]
+
+        parts = urlsplit(url)
+        host = _canonical_host(parts.scheme, _header(headers, "host") or parts.netloc)
+        payload = _header(headers, "x-amz-content-sha256") or _sha256(body)
+
+        token = credentials.token
+        if token:
+            signed_headers = "host;x-amz-date;x-amz-security-token"
+            canonical_headers = (
+                f"host:{host}\nx-amz-date:{amz_date}\nx-amz-security-token:{token}\n"
+            )
+        else:
+            signed_headers = "host;x-amz-date"
+            canonical_headers = f"host:{host}\nx-amz-date:{amz_date}\n"
+        canonical_request = "\n".join(
+            (
+                method.upper(),
+                _canonical_path(parts.path),
+                _canonical_query(parts.query),
+                canonical_headers,
+                signed_headers,
+                payload,
+            )
+        )
 
-        from botocore.auth import SigV4Auth
-        from botocore.awsrequest import AWSRequest
-
-        signature_host = self._fetch_url(url, headers or dict())
-
-        # create an AWS request object and sign it using SigV4Auth
-        aws_request = AWSRequest(method=method.upper(), url=signature_host, data=body)
+        scope = f"{date}/{self.region}/{self.service}/aws4_request"
+        string_to_sign = "\n".join(
+            (
+                "AWS4-HMAC-SHA256",
+                amz_date,
+                scope,
+                hashlib.sha256(canonical_request.encode("utf-8")).hexdigest(),
+            )
+        )
+        signature = hmac.new(
+            self._key(credentials.secret_key, date),
+            string_to_sign.encode("utf-8"),
+            hashlib.sha256,
+        ).hexdigest()
+
+        signed = {"X-Amz-Date": amz_date}
+        if token:
+            signed["X-Amz-Security-Token"] = token
+        signed["Authorization"] = (
+            f"AWS4-HMAC-SHA256 Credential={credentials.access_key}/{scope}, "
+            f"SignedHeaders={signed_headers}, Signature={signature}"
+        )
+        signed["X-Amz-Content-SHA256"] = payload
+        return signed
 
+    def _frozen_credentials(self) -> Any:
         # credentials objects expose access_key, secret_key and token attributes
         # via @property annotations that call _refresh() on every access,
         # creating a race condition if the credentials expire before secret_key
@@ -57,45 +127,101 @@ class AWSV4Signer:
         # correspond to the secret_key used to sign the request. To avoid this,
         # get_frozen_credentials() which returns non-refreshing credentials is
         # called if it exists.
-        credentials = (
-            self.credentials.get_frozen_credentials()
-            if hasattr(self.credentials, "get_frozen_credentials")
-            and callable(self.credentials.get_frozen_credentials)
-            else self.credentials
-        )
-
-        sig_v4_auth = SigV4Auth(credentials, self.service, self.region)
-        sig_v4_auth.add_auth(aws_request)
-
-        # copy the headers from AWS request object into the prepared_request
-        headers = dict(aws_request.headers.items())
-        headers["X-Amz-Content-SHA256"] = sig_v4_auth.payload(aws_request)
-
-        return headers
-
-    @staticmethod
-    def _fetch_url(url: str, headers: Optional[Dict[str, str]]) -> str:
-        """
-        This is a util method that helps in reconstructing the request url.
-        :param prepared_request: unsigned request
-        :return: reconstructed url
-        """
-        parsed_url = urlparse(url)
-        path = parsed_url.path or "/"
-
-        # fetch the query string if present in the request
-        querystring = ""
-        if parsed_url.query:
-            querystring = "?" + urlencode(
-                parse_qs(parsed_url.query, keep_blank_values=True), doseq=True
+        fetched, credentials = self._frozen
+        now = time.monotonic()
+        if credentials is None or now - fetched > CREDENTIALS_TTL:
+            get_frozen_credentials = getattr(
+                self.credentials, "get_frozen_credentials", None
             )
-
-        # fetch the host information from headers
-        headers = {key.lower(): value for key, value in (headers or dict()).items()}
-        location = headers.get("host") or parsed_url.netloc
-
-        # construct the url and return
-        return parsed_url.scheme + "://" + location + path + querystring
+            credentials = (
+                get_frozen_credentials()
+                if callable(get_frozen_credentials)
+                else self.credentials
+            )
+            self._frozen = (now, credentials)
+        return credentials
+
+    def _key(self, secret_key: str, date: str) -> bytes:
+        cached_secret, cached_date, key = self._signing_key
+        if cached_secret == secret_key and cached_date == date:
+            return key
+        key = _hmac(("AWS4" + secret_key).encode("utf-8"), date)
+        for part in (self.region, self.service, "aws4_request"):
+            key = _hmac(key, part)
+        self._signing_key = (secret_key, date, key)
+        return key
+
+
+def _hmac(key: bytes, msg: str) -> bytes:
+    return hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
+
+
+def _header(headers: Optional[Dict[str, str]], name: str) -> Optional[str]:
+    for key, value in (headers or {}).items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _sha256(body: Any) -> str:
+    if not body:
+        return EMPTY_SHA256
+    # GzipBody carries the digest computed while it was compressed
+    digest = getattr(body, "sha256", None)
+    if isinstance(digest, str):
+        return digest
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if hasattr(body, "read"):
+        # hash file-like bodies in chunks and rewind them for sending
+        position = body.tell()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: body.read(1024 * 1024), b""):
+            digest.update(chunk)
+        body.seek(position)
+        return digest.hexdigest()
+    return hashlib.sha256(body).hexdigest()
+
+
+@lru_cache(maxsize=64)
+def _canonical_host(scheme: str, location: str) -> str:
+    # the host header botocore would sign: lowercase, without a default port
+    parts = urlsplit(f"{scheme}://{location}")
+    host = parts.hostname or ""
+    if ":" in host:
+        host = f"[{host}]"
+    if parts.port is not None and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    return host
+
+
+@lru_cache(maxsize=1024)
+def _canonical_path(path: str) -> str:
+    if not path:
+        return "/"
+    # remove dot segments and empty segments, as botocore does
+    segments: list = []
+    for segment in path.split("/"):
+        if segment == "..":
+            if segments:
+                segments.pop()
+        elif segment and segment != ".":
+            segments.append(segment)
+    normalized = "/" if path[0] == "/" else ""
+    normalized += "/".join(segments)
+    if path[-1] == "/" and segments:
+        normalized += "/"
+    return quote(normalized, safe="/~")
+
+
+@lru_cache(maxsize=1024)
+def _canonical_query(query: str) -> str:
+    if not query:
+        return ""
+    # encode the query the way the request is sent, then sort its pairs
+    query = urlencode(parse_qs(query, keep_blank_values=True), doseq=True)
+    pairs = sorted(pair.partition("=")[::2] for pair in query.split("&"))
+    return "&".join(f"{key}={value}" for key, value in pairs)
 
 
 class RequestsAWSV4SignerAuth(requests.auth.AuthBase):
@@ -54,7 +54,14 @@ META_FIELDS = frozenset(
 ).union(DOC_META_FIELDS)
 
 
+# values that never need wrapping; checking for them first skips the much
+# slower isinstance check against Mapping
+_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+
 def _wrap(val: Any, obj_wrapper: Optional[Callable[..., Any]] = None) -> Any:
+    if type(val) in _SCALARS:
+        return val
     if isinstance(val, collections_abc.Mapping):
         return AttrDict(val) if obj_wrapper is None else obj_wrapper(val)
     if isinstance(val, list):
@@ -121,6 +128,9 @@ class AttrDict:
     nested dsl dicts.
     """
 
+    # subclasses without __slots__ of their own still get a __dict__
+    __slots__ = ("_d_",)
+
     def __init__(self, d: Any) -> None:
         # assign the inner dict manually to prevent __setattr__ from firing
         super().__setattr__("_d_", d)
@@ -7,12 +7,18 @@
 # Modifications Copyright OpenSearch Contributors. See
 # GitHub history for details.
 
+from .emf import EMFExporter
 from .metrics import Metrics
 from .metrics_events import MetricsEvents
+from .metrics_histogram import Histogram, MetricsHistogram, MetricsSnapshot
 from .metrics_none import MetricsNone
 
 __all__ = [
     "Metrics",
     "MetricsEvents",
     "MetricsNone",
+    "MetricsHistogram",
+    "MetricsSnapshot",
+    "Histogram",
+    "EMFExporter",
 ]
@@ -0,0 +1,148 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import json
+import sys
+import time
+from typing import Any, Dict, List, Mapping, Optional, TextIO
+
+from opensearchpy.metrics.metrics_histogram import (
+    Histogram,
+    MetricsHistogram,
+    MetricsSnapshot,
+)
+
+# CloudWatch accepts at most this many distinct values per metric
+_MAX_VALUES = 100
+
+
+class EMFExporter:
+    """
+    Writes :class:`MetricsHistogram` data to ``stream`` (stdout by default)
+    in the CloudWatch Embedded Metric Format, one JSON line per endpoint
+    and status, which CloudWatch Logs - for instance from a Lambda
+    function - turns into metrics without any API call. Latencies are sent
+    as value/count distributions, so CloudWatch can compute p50, p99 and
+    other percentiles over any period.
+
+    ::
+
+        metrics = MetricsHistogram()
+        client = OpenSearch(hosts, metrics=metrics)
+        exporter = EMFExporter(metrics, dimensions={"Function": "LF2"})
+        ...
+        exporter.export()  # e.g. at the end of every invocation
+
+    :arg metrics: the metrics to export
+    :arg namespace: CloudWatch namespace of the metrics
+    :arg dimensions: extra dimensions added to every metric
+    :arg stream: where to write the log lines
+    """
+
+    def __init__(
+        self,
+        metrics: MetricsHistogram,
+        namespace: str = "OpenSearchClient",
+        dimensions: Optional[Mapping[str, str]] = None,
+        stream: Optional[TextIO] = None,
+    ) -> None:
+        self.metrics = metrics
+        self.namespace = namespace
+        self.dimensions = dict(dimensions or {})
+        self.stream = stream
+
+    def export(self, reset: bool = True) -> MetricsSnapshot:
+        """
+        Write everything recorded since the last reset and return it; with
+        ``reset=False`` the same data is exported again next time.
+        """
+        snapshot = self.metrics.snapshot(reset=reset)
+        stream = self.stream or sys.stdout
+        for document in self.documents(snapshot):
+            stream.write(json.dumps(document, separators=(",", ":")) + "\n")
+        stream.flush()
+        return snapshot
+
+    def documents(self, snapshot: MetricsSnapshot) -> List[Dict[str, Any]]:
+        """The EMF documents for ``snapshot``."""
+        timestamp = int(time.time() * 1000)
+        names = list(self.dimensions)
+        documents = []
+
+        for (endpoint, status), histogram in sorted(snapshot.latency.items()):
+            document = self._document(
+                timestamp,
+                names + ["Endpoint", "Status"],
+                [
+                    ("Latency", "Milliseconds"),
+                    ("RequestBytes", "Bytes"),
+                    ("ResponseBytes", "Bytes"),
+                ],
+            )
+            document.update(Endpoint=endpoint, Status=status)
+            document["Latency"] = _distribution(histogram)
+            document["RequestBytes"] = snapshot.request_bytes.get(
+                (endpoint, status), 0
+            )
+            document["ResponseBytes"] = snapshot.response_bytes.get(
+                (endpoint, status), 0
+            )
+            documents.append(document)
+
+        if snapshot.retries or snapshot.dead_connections:
+            document = self._document(
+                timestamp, names, [("Retries", "Count"), ("DeadConnections", "Count")]
+            )
+            document["Retries"] = snapshot.retries
+            document["DeadConnections"] = snapshot.dead_connections
+            documents.append(document)
+        return documents
+
+    def _document(
+        self, timestamp: int, dimensions: List[str], metrics: List[Any]
+    ) -> Dict[str, Any]:
+        document: Dict[str, Any] = {
+            "_aws": {
+                "Timestamp": timestamp,
+                "CloudWatchMetrics": [
+                    {
+                        "Namespace": self.namespace,
+                        "Dimensions": [dimensions],
+                        "Metrics": [
+                            {"Name": name, "Unit": unit} for name, unit in metrics
+                        ],
+                    }
+                ],
+            }
+        }
+        document.update(self.dimensions)
+        return document
+
+
+def _distribution(histogram: Histogram) -> Dict[str, Any]:
+    buckets = [(value * 1000, count) for value, count in histogram.buckets()]
+    # merge neighbouring buckets until CloudWatch accepts the distribution
+    while len(buckets) > _MAX_VALUES:
+        merged = []
+        for i in range(0, len(buckets) - 1, 2):
+            (a, a_count), (b, b_count) = buckets[i], buckets[i + 1]
+            merged.append(
+                ((a * a_count + b * b_count) / (a_count + b_count), a_count + b_count)
+            )
+        if len(buckets) % 2:
+            merged.append(buckets[-1])
+        buckets = merged
+    return {
+        "Values": [round(value, 3) for value, _ in buckets],
+        "Counts": [count for _, count in buckets],
+        "Min": round(histogram.min * 1000, 3),
+        "Max": round(histogram.max * 1000, 3),
+        "Sum": round(histogram.total * 1000, 3),
+        "Count": histogram.count,
+    }
@@ -8,7 +8,7 @@
 # GitHub history for details.
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Optional
 
 
 class Metrics(ABC):
@@ -40,3 +40,26 @@ class Metrics(ABC):
     @abstractmethod
     def service_time(self) -> Optional[float]:
         pass
+
+    # Optional hooks, called with more detail than request_start and
+    # request_end; the default implementations ignore them.
+
+    def request_completed(
+        self,
+        method: str,
+        path: str,
+        status: Optional[int],
+        duration: float,
+        request_bytes: int,
+        response_bytes: int,
+    ) -> None:
+        """
+        Called by the connection once a request has completed, with
+        ``status`` ``None`` if it failed without a response.
+        """
+
+    def request_retried(self, method: str, path: str) -> None:
+        """Called by the transport before a request is retried."""
+
+    def connection_marked_dead(self, connection: Any) -> None:
+        """Called by the transport when a connection is marked as dead."""
@@ -0,0 +1,287 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from opensearchpy.metrics.metrics import Metrics
+
+# each power of two is split into this many linear buckets, bounding the
+# relative error of a recorded value to 1 / _SUB_BUCKETS
+_SUB_BITS = 4
+_SUB_BUCKETS = 1 << _SUB_BITS
+
+
+def _bucket(value: int) -> int:
+    if value < 2 * _SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - _SUB_BITS - 1
+    return (shift + 1) * _SUB_BUCKETS + (value >> shift) - _SUB_BUCKETS
+
+
+def _bucket_range(index: int) -> Tuple[int, int]:
+    """Lowest value of bucket ``index`` and its width."""
+    if index < 2 * _SUB_BUCKETS:
+        return index, 1
+    shift = index // _SUB_BUCKETS - 1
+    return (index % _SUB_BUCKETS + _SUB_BUCKETS) << shift, 1 << shift
+
+
+class Histogram:
+    """
+    Log-linear histogram of durations, kept in microseconds with a
+    relative error of at most 1/16.
+    """
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        index = _bucket(max(int(seconds * 1e6), 0))
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other: "Histogram") -> None:
+        for index, count in list(other.counts.items()):
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Duration in seconds below which ``q`` percent of the values fall."""
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                low, width = _bucket_range(index)
+                value = (low + width / 2) / 1e6
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def buckets(self) -> Iterator[Tuple[float, int]]:
+        """``(midpoint in seconds, count)`` of every non-empty bucket, in order."""
+        for index in sorted(self.counts):
+            low, width = _bucket_range(index)
+            yield (low + width / 2) / 1e6, self.counts[index]
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+
+class MetricsSnapshot:
+    """
+    Point-in-time copy of the data collected by :class:`MetricsHistogram`:
+    a latency :class:`Histogram` and request/response byte totals per
+    ``(endpoint, status)``, and the ``retries`` and ``dead_connections``
+    counters. Snapshots from several clients or processes can be combined
+    with :meth:`merge`.
+    """
+
+    def __init__(self) -> None:
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.request_bytes: Dict[Tuple[str, str], int] = {}
+        self.response_bytes: Dict[Tuple[str, str], int] = {}
+        self.retries = 0
+        self.dead_connections = 0
+
+    def merge(self, other: "MetricsSnapshot") -> "MetricsSnapshot":
+        # other may be a shard another thread is still writing to
+        for key, histogram in list(other.latency.items()):
+            self.latency.setdefault(key, Histogram()).merge(histogram)
+        for key, size in list(other.request_bytes.items()):
+            self.request_bytes[key] = self.request_bytes.get(key, 0) + size
+        for key, size in list(other.response_bytes.items()):
+            self.response_bytes[key] = self.response_bytes.get(key, 0) + size
+        self.retries += other.retries
+        self.dead_connections += other.dead_connections
+        return self
+
+    def percentile(self, q: float, endpoint: Optional[str] = None) -> Optional[float]:
+        """Latency percentile over all requests, or those to ``endpoint``."""
+        total = Histogram()
+        for (name, _), histogram in self.latency.items():
+            if endpoint is None or name == endpoint:
+                total.merge(histogram)
+        return total.percentile(q)
+
+
+class _Shard:
+    # one thread's data: only that thread writes to ``data``, and ``writes``
+    # is odd while it does
+    __slots__ = ("data", "writes", "thread")
+
+    def __init__(self) -> None:
+        self.data = MetricsSnapshot()
+        self.writes = 0
+        self.thread = threading.current_thread()
+
+
+class MetricsHistogram(Metrics):
+    """
+    Thread-safe metrics collecting a latency histogram and byte counters
+    for every endpoint and response status, and counting retries and
+    connections marked as dead. Endpoints are request paths with index
+    names and ids replaced, such as ``POST /{index}/_search``.
+
+    Each thread records into its own shard without locking; :meth:`snapshot`
+    merges the shards into a :class:`MetricsSnapshot`, and with
+    ``reset=True`` empties them, waiting for writes under way so that every
+    value lands in exactly one interval. Shards of threads that have exited
+    are folded together by the next snapshot.
+
+    ``start_time``, ``end_time`` and ``service_time`` describe the last
+    request made by the calling thread.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._timing = threading.local()
+        self._shards: List[_Shard] = []
+        # data of exited threads since the last reset
+        self._exited = MetricsSnapshot()
+        self._lock = threading.Lock()
+
+    @property
+    def start_time(self) -> Optional[float]:
+        return getattr(self._timing, "start_time", None)
+
+    @property
+    def end_time(self) -> Optional[float]:
+        return getattr(self._timing, "end_time", None)
+
+    @property
+    def service_time(self) -> Optional[float]:
+        start, end = self.start_time, self.end_time
+        if start is None or end is None:
+            return None
+        return end - start
+
+    def request_start(self) -> None:
+        self._timing.start_time = time.perf_counter()
+        self._timing.end_time = None
+
+    def request_end(self) -> None:
+        self._timing.end_time = time.perf_counter()
+
+    def request_completed(
+        self,
+        method: str,
+        path: str,
+        status: Optional[int],
+        duration: float,
+        request_bytes: int,
+        response_bytes: int,
+    ) -> None:
+        key = (endpoint(method, path), str(status) if status else "error")
+        shard = self._shard()
+        shard.writes += 1
+        try:
+            data = shard.data
+            histogram = data.latency.get(key)
+            if histogram is None:
+                histogram = data.latency[key] = Histogram()
+            histogram.record(duration)
+            data.request_bytes[key] = data.request_bytes.get(key, 0) + request_bytes
+            data.response_bytes[key] = (
+                data.response_bytes.get(key, 0) + response_bytes
+            )
+        finally:
+            shard.writes += 1
+
+    def request_retried(self, method: str, path: str) -> None:
+        shard = self._shard()
+        shard.writes += 1
+        try:
+            shard.data.retries += 1
+        finally:
+            shard.writes += 1
+
+    def connection_marked_dead(self, connection: Any) -> None:
+        shard = self._shard()
+        shard.writes += 1
+        try:
+            shard.data.dead_connections += 1
+        finally:
+            shard.writes += 1
+
+    def snapshot(self, reset: bool = False) -> MetricsSnapshot:
+        """
+        Merge what every thread has recorded so far, and optionally start
+        over.
+        """
+        result = MetricsSnapshot()
+        with self._lock:
+            result.merge(self._exited)
+            if reset:
+                self._exited = MetricsSnapshot()
+            shards = []
+            for shard in self._shards:
+                if not shard.thread.is_alive():
+                    # nothing writes to it any more
+                    result.merge(shard.data)
+                    if not reset:
+                        self._exited.merge(shard.data)
+                    continue
+                shards.append(shard)
+                data = shard.data
+                if reset:
+                    # the thread's next write goes to the new data; wait for
+                    # one that may still be writing to the old
+                    shard.data = MetricsSnapshot()
+                    while shard.writes & 1:
+                        time.sleep(0)
+                result.merge(data)
+            self._shards = shards
+        return result
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        self.snapshot(reset=True)
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+
+def endpoint(method: str, path: str) -> str:
+    """
+    ``method path`` with the query string dropped and the index and id
+    segments replaced, so that requests to the same api share a key:
+    ``GET /photos/_doc/a.jpg`` becomes ``GET /{index}/_doc/{id}``.
+    """
+    path = path.split("?", 1)[0]
+    parts = []
+    for i, segment in enumerate(path.strip("/").split("/")):
+        if not segment or segment.startswith("_"):
+            parts.append(segment)
+        else:
+            parts.append("{index}" if i == 0 else "{id}")
+    return f"{method} /" + "/".join(parts)
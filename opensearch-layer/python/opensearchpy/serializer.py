@@ -25,13 +25,15 @@
 #  under the License.
 
 
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 try:
     import simplejson as json
 except ImportError:
     import json  # type: ignore
 
+import math
+import re
 import uuid
 from datetime import date, datetime
 from decimal import Decimal
@@ -45,6 +47,245 @@ FLOAT_TYPES = (Decimal,)
 TIME_TYPES = (date, datetime)
 
 
+class JSONBackend:
+    """
+    Encoder/decoder pair used by :class:`JSONSerializer`. ``dumps`` returns
+    UTF-8 encoded ``bytes`` and calls ``default`` for any value the backend
+    can't encode natively; ``loads`` accepts ``str`` or ``bytes``.
+    """
+
+    name: str = ""
+
+    def dumps(self, data: Any, default: Callable[[Any], Any]) -> bytes:
+        raise NotImplementedError()
+
+    def loads(self, s: Union[str, bytes]) -> Any:
+        raise NotImplementedError()
+
+    def __reduce__(self) -> Any:
+        # backends may hold module references; rebuild them on unpickling
+        return self.__class__, ()
+
+
+class StdlibJSONBackend(JSONBackend):
+    """``json`` from the standard library, or ``simplejson`` if installed."""
+
+    name = "json"
+
+    def dumps(self, data: Any, default: Callable[[Any], Any]) -> bytes:
+        return json.dumps(
+            data, default=default, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8", "surrogatepass")
+
+    def loads(self, s: Union[str, bytes]) -> Any:
+        if not isinstance(s, (str, bytes, bytearray)):
+            # memoryview or mmap
+            s = bytes(s)
+        return json.loads(s)
+
+
+class OrjsonJSONBackend(JSONBackend):
+    """
+    `orjson <https://github.com/ijl/orjson>`_ backend. Output is identical
+    to the stdlib backend: dates, times and dataclasses are passed through to
+    ``default``, and anything orjson rejects (e.g. integers wider than 64
+    bits) or would write differently is serialized with the stdlib backend
+    instead. That covers ``NaN`` and infinities, which orjson turns into
+    ``null``, and floats (or ``Decimal`` values) below ``1e-4`` or from
+    ``1e16`` up, which orjson writes as ``0.00001`` or ``1e16`` where the
+    stdlib writes ``1e-05`` and ``1e+16``. Documents orjson can't parse,
+    such as ones containing ``NaN``, are parsed by the stdlib backend too.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._options = (
+            orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_NON_STR_KEYS
+        )
+        self._fallback = StdlibJSONBackend()
+
+    def dumps(self, data: Any, default: Callable[[Any], Any]) -> bytes:
+        # values returned by default (numpy floats, Decimal) can be
+        # non-finite too, so check them as they are converted
+        converted_non_finite = []
+
+        def _default(value: Any) -> Any:
+            value = default(value)
+            if _has_non_finite(value):
+                converted_non_finite.append(value)
+            return value
+
+        try:
+            out = self._orjson.dumps(data, default=_default, option=self._options)
+        except TypeError:
+            return self._fallback.dumps(data, default)
+        if (
+            converted_non_finite
+            # non-finite floats come out as null; only look for them when it appears
+            or (b"null" in out and _has_non_finite(data))
+            or _has_orjson_only_float(out)
+        ):
+            return self._fallback.dumps(data, default)
+        return out  # type: ignore
+
+    def loads(self, s: Union[str, bytes]) -> Any:
+        try:
+            return self._orjson.loads(s)
+        except self._orjson.JSONDecodeError:
+            # NaN, Infinity, lone surrogates and out of range numbers are
+            # accepted by the stdlib; invalid JSON fails there as well
+            return self._fallback.loads(s)
+
+
+# a number orjson writes in a different notation than float.__repr__: with an
+# exponent, or below 1e-4 without one; strings matching this only cost a
+# fallback to the stdlib backend
+_ORJSON_ONLY_FLOAT = re.compile(rb"(?:^|[:,\[])-?(?:[0-9]+(?:\.[0-9]+)?e|0\.0000)")
+# starts with a literal, so it is much cheaper to search for than the above
+_EXPONENT = re.compile(rb"e[-0-9]")
+
+
+def _has_orjson_only_float(out: bytes) -> bool:
+    return bool(
+        (b"0.0000" in out or _EXPONENT.search(out))
+        and _ORJSON_ONLY_FLOAT.search(out)
+    )
+
+
+def _has_non_finite(data: Any) -> bool:
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite(value) for value in data)
+    return False
+
+
+# name -> backend class, in order of preference
+JSON_BACKENDS: Dict[str, Type[JSONBackend]] = {
+    OrjsonJSONBackend.name: OrjsonJSONBackend,
+    StdlibJSONBackend.name: StdlibJSONBackend,
+}
+
+
+def register_json_backend(backend_class: Type[JSONBackend], preferred: bool = False) -> None:
+    """
+    Make a :class:`JSONBackend` available to :func:`get_json_backend`.
+
+    :arg backend_class: backend class; instantiating it should raise
+        ``ImportError`` if its library is missing
+    :arg preferred: try this backend before the already registered ones
+    """
+    global JSON_BACKENDS
+    if preferred:
+        backends = {backend_class.name: backend_class}
+        backends.update(
+            (k, v) for k, v in JSON_BACKENDS.items() if k != backend_class.name
+        )
+        JSON_BACKENDS = backends
+    else:
+        JSON_BACKENDS[backend_class.name] = backend_class
+
+
+def get_json_backend(name: Optional[str] = None) -> JSONBackend:
+    """
+    Instantiate the named backend, or the first registered backend whose
+    library is installed.
+    """
+    if name is not None:
+        try:
+            return JSON_BACKENDS[name]()
+        except KeyError:
+            raise ImproperlyConfigured(f"Unknown JSON backend: {name}")
+        except ImportError as e:
+            raise ImproperlyConfigured(f"JSON backend {name!r} is not installed: {e}")
+
+    for backend_class in JSON_BACKENDS.values():
+        try:
+            return backend_class()
+        except ImportError:
+            continue
+    return StdlibJSONBackend()
+
+
+def _load_extra_converters() -> List[Tuple[Tuple[type, ...], Callable[[Any], Any]]]:
+    """
+    Conversions for numpy and pandas types. These are expensive to import so
+    they are only resolved the first time a value no cheaper check handles is
+    serialized, and never again afterwards.
+    """
+    converters: List[Tuple[Tuple[type, ...], Callable[[Any], Any]]] = []
+    try:
+        import numpy as np
+
+        converters.extend(
+            [
+                (
+                    (
+                        np.int_,
+                        np.intc,
+                        np.int8,
+                        np.int16,
+                        np.int32,
+                        np.int64,
+                        np.uint8,
+                        np.uint16,
+                        np.uint32,
+                        np.uint64,
+                    ),
+                    int,
+                ),
+                ((np.float16, np.float32, np.float64), float),
+                ((np.bool_,), bool),
+                ((np.datetime64,), lambda data: data.item().isoformat()),
+                ((np.ndarray,), lambda data: data.tolist()),
+            ]
+        )
+    except ImportError:
+        pass
+
+    try:
+        import pandas as pd
+
+        converters.append(((pd.Series, pd.Categorical), lambda data: data.tolist()))
+        if getattr(pd, "NA", None) is not None:
+            converters.append(((type(pd.NA),), lambda data: None))
+    except ImportError:
+        pass
+
+    return converters
+
+
+_extra_converters: Optional[List[Tuple[Tuple[type, ...], Callable[[Any], Any]]]] = None
+_converter_by_type: Dict[type, Optional[Callable[[Any], Any]]] = {}
+
+
+def _find_converter(cls: type) -> Optional[Callable[[Any], Any]]:
+    try:
+        return _converter_by_type[cls]
+    except KeyError:
+        pass
+
+    global _extra_converters
+    if _extra_converters is None:
+        _extra_converters = _load_extra_converters()
+
+    converter = None
+    for types, candidate in _extra_converters:
+        if issubclass(cls, types):
+            converter = candidate
+            break
+    _converter_by_type[cls] = converter
+    return converter
+
+
 class Serializer:
     mimetype: str = ""
 
@@ -54,11 +295,20 @@ class Serializer:
     def dumps(self, data: Any) -> Any:
         raise NotImplementedError()
 
+    def dumps_bytes(self, data: Any) -> bytes:
+        """Like ``dumps`` but always returns UTF-8 encoded ``bytes``."""
+        data = self.dumps(data)
+        if isinstance(data, str):
+            return data.encode("utf-8", "surrogatepass")
+        return data  # type: ignore
+
 
 class TextSerializer(Serializer):
     mimetype: str = "text/plain"
 
-    def loads(self, s: str) -> Any:
+    def loads(self, s: Union[str, bytes]) -> Any:
+        if isinstance(s, bytes):
+            return s.decode("utf-8", "surrogatepass")
         return s
 
     def dumps(self, data: Any) -> Any:
@@ -69,7 +319,17 @@ class TextSerializer(Serializer):
 
 
 class JSONSerializer(Serializer):
+    """
+    :arg backend: name of the :class:`JSONBackend` to use, defaults to the
+        fastest installed one (orjson if available, otherwise stdlib json)
+    """
+
     mimetype: str = "application/json"
+    # used by subclasses that don't call ``__init__``
+    backend: JSONBackend = StdlibJSONBackend()
+
+    def __init__(self, backend: Optional[str] = None) -> None:
+        self.backend = get_json_backend(backend)
 
     def default(self, data: Any) -> Any:
         if isinstance(data, TIME_TYPES):
@@ -88,63 +348,15 @@ class JSONSerializer(Serializer):
             return int(data)
 
         # Special cases for numpy and pandas types
-        # These are expensive to import so we try them last.
-        try:
-            import numpy as np
-
-            if isinstance(
-                data,
-                (
-                    np.int_,
-                    np.intc,
-                    np.int8,
-                    np.int16,
-                    np.int32,
-                    np.int64,
-                    np.uint8,
-                    np.uint16,
-                    np.uint32,
-                    np.uint64,
-                ),
-            ):
-                return int(data)
-            elif isinstance(
-                data,
-                (
-                    np.float16,
-                    np.float32,
-                    np.float64,
-                ),
-            ):
-                return float(data)
-            elif isinstance(data, np.bool_):
-                return bool(data)
-            elif isinstance(data, np.datetime64):
-                return data.item().isoformat()
-            elif isinstance(data, np.ndarray):
-                return data.tolist()
-        except ImportError:
-            pass
-
-        try:
-            import pandas as pd
-
-            if isinstance(data, (pd.Series, pd.Categorical)):
-                return data.tolist()
-            elif isinstance(data, pd.Timestamp) and data is not getattr(
-                pd, "NaT", None
-            ):
-                return data.isoformat()
-            elif data is getattr(pd, "NA", None):
-                return None
-        except ImportError:
-            pass
+        converter = _find_converter(type(data))
+        if converter is not None:
+            return converter(data)
 
         raise TypeError(f"Unable to serialize {data!r} (type: {type(data)})")
 
-    def loads(self, s: str) -> Any:
+    def loads(self, s: Union[str, bytes]) -> Any:
         try:
-            return json.loads(s)
+            return self.backend.loads(s)
         except (ValueError, TypeError) as e:
             raise SerializationError(s, e)
 
@@ -153,10 +365,16 @@ class JSONSerializer(Serializer):
         if isinstance(data, string_types):
             return data
 
+        return self.dumps_bytes(data).decode("utf-8", "surrogatepass")
+
+    def dumps_bytes(self, data: Any) -> bytes:
+        if isinstance(data, str):
+            return data.encode("utf-8", "surrogatepass")
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return data  # type: ignore
+
         try:
-            return json.dumps(
-                data, default=self.default, ensure_ascii=False, separators=(",", ":")
-            )
+            return self.backend.dumps(data, self.default)
         except (ValueError, TypeError) as e:
             raise SerializationError(data, e)
 
@@ -181,7 +399,7 @@ class Deserializer:
             )
         self.serializers = serializers
 
-    def loads(self, s: str, mimetype: Optional[str] = None) -> Any:
+    def loads(self, s: Union[str, bytes], mimetype: Optional[str] = None) -> Any:
         if not mimetype:
             deserializer = self.default
         else:
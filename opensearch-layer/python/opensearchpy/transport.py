@@ -25,22 +25,47 @@
 #  under the License.
 
 
+import copy
+import re
+import threading
 import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
 from itertools import chain
 from typing import Any, Callable, Collection, Dict, List, Mapping, Optional, Type, Union
 
 from opensearchpy.metrics import Metrics, MetricsNone
 
 from .connection import Connection, Urllib3HttpConnection
-from .connection_pool import ConnectionPool, DummyConnectionPool, EmptyConnectionPool
+from .connection_pool import (
+    ConnectionPool,
+    DummyConnectionPool,
+    EmptyConnectionPool,
+    affinity_key,
+)
 from .exceptions import (
     ConnectionError,
     ConnectionTimeout,
     SerializationError,
     TransportError,
 )
+from .connection.streaming import DEFAULT_SPILL_THRESHOLD
+from .connection.timing import RequestTimings, current_timings
 from .serializer import DEFAULT_SERIALIZERS, Deserializer, JSONSerializer, Serializer
 
+# spill threshold of the enclosing Transport.streaming() block, if any
+_streaming: ContextVar[Optional[int]] = ContextVar("_streaming", default=None)
+
+# status of the last response received in this context, including those
+# returned because they are in ``ignore``
+_response_status: ContextVar[Optional[int]] = ContextVar(
+    "_response_status", default=None
+)
+
+# read-only apis that are sent as POST because they take a body
+_COALESCE_POST = re.compile(r"/_(?:m?search(?:/template)?|count|mget)$")
+
 
 def get_host_info(
     node_info: Dict[str, Any], host: Optional[Dict[str, Any]]
@@ -64,6 +89,56 @@ def get_host_info(
     return host
 
 
+class RequestCoalescer:
+    """
+    Collapses concurrent identical calls into one: the first caller with a
+    given key runs the call, and callers arriving with the same key while it
+    is in flight wait for it and receive a deep copy of its result, or its
+    exception.
+
+    ``executed`` counts the calls that were run and ``coalesced`` the calls
+    that were answered by another one instead.
+    """
+
+    def __init__(self) -> None:
+        self.executed = 0
+        self.coalesced = 0
+        self._calls: Dict[Any, "Future[Any]"] = {}
+        self._lock = threading.Lock()
+
+    def call(self, key: Any, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            if future is None:
+                future = self._calls[key] = Future()
+                self.executed += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            return copy.deepcopy(future.result())
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._forget(key)
+            future.set_exception(e)
+            raise
+        self._forget(key)
+        future.set_result(result)
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        return {"executed": self.executed, "coalesced": self.coalesced}
+
+    def _forget(self, key: Any) -> None:
+        # later callers start a new call rather than joining a finished one
+        with self._lock:
+            del self._calls[key]
+
+
 class Transport:
     """
     Encapsulation of transport-related to logic. Handles instantiation of the
@@ -116,6 +191,8 @@ class Transport:
         retry_on_timeout: bool = False,
         send_get_body_as: str = "GET",
         metrics: Metrics = MetricsNone(),
+        coalesce_requests: bool = False,
+        timings_callback: Optional[Callable[[RequestTimings], None]] = None,
         **kwargs: Any
     ) -> None:
         """
@@ -155,12 +232,23 @@ class Transport:
         :arg metrics: metrics is an instance of a subclass of the
             :class:`~opensearchpy.Metrics` class, used for collecting
             and reporting metrics related to the client's operations;
+        :arg coalesce_requests: let concurrent identical read requests (same
+            method, path, params, headers and body) share a single call to
+            the cluster, see :class:`RequestCoalescer`; its counters are
+            available as ``transport.coalescer.stats()``
+        :arg timings_callback: called with the
+            :class:`~opensearchpy.connection.timing.RequestTimings` of every
+            attempt, successful or not, once it is over: how long DNS,
+            connecting, TLS, sending, waiting for the response, downloading
+            and deserializing it took, next to the server-reported ``took``
 
         Any extra keyword arguments will be passed to the `connection_class`
         when creating and instance unless overridden by that connection's
         options provided as part of the hosts parameter.
         """
         self.metrics = metrics
+        self.coalescer = RequestCoalescer() if coalesce_requests else None
+        self.timings_callback = timings_callback
         if connection_class is None:
             connection_class = self.DEFAULT_CONNECTION_CLASS
 
@@ -372,6 +460,7 @@ class Transport:
         """
         # mark as dead even when sniffing to avoid hitting this host during the sniff process
         self.connection_pool.mark_dead(connection)
+        self.metrics.connection_marked_dead(connection)
         if self.sniff_on_connection_fail:
             self.sniff_hosts()
 
@@ -411,63 +500,212 @@ class Transport:
             method, params, body, ignore, timeout
         )
 
+        key = self._coalesce_key(method, url, params, body, ignore, timeout, headers)
+        if key is not None:
+            return self.coalescer.call(  # type: ignore
+                key,
+                lambda: self._perform_request(
+                    method, url, params, body, timeout, ignore, headers
+                ),
+            )
+        return self._perform_request(
+            method, url, params, body, timeout, ignore, headers
+        )
+
+    def _coalesce_key(
+        self,
+        method: str,
+        url: str,
+        params: Any,
+        body: Any,
+        ignore: Collection[int],
+        timeout: Optional[Union[int, float]],
+        headers: Optional[Mapping[str, str]],
+    ) -> Any:
+        """
+        Key identifying a read request that may share its response with
+        identical concurrent ones, or ``None`` if it must be sent on its own.
+        """
+        if self.coalescer is None or _streaming.get() is not None:
+            return None
+        if method not in ("GET", "HEAD") and not (
+            method == "POST" and _COALESCE_POST.search(url)
+        ):
+            return None
+        # every scroll request opens or advances its own cursor
+        if "/_search/scroll" in url or (params and "scroll" in params):
+            return None
+        if isinstance(body, str):
+            # serializers without dumps_bytes produce str bodies
+            body = body.encode("utf-8", "surrogatepass")
+        return (
+            method,
+            url,
+            tuple(sorted((k, str(v)) for k, v in params.items())) if params else (),
+            bytes(body) if body is not None else None,
+            tuple(sorted(headers.items())) if headers else (),
+            tuple(ignore),
+            timeout,
+        )
+
+    def _perform_request(
+        self,
+        method: str,
+        url: str,
+        params: Any,
+        body: Any,
+        timeout: Optional[Union[int, float]],
+        ignore: Collection[int],
+        headers: Optional[Mapping[str, str]],
+    ) -> Any:
+        spill_threshold = _streaming.get() if method != "HEAD" else None
+
         for attempt in range(self.max_retries + 1):
             connection = self.get_connection()
+            timings = token = None
+            if self.timings_callback is not None:
+                timings = RequestTimings(method, url)
+                token = current_timings.set(timings)
 
             try:
-                status, headers_response, data = connection.perform_request(
-                    method,
-                    url,
-                    params,
-                    body,
-                    headers=headers,
-                    ignore=ignore,
-                    timeout=timeout,
-                )
+                try:
+                    with self.connection_pool.track(connection):
+                        if spill_threshold is not None:
+                            status, headers_response, data = (
+                                connection.perform_streaming_request(
+                                    method,
+                                    url,
+                                    params,
+                                    body,
+                                    headers=headers,
+                                    ignore=ignore,
+                                    timeout=timeout,
+                                    loads=self.deserializer.loads,
+                                    spill_threshold=spill_threshold,
+                                )
+                            )
+                        else:
+                            status, headers_response, data = connection.perform_request(
+                                method,
+                                url,
+                                params,
+                                body,
+                                headers=headers,
+                                ignore=ignore,
+                                timeout=timeout,
+                            )
 
-                # Lowercase all the header names for consistency in accessing them.
-                headers_response = {
-                    header.lower(): value for header, value in headers_response.items()
-                }
-
-            except TransportError as e:
-                if method == "HEAD" and e.status_code == 404:
-                    return False
-
-                retry = False
-                if isinstance(e, ConnectionTimeout):
-                    retry = self.retry_on_timeout
-                elif isinstance(e, ConnectionError):
-                    retry = True
-                elif e.status_code in self.retry_on_status:
-                    retry = True
-
-                if retry:
-                    try:
-                        # only mark as dead if we are retrying
-                        self.mark_dead(connection)
-                    except TransportError:
-                        # If sniffing on failure, it could fail too. Catch the
-                        # exception not to interrupt the retries.
-                        pass
-                    # raise exception on last retry
-                    if attempt == self.max_retries:
+                    # Lowercase all the header names for consistency in accessing them.
+                    headers_response = {
+                        header.lower(): value
+                        for header, value in headers_response.items()
+                    }
+
+                except TransportError as e:
+                    if timings is not None and isinstance(e.status_code, int):
+                        timings.status = e.status_code
+                    _response_status.set(
+                        e.status_code if isinstance(e.status_code, int) else None
+                    )
+                    if method == "HEAD" and e.status_code == 404:
+                        return False
+
+                    retry = False
+                    if isinstance(e, ConnectionTimeout):
+                        retry = self.retry_on_timeout
+                    elif isinstance(e, ConnectionError):
+                        retry = True
+                    elif e.status_code in self.retry_on_status:
+                        retry = True
+
+                    if retry:
+                        try:
+                            # only mark as dead if we are retrying
+                            self.mark_dead(connection)
+                        except TransportError:
+                            # If sniffing on failure, it could fail too. Catch the
+                            # exception not to interrupt the retries.
+                            pass
+                        # raise exception on last retry
+                        if attempt == self.max_retries:
+                            raise e
+                        self.metrics.request_retried(method, url)
+                    else:
                         raise e
-                else:
-                    raise e
 
-            else:
-                # connection didn't fail, confirm its live status
-                self.connection_pool.mark_live(connection)
+                else:
+                    # connection didn't fail, confirm its live status
+                    self.connection_pool.mark_live(connection)
+                    _response_status.set(status)
+                    if timings is not None:
+                        timings.status = status
+
+                    if method == "HEAD":
+                        return 200 <= status < 300
+
+                    if spill_threshold is not None:
+                        return data
+
+                    if data:
+                        if timings is not None:
+                            timings._mark = time.perf_counter_ns()
+                        data = self.deserializer.loads(
+                            data, headers_response.get("content-type")
+                        )
+                        if timings is not None:
+                            timings.deserialize = time.perf_counter_ns() - timings._mark
+                            if isinstance(data, dict):
+                                timings.took = data.get("took")
+                    return data
+            finally:
+                if timings is not None:
+                    current_timings.reset(token)
+                    self._report_timings(timings)
+
+    def _report_timings(self, timings: RequestTimings) -> None:
+        timings.finish()
+        self.timings_callback(timings)  # type: ignore
+
+    @contextmanager
+    def streaming(self, spill_threshold: int = DEFAULT_SPILL_THRESHOLD) -> Any:
+        """
+        Within this block, requests made from the current thread or task
+        return a :class:`~opensearchpy.connection.streaming.StreamingResponse`
+        instead of the deserialized body, so the hits of a search or scroll
+        can be consumed while the response is still downloading::
+
+            with client.transport.streaming():
+                resp = client.search(index="photos", body=query, size=10000)
+            with resp:
+                for hit in resp.hits():
+                    ...
+
+        Response envelopes larger than ``spill_threshold`` bytes are kept in
+        a memory-mapped temporary file. Needs a connection class that
+        implements ``perform_streaming_request``.
+        """
+        token = _streaming.set(spill_threshold)
+        try:
+            yield
+        finally:
+            _streaming.reset(token)
 
-                if method == "HEAD":
-                    return 200 <= status < 300
+    @contextmanager
+    def affinity(self, key: Any) -> Any:
+        """
+        Within this block, requests made from the current thread or task
+        carry ``key`` to the connection selector. With
+        :class:`~opensearchpy.ConsistentHashSelector` all requests with the
+        same key go to the same node while it is alive::
 
-                if data:
-                    data = self.deserializer.loads(
-                        data, headers_response.get("content-type")
-                    )
-                return data
+            with client.transport.affinity(query):
+                resp = client.search(index="photos", body=query)
+        """
+        token = affinity_key.set(key)
+        try:
+            yield
+        finally:
+            affinity_key.reset(token)
 
     def close(self) -> Any:
         """
@@ -485,7 +723,12 @@ class Transport:
     ) -> Any:
         """Resolves parameters for .perform_request()"""
         if body is not None:
-            body = self.serializer.dumps(body)
+            # serializers that can produce bytes directly skip the str round-trip
+            dumps_bytes = getattr(self.serializer, "dumps_bytes", None)
+            if dumps_bytes is not None:
+                body = dumps_bytes(body)
+            else:
+                body = self.serializer.dumps(body)
 
             # some clients or environments don't support sending GET with body
             if method in ("HEAD", "GET") and self.send_get_body_as != "GET":
@@ -497,6 +740,8 @@ class Transport:
                 elif self.send_get_body_as == "source":
                     if params is None:
                         params = {}
+                    if isinstance(body, bytes):
+                        body = body.decode("utf-8", "surrogatepass")
                     params["source"] = body
                     body = None
 
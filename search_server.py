@@ -0,0 +1,303 @@
+"""
+Standalone HTTP server for search-photos, for running outside Lambda.
+
+Serves the same GET /search?q=... contract as lf2.main: each request is
+translated into an API Gateway proxy event and handed to lf2.main, so the
+search logic is shared. N worker processes are pre-forked and each binds its
+own SO_REUSEPORT socket, letting the kernel spread connections across them.
+Inside a worker an asyncio loop owns the sockets and a thread pool runs the
+handler, so hundreds of searches are in flight over lf2's pooled connections.
+
+    python search_server.py --port 8080 --workers 4 --threads 128
+"""
+import argparse
+import asyncio
+import http
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import lf2
+
+logger = logging.getLogger(__name__)
+
+KEEPALIVE_TIMEOUT = 15  # seconds an idle client connection is kept open
+MAX_BODY_BYTES = 1024 * 1024
+# A worker that dies within FAST_FAILURE_SECONDS of starting is restarted after an
+# exponentially growing delay; after MAX_FAST_FAILURES in a row the server gives up.
+FAST_FAILURE_SECONDS = 10
+MAX_FAST_FAILURES = 5
+RESTART_DELAY = 0.5
+MAX_RESTART_DELAY = 30
+
+# Same answer the MOCK integration behind API Gateway gives for OPTIONS /search
+_PREFLIGHT_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET,OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,If-None-Match",
+}
+
+
+def _bind(host: str, port: int, reuse_port: bool) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.setblocking(False)
+    return sock
+
+
+def _build_event(method: str, target: str, headers: dict, body: bytes) -> dict:
+    """
+    Translate a raw HTTP request into the API Gateway proxy event lf2.main expects.
+    """
+    split = urllib.parse.urlsplit(target)
+    multi = urllib.parse.parse_qs(split.query, keep_blank_values=True)
+    return {
+        "httpMethod": method,
+        "path": split.path,
+        "headers": headers,
+        "queryStringParameters": {k: v[-1] for k, v in multi.items()} or None,
+        "multiValueQueryStringParameters": multi or None,
+        "body": body.decode("utf-8", errors="replace") if body else None,
+        "isBase64Encoded": False,
+    }
+
+
+def _encode_response(status: int, headers: dict, body: str, keep_alive: bool) -> bytes:
+    try:
+        reason = http.HTTPStatus(status).phrase
+    except ValueError:
+        reason = ""
+    lines = [f"HTTP/1.1 {status} {reason}"]
+    lines.extend(f"{k}: {v}" for k, v in headers.items())
+    payload = b""
+    # 1xx, 204 and 304 responses never carry a body
+    if status >= 200 and status not in (204, 304):
+        payload = body.encode("utf-8")
+        lines.append(f"Content-Length: {len(payload)}")
+    lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload
+
+
+class SearchServer:
+    """
+    One worker's asyncio HTTP/1.1 front end for lf2.main.
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor):
+        self.executor = executor
+
+    async def dispatch(self, method: str, target: str, headers: dict, body: bytes) -> dict:
+        path = urllib.parse.urlsplit(target).path
+        if path == "/health":
+            return {"statusCode": 200, "headers": {"Content-Type": "text/plain"}, "body": "ok"}
+        if path != "/search":
+            return {"statusCode": 404, "headers": {"Content-Type": "text/plain"}, "body": "Not Found"}
+        if method == "OPTIONS":
+            return {"statusCode": 200, "headers": _PREFLIGHT_HEADERS, "body": ""}
+        if method != "GET":
+            return {"statusCode": 405, "headers": {"Allow": "GET,OPTIONS"}, "body": ""}
+
+        event = _build_event(method, target, headers, body)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, lf2.main, event, None)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEPALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    return
+                except asyncio.LimitOverrunError:
+                    writer.write(_encode_response(431, {}, "", keep_alive=False))
+                    await writer.drain()
+                    return
+
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = request_line.split(" ", 2)
+                except ValueError:
+                    writer.write(_encode_response(400, {}, "", keep_alive=False))
+                    await writer.drain()
+                    return
+
+                headers = {}
+                for line in header_lines:
+                    if line:
+                        name, _, value = line.partition(":")
+                        headers[name.strip()] = value.strip()
+                lowered = {k.lower(): v for k, v in headers.items()}
+
+                connection = lowered.get("connection", "").lower()
+                if version == "HTTP/1.0":
+                    keep_alive = connection == "keep-alive"
+                else:
+                    keep_alive = connection != "close"
+
+                if "transfer-encoding" in lowered:
+                    writer.write(_encode_response(411, {}, "", keep_alive=False))
+                    await writer.drain()
+                    return
+                try:
+                    length = int(lowered.get("content-length") or 0)
+                except ValueError:
+                    writer.write(_encode_response(400, {}, "", keep_alive=False))
+                    await writer.drain()
+                    return
+                if length > MAX_BODY_BYTES:
+                    writer.write(_encode_response(413, {}, "", keep_alive=False))
+                    await writer.drain()
+                    return
+                body = await reader.readexactly(length) if length else b""
+
+                try:
+                    result = await self.dispatch(method, target, headers, body)
+                except Exception:
+                    logger.exception("Unhandled error serving %s %s", method, target)
+                    result = {"statusCode": 500, "headers": {}, "body": ""}
+
+                writer.write(
+                    _encode_response(
+                        result["statusCode"], result.get("headers") or {}, result.get("body") or "", keep_alive
+                    )
+                )
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return
+        finally:
+            writer.close()
+
+
+async def _serve(sock: socket.socket, threads: int) -> None:
+    executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="search")
+    server = SearchServer(executor)
+    listener = await asyncio.start_server(server.handle, sock=sock, backlog=1024)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+
+    logger.info("Worker %s listening on %s", os.getpid(), sock.getsockname())
+    async with listener:
+        await stop.wait()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_worker(host: str, port: int, threads: int, reuse_port: bool) -> None:
+    # Every thread shares one keep-alive pool; size it so no connection is dropped at peak
+    lf2.opensearch_pool.maxsize = threads
+    sock = _bind(host, port, reuse_port)
+    asyncio.run(_serve(sock, threads))
+
+
+def _spawn(host: str, port: int, threads: int) -> int:
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            _run_worker(host, port, threads, reuse_port=True)
+        except Exception:
+            logger.exception("Worker %s crashed", os.getpid())
+            code = 1
+        finally:
+            # os._exit skips atexit, and SIGTERM no longer reaches lf2's handler,
+            # so flush the worker's buffered query counts here
+            try:
+                lf2._popularity.flush()
+            except Exception:
+                logger.exception("Worker %s failed to flush query counts", os.getpid())
+            logging.shutdown()
+            os._exit(code)
+    return pid
+
+
+def serve(host: str, port: int, workers: int, threads: int) -> None:
+    """
+    Run `workers` pre-forked processes until SIGTERM/SIGINT, restarting any that crash.
+    Workers that keep crashing right after starting are restarted with backoff, and
+    the server exits once MAX_FAST_FAILURES of them crashed in a row.
+    """
+    if workers <= 1:
+        _run_worker(host, port, threads, reuse_port=False)
+        return
+    if not hasattr(socket, "SO_REUSEPORT"):
+        raise SystemExit("Multiple workers need SO_REUSEPORT, which this platform lacks")
+
+    # pid -> when it was started
+    children = {_spawn(host, port, threads): time.monotonic() for _ in range(workers)}
+    stopping = False
+    fast_failures = 0
+    exit_code = 0
+
+    def _stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        started = children.pop(pid, None)
+        if stopping or started is None:
+            continue
+
+        if time.monotonic() - started < FAST_FAILURE_SECONDS:
+            fast_failures += 1
+        else:
+            fast_failures = 0
+        if fast_failures > MAX_FAST_FAILURES:
+            logger.error("Workers keep crashing on startup, giving up")
+            exit_code = 1
+            _stop(None, None)
+            continue
+
+        delay = min(RESTART_DELAY * 2 ** (fast_failures - 1), MAX_RESTART_DELAY) if fast_failures else 0
+        logger.error("Worker %s exited with status %s, restarting in %.1fs", pid, status, delay)
+        time.sleep(delay)
+        if not stopping:
+            children[_spawn(host, port, threads)] = time.monotonic()
+
+    if exit_code:
+        raise SystemExit(exit_code)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve GET /search outside Lambda")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--threads", type=int, default=128, help="concurrent searches per worker")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        stream=sys.stdout,
+        level=logging.INFO,
+        format="%(asctime)s %(process)d %(levelname)s %(message)s",
+    )
+    serve(args.host, args.port, args.workers, args.threads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), os.pardir, "opensearch-layer", "python")
+)
+
+from opensearchpy.caching import CachingTransport  # noqa: E402
+from opensearchpy.connection import Connection  # noqa: E402
+
+
+class StubConnection(Connection):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = []
+
+    def perform_request(self, method, url, params=None, body=None, timeout=None, ignore=(), headers=None):
+        self.calls.append((method, url))
+        return 200, {"content-type": "application/json"}, '{"result":"ok"}'
+
+
+@pytest.fixture
+def transport():
+    return CachingTransport([{}], connection_class=StubConnection)
+
+
+def _calls(transport):
+    return transport.get_connection().calls
+
+
+@pytest.mark.parametrize("method", ["POST", "PUT"])
+def test_document_writes_always_reach_the_node(transport, method):
+    for _ in range(2):
+        transport.perform_request(method, "/photos/_doc/1", body={"a": 1})
+    assert _calls(transport) == [(method, "/photos/_doc/1")] * 2
+    assert transport.stats()["hits"] == 0
+
+
+def test_document_write_invalidates_cached_get(transport):
+    transport.perform_request("GET", "/photos/_doc/1")
+    transport.perform_request("GET", "/photos/_doc/1")
+    assert transport.stats()["hits"] == 1
+
+    transport.perform_request("POST", "/photos/_doc/1", body={"a": 2})
+    transport.perform_request("GET", "/photos/_doc/1")
+    assert [m for m, _ in _calls(transport)] == ["GET", "POST", "GET"]
+
+
+def test_search_is_cached(transport):
+    for _ in range(2):
+        transport.perform_request("POST", "/photos/_search", body={"query": {"match_all": {}}})
+    assert len(_calls(transport)) == 1